@@ -5,9 +5,10 @@ Simple file-based caching for downloaded PDFs
 import os
 import hashlib
 import tempfile
+import time
 from pathlib import Path
 from typing import Optional
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 
 class PDFCache:
@@ -35,10 +36,13 @@ class PDFCache:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.max_age = timedelta(hours=max_age_hours)
+        # Plain float for comparing against file mtimes
+        self._max_age_seconds = max_age_hours * 3600.0
 
     def _get_cache_key(self, url: str) -> str:
         """Generate cache key from URL"""
-        return hashlib.md5(url.encode()).hexdigest()
+        # Short non-cryptographic key, it only names a local file
+        return hashlib.blake2b(url.encode("utf-8"), digest_size=8).hexdigest()
 
     def _get_cache_path(self, cache_key: str) -> Path:
         """Get full path for cache file"""
@@ -57,13 +61,15 @@ class PDFCache:
         cache_key = self._get_cache_key(url)
         cache_path = self._get_cache_path(cache_key)
 
-        if not cache_path.exists():
+        # One stat answers both "does it exist" and "how old is it"
+        try:
+            mtime = os.stat(cache_path).st_mtime
+        except FileNotFoundError:
             return None
 
         # Check if file is too old
-        file_time = datetime.fromtimestamp(cache_path.stat().st_mtime)
-        if datetime.now() - file_time > self.max_age:
-            cache_path.unlink()  # Remove expired file
+        if time.time() - mtime > self._max_age_seconds:
+            cache_path.unlink(missing_ok=True)  # Remove expired file
             return None
 
         return str(cache_path)
@@ -91,8 +97,10 @@ class PDFCache:
 
     def clear(self) -> None:
         """Clear all cached files"""
-        for cache_file in self.cache_dir.glob("*.pdf"):
-            cache_file.unlink()
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".pdf"):
+                    os.unlink(entry.path)
 
     def cleanup_expired(self) -> int:
         """
@@ -102,12 +110,16 @@ class PDFCache:
             Number of files removed
         """
         removed = 0
-        now = datetime.now()
-
-        for cache_file in self.cache_dir.glob("*.pdf"):
-            file_time = datetime.fromtimestamp(cache_file.stat().st_mtime)
-            if now - file_time > self.max_age:
-                cache_file.unlink()
-                removed += 1
+        cutoff = time.time() - self._max_age_seconds
+
+        # DirEntry.stat() reuses data from the directory listing where possible
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if (
+                    entry.name.endswith(".pdf")
+                    and entry.stat(follow_symlinks=False).st_mtime < cutoff
+                ):
+                    os.unlink(entry.path)
+                    removed += 1
 
         return removed
@@ -10,10 +10,19 @@ import time
 import json
 import logging
 import importlib.metadata
-from typing import Optional
+from typing import Any, Dict, Optional
 
-from .downloader import download_pdf_with_backoff, generate_pdf_url
-from .llm import process_with_openrouter_backoff
+from .downloader import (
+    download_pdf_with_backoff,
+    generate_pdf_url,
+    close_session as close_download_session,
+)
+from . import jsonutil
+from .llm import (
+    process_with_openrouter_backoff,
+    close_session,
+    configure_response_cache,
+)
 from .utils import validate_date
 from .config import RubotConfig
 from .models import RathausUmschauAnalysis
@@ -126,6 +135,7 @@ def main(
         date = _prepare_date(date)
         prompt, model = _validate_prompt_and_model(prompt, model, app_config)
         cache = _setup_cache(no_cache, cache_dir, app_config, logger)
+        _setup_response_cache(no_cache, cache_root, app_config, logger)
 
         _log_processing_info(date, model, temperature, max_tokens, logger)
         _log_cache_cleanup_info(cache_cleanup_days, skip_cleanup, logger)
@@ -154,6 +164,9 @@ def main(
 
     except Exception as e:
         _handle_error(e, logger)
+    finally:
+        close_download_session()
+        close_session()
 
 
 def _load_and_validate_config(
@@ -237,6 +250,22 @@ def _setup_cache(
     return cache
 
 
+def _setup_response_cache(
+    no_cache: bool,
+    cache_root: str,
+    app_config: RubotConfig,
+    logger: logging.Logger,
+) -> None:
+    """Keep LLM responses under the cache root so reruns skip the API call."""
+    if no_cache or not app_config.cache_enabled:
+        configure_response_cache(None)
+        return
+
+    response_cache_dir = os.path.join(cache_root, "responses")
+    configure_response_cache(response_cache_dir, app_config.cache_max_age_hours)
+    logger.info(f"LLM response cache enabled: {response_cache_dir}")
+
+
 def _log_processing_info(
     date: str,
     model: str,
@@ -291,7 +320,8 @@ def _download_pdf_with_cache(
                 date, 
                 app_config.request_timeout, 
                 max_retries=app_config.pdf_download_max_retries,
-                base_delay=600  # 10 minutes
+                base_delay=600,  # 10 minutes
+                jitter=app_config.pdf_download_jitter,
             )
         else:
             # Use short retries (30s, 1min, 2min, 4min)
@@ -299,7 +329,8 @@ def _download_pdf_with_cache(
                 date, 
                 app_config.request_timeout,
                 max_retries=app_config.pdf_download_max_retries,
-                base_delay=app_config.pdf_download_base_delay
+                base_delay=app_config.pdf_download_base_delay,
+                jitter=app_config.pdf_download_jitter,
             )
         
         if downloaded_path is None:
@@ -329,7 +360,7 @@ def _convert_to_markdown(
     logger: logging.Logger,
 ) -> str:
     """Convert PDF to markdown using Docling with caching."""
-    from .docling_converter import DoclingPDFConverter, DoclingConfig
+    from .docling_converter import DoclingConfig, get_converter
     import hashlib
     import os
 
@@ -343,15 +374,13 @@ def _convert_to_markdown(
     markdown_cache_dir = os.path.join(cache_root, "markdown")
     os.makedirs(markdown_cache_dir, exist_ok=True)
 
-    # Generate cache key from PDF file (streaming hash)
-    hasher = hashlib.sha256()
+    # Generate cache key from PDF file (streaming hash). Entries written
+    # under the former SHA-256 names are no longer read and age out through
+    # _cleanup_old_cache_files.
     with open(pdf_path, "rb") as f:
-        while True:
-            chunk = f.read(8192)
-            if not chunk:
-                break
-            hasher.update(chunk)
-    content_hash = hasher.hexdigest()
+        content_hash = hashlib.file_digest(
+            f, lambda: hashlib.blake2b(digest_size=16)
+        ).hexdigest()
 
     cache_key = f"{content_hash}_docling.md"
     cache_file = os.path.join(markdown_cache_dir, cache_key)
@@ -393,8 +422,8 @@ def _convert_to_markdown(
         max_image_size=app_config.docling_max_image_size,
     )
 
-    # Convert with Docling
-    converter = DoclingPDFConverter(docling_config)
+    # Convert with Docling, reusing the loaded models from earlier runs
+    converter = get_converter(docling_config)
     markdown_content = converter.convert_to_markdown(pdf_path)
 
     # Cache the markdown
@@ -431,10 +460,10 @@ def _process_with_llm(
     max_tokens: int,
     logger: logging.Logger,
     app_config: RubotConfig,
-) -> str:
+) -> Dict[str, Any]:
     """Process content with LLM."""
     logger.info(f"Processing with LLM ({model})...")
-    result = process_with_openrouter_backoff(
+    return process_with_openrouter_backoff(
         markdown_content,
         prompt,
         model,
@@ -444,58 +473,54 @@ def _process_with_llm(
         app_config.openrouter_timeout,
         app_config.fallback_model,  # Pass fallback model from config
     )
-    return str(result)
 
 
 def _handle_output(
-    llm_response: str,
+    llm_response: Dict[str, Any],
     output: Optional[str],
     logger: logging.Logger,
     date: str,
     model: str,
 ) -> None:
     """Handle LLM response output and parsing."""
-    try:
-        openrouter_response = json.loads(llm_response)
-
-        if "choices" in openrouter_response and openrouter_response["choices"]:
-            actual_content = openrouter_response["choices"][0]["message"][
-                "content"
-            ]
-
-            try:
-                json_content = _extract_json_from_content(actual_content)
-                if json_content:
-                    content_json = json.loads(json_content)
-                    openrouter_response["choices"][0]["message"][
-                        "content"
-                    ] = content_json
-
-                formatted_response = json.dumps(
-                    openrouter_response, indent=2, ensure_ascii=False
-                )
-                _write_output(
-                    formatted_response,
-                    output,
-                    "Complete response with parsed JSON",
-                    logger,
-                )
-
-            except json.JSONDecodeError:
-                logger.info(
-                    "LLM content is not valid JSON, keeping as text in response"
-                )
-                _write_output(
-                    llm_response, output, "Original response", logger
-                )
+    choices = llm_response.get("choices")
+    if choices:
+        actual_content = choices[0]["message"]["content"]
+
+        json_content = _extract_json_from_content(actual_content)
+        if json_content:
+            # Embed the parsed content without mutating llm_response
+            message = {
+                **choices[0]["message"],
+                "content": json.loads(json_content),
+            }
+            formatted = {
+                **llm_response,
+                "choices": [{**choices[0], "message": message}, *choices[1:]],
+            }
+            _write_output(
+                jsonutil.dumps(formatted, indent=True),
+                output,
+                "Complete response with parsed JSON",
+                logger,
+            )
         else:
-            _write_output(llm_response, output, "Raw response", logger)
-
-    except json.JSONDecodeError:
-        logger.warning(
-            "Could not parse OpenRouter response, outputting raw response"
+            logger.info(
+                "LLM content is not valid JSON, keeping as text in response"
+            )
+            _write_output(
+                jsonutil.dumps(llm_response, indent=True),
+                output,
+                "Original response",
+                logger,
+            )
+    else:
+        _write_output(
+            jsonutil.dumps(llm_response, indent=True),
+            output,
+            "Raw response",
+            logger,
         )
-        _write_output(llm_response, output, "Raw response", logger)
 
     if logger.level <= logging.DEBUG:
         _log_analysis_summary(llm_response, date, model, logger)
@@ -618,7 +643,10 @@ def _log_cache_cleanup_info(
 
 
 def _log_analysis_summary(
-    llm_response: str, date: str, model: str, logger: logging.Logger
+    llm_response: Dict[str, Any],
+    date: str,
+    model: str,
+    logger: logging.Logger,
 ) -> None:
     """Log analysis summary if possible."""
     try:
@@ -687,6 +715,13 @@ def _cleanup_old_cache_files(
         downloads_cache_dir, cutoff_time, logger, "Downloads"
     )
 
+    # Clean up LLM response cache, each day's PDF adds new entries that are
+    # never looked up again once the day has passed
+    responses_cache_dir = os.path.join(cache_root, "responses")
+    _cleanup_directory_by_age(
+        responses_cache_dir, cutoff_time, logger, "Response"
+    )
+
 
 def _cleanup_directory_by_age(
     directory: str, cutoff_time: float, logger: logging.Logger, name: str
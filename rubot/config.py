@@ -2,6 +2,8 @@
 Configuration management for rubot
 """
 
+import dataclasses
+import functools
 import os
 from pathlib import Path
 from typing import Dict, Any, Optional
@@ -34,6 +36,7 @@ class RubotConfig:
     pdf_download_max_retries: int = 4
     pdf_download_base_delay: int = 30  # seconds, for short retries (30s, 1min, 2min, 4min)
     use_long_pdf_retries: bool = False  # if True, uses 10min+ retries
+    pdf_download_jitter: bool = False  # randomize retry delays (full jitter)
 
     # Cache settings
     cache_enabled: bool = True
@@ -64,6 +67,9 @@ class RubotConfig:
         """
         Load configuration from environment variables.
 
+        The environment is read once per process, call cache_clear() to
+        pick up changes.
+
         Args:
             env_file: Path to .env file (optional)
 
@@ -73,6 +79,19 @@ class RubotConfig:
         Raises:
             ValueError: If required configuration is missing
         """
+        # Copy so callers cannot modify the cached config
+        return dataclasses.replace(RubotConfig._from_env_cached(env_file))
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Forget the configuration cached by from_env"""
+        RubotConfig._from_env_cached.cache_clear()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _from_env_cached(env_file: Optional[str]) -> "RubotConfig":
+        """Read the .env file and build the configuration"""
+        cls = RubotConfig
         if env_file and Path(env_file).exists():
             load_dotenv(env_file)
         elif Path(".env").exists():
@@ -105,6 +124,9 @@ class RubotConfig:
             pdf_download_max_retries=int(os.getenv("PDF_DOWNLOAD_MAX_RETRIES", "4")),
             pdf_download_base_delay=int(os.getenv("PDF_DOWNLOAD_BASE_DELAY", "30")),
             use_long_pdf_retries=os.getenv("USE_LONG_PDF_RETRIES", "false").lower() == "true",
+            pdf_download_jitter=(
+                os.getenv("PDF_DOWNLOAD_JITTER", "false").lower() == "true"
+            ),
             cache_enabled=os.getenv("CACHE_ENABLED", "true").lower() == "true",
             cache_max_age_hours=int(os.getenv("CACHE_MAX_AGE_HOURS", "24")),
             max_pdf_pages=int(os.getenv("MAX_PDF_PAGES", "100")),
@@ -151,6 +173,7 @@ class RubotConfig:
             "pdf_download_max_retries": self.pdf_download_max_retries,
             "pdf_download_base_delay": self.pdf_download_base_delay,
             "use_long_pdf_retries": self.use_long_pdf_retries,
+            "pdf_download_jitter": self.pdf_download_jitter,
             "cache_enabled": self.cache_enabled,
             "cache_max_age_hours": self.cache_max_age_hours,
             "max_pdf_pages": self.max_pdf_pages,
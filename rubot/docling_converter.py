@@ -61,7 +61,7 @@ except ImportError:
     ImageRefMode = _MockImageRefMode  # type: ignore[assignment,misc]
 
 
-@dataclass
+@dataclass(frozen=True)
 class DoclingConfig:
     """Configuration for Docling converter"""
 
@@ -191,3 +191,26 @@ class DoclingPDFConverter:
             self.logger.info(f"  - Tables: {len(doc.tables)}")
         if hasattr(doc, "pictures"):
             self.logger.info(f"  - Images: {len(doc.pictures)}")
+
+
+# Converter reused across conversions in the same process, see get_converter
+_CONVERTER: Optional[DoclingPDFConverter] = None
+
+
+def get_converter(config: DoclingConfig) -> DoclingPDFConverter:
+    """
+    Get a converter for config, reusing the previous one if config is equal.
+
+    Creating a DoclingPDFConverter loads the Docling models, long-running
+    processes converting several PDFs only pay for that once.
+
+    Args:
+        config: Docling configuration
+
+    Returns:
+        DoclingPDFConverter for config
+    """
+    global _CONVERTER
+    if _CONVERTER is None or _CONVERTER.config != config:
+        _CONVERTER = DoclingPDFConverter(config)
+    return _CONVERTER
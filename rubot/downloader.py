@@ -2,30 +2,55 @@
 PDF downloader module for Rathaus-Umschau
 """
 
+import contextlib
 import requests
+from requests.adapters import HTTPAdapter
 import tempfile
 import os
 import logging
 import time
-from typing import Optional, cast
+from typing import Callable, Mapping, Optional, cast
+
+from .retry import exponential_backoff
+from .utils import validate_date
+
+_PDF_DOMAIN = "ru.muenchen.de"
+_PDF_BASE_URL = f"https://{_PDF_DOMAIN}/pdf"
+_ALLOWED_URL_PREFIXES = (f"https://{_PDF_DOMAIN}/",)
+
+# Shared session so retries and consecutive downloads reuse the TLS connection
+_SESSION = requests.Session()
+# Retries are handled by download_pdf_with_backoff, not urllib3
+_SESSION.mount(
+    "https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+)
+
+
+# Bytes read from the socket per write while streaming a PDF to disk
+_DOWNLOAD_CHUNK_SIZE = 1 << 16
+
+
+def close_session() -> None:
+    """Close pooled download connections"""
+    _SESSION.close()
 
 
 def validate_date_format(date: str) -> None:
     """Validate date format and ensure it's a valid date."""
-    import datetime
-
+    # validate_date checks the shape with a regex before building a datetime,
+    # strptime would parse the format string on every call
     try:
-        datetime.datetime.strptime(date, "%Y-%m-%d")
+        validate_date(date)
     except ValueError:
         raise ValueError(f"Invalid date format: {date}. Use YYYY-MM-DD")
 
 
 def validate_pdf_url(url: str) -> None:
     """Validate that the PDF URL is from the expected domain."""
-    expected_domain = "ru.muenchen.de"
-    if not url.startswith(f"https://{expected_domain}"):
+    # The trailing slash stops look-alike hosts such as ru.muenchen.de.example
+    if not url.startswith(_ALLOWED_URL_PREFIXES):
         raise ValueError(
-            f"Invalid PDF domain. Expected https://{expected_domain}"
+            f"Invalid PDF domain. Expected https://{_PDF_DOMAIN}"
         )
 
 
@@ -40,12 +65,40 @@ def generate_pdf_url(date: str) -> str:
         PDF URL string
     """
     validate_date_format(date)
-    year, month, day = date.split("-")
-    url = f"https://ru.muenchen.de/pdf/{year}/ru-{year}-{month}-{day}.pdf"
+    # The validated date is already in the YYYY-MM-DD form the file name uses
+    url = f"{_PDF_BASE_URL}/{date[:4]}/ru-{date}.pdf"
     validate_pdf_url(url)
     return url
 
 
+def _check_response_headers(headers: Mapping[str, str]) -> None:
+    """Warn about downloads that don't look like a regular PDF"""
+    logger = logging.getLogger(__name__)
+
+    # Validate content type
+    content_type = headers.get("content-type", "")
+    if "application/pdf" not in content_type.lower():
+        logger.warning(f"Unexpected content type: {content_type}")
+
+    # Validate content size
+    content_length = headers.get("content-length")
+    if content_length:
+        try:
+            size_mb = int(content_length) / (1024 * 1024)
+            if size_mb > 100:  # Warn for files > 100MB
+                logger.warning(f"Large PDF detected: {size_mb:.1f}MB")
+        except ValueError:
+            pass
+
+
+def _download_dir() -> str:
+    """Create and return the downloads directory in CACHE_ROOT"""
+    cache_root = os.getenv("CACHE_ROOT", tempfile.gettempdir())
+    cache_dir = os.path.join(cache_root, "downloads")
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+
 def download_pdf(date: str, timeout: int = 30) -> str:
     """
     Download PDF from Rathaus-Umschau website.
@@ -63,46 +116,43 @@ def download_pdf(date: str, timeout: int = 30) -> str:
     url = generate_pdf_url(date)
 
     try:
-        response = requests.get(url, timeout=timeout, verify=True)
-        response.raise_for_status()
-
-        # Validate content type
-        content_type = response.headers.get("content-type", "")
-        if "application/pdf" not in content_type.lower():
-            logger = logging.getLogger(__name__)
-            logger.warning(f"Unexpected content type: {content_type}")
-
-        # Validate content size
-        content_length = response.headers.get("content-length")
-        if content_length:
-            try:
-                size_mb = int(content_length) / (1024 * 1024)
-                if size_mb > 100:  # Warn for files > 100MB
-                    logger = logging.getLogger(__name__)
-                    logger.warning(f"Large PDF detected: {size_mb:.1f}MB")
-            except ValueError:
-                pass
-
-        # Create temporary file in CACHE_ROOT
-
-        cache_root = os.getenv("CACHE_ROOT", tempfile.gettempdir())
-        cache_dir = os.path.join(cache_root, "downloads")
-        os.makedirs(cache_dir, exist_ok=True)
-
-        # Write with streaming to handle large files
-        with tempfile.NamedTemporaryFile(
-            suffix=".pdf", delete=False, dir=cache_dir, mode="wb"
-        ) as tmp_file:
-            for chunk in response.iter_content(chunk_size=8192):
-                tmp_file.write(chunk)
-            return str(tmp_file.name)
-
-    except requests.exceptions.Timeout:
-        raise requests.RequestException(
+        # stream=True keeps the body out of memory until it is written, the
+        # connection returns to the pool when the response is closed
+        with contextlib.closing(
+            _SESSION.get(url, timeout=timeout, verify=True, stream=True)
+        ) as response:
+            response.raise_for_status()
+
+            _check_response_headers(response.headers)
+            cache_dir = _download_dir()
+
+            # Write with streaming to handle large files
+            with tempfile.NamedTemporaryFile(
+                suffix=".pdf", delete=False, dir=cache_dir, mode="wb"
+            ) as tmp_file:
+                try:
+                    for chunk in response.iter_content(
+                        chunk_size=_DOWNLOAD_CHUNK_SIZE
+                    ):
+                        tmp_file.write(chunk)
+                except BaseException:
+                    # Read errors surface while streaming, don't leave the
+                    # partial PDF behind in the downloads directory
+                    tmp_file.close()
+                    os.unlink(tmp_file.name)
+                    raise
+                return str(tmp_file.name)
+
+    # Transient failures keep their requests exception type (all subclasses of
+    # RequestException) so download_pdf_with_backoff can tell them apart
+    except requests.exceptions.Timeout as e:
+        raise requests.exceptions.Timeout(
             f"Download timed out after {timeout}s for {url}"
-        )
-    except requests.exceptions.ConnectionError:
-        raise requests.RequestException(f"Connection failed to {url}")
+        ) from e
+    except requests.exceptions.ConnectionError as e:
+        raise requests.exceptions.ConnectionError(
+            f"Connection failed to {url}"
+        ) from e
     except requests.exceptions.HTTPError as e:
         if hasattr(e, "response") and e.response is not None:
             status_code = e.response.status_code
@@ -117,11 +167,19 @@ def download_pdf(date: str, timeout: int = 30) -> str:
         elif status_code == 403:
             raise requests.RequestException(f"Access forbidden to {url}")
         elif status_code >= 500:
-            raise requests.RequestException(
-                f"Server error ({status_code}) at {url}"
-            )
+            raise requests.exceptions.HTTPError(
+                f"Server error ({status_code}) at {url}", response=e.response
+            ) from e
+        elif status_code == 429:
+            raise requests.exceptions.HTTPError(
+                f"Rate limited (429) at {url}", response=e.response
+            ) from e
         else:
             raise requests.RequestException(f"HTTP {status_code} at {url}")
+    except requests.exceptions.ChunkedEncodingError as e:
+        raise requests.exceptions.ChunkedEncodingError(
+            f"Download from {url} was interrupted: {e}"
+        ) from e
     except requests.exceptions.RequestException as e:
         raise requests.RequestException(
             f"Failed to download PDF from {url}: {e}"
@@ -130,22 +188,65 @@ def download_pdf(date: str, timeout: int = 30) -> str:
         raise OSError(f"Failed to write PDF file: {e}")
 
 
+def _is_transient_error(error: Exception) -> bool:
+    """
+    Check whether a download error is worth retrying.
+
+    Args:
+        error: Exception raised by download_pdf
+
+    Returns:
+        True for connection problems, timeouts, interrupted transfers,
+        rate limiting and server errors
+    """
+    if isinstance(error, requests.exceptions.HTTPError):
+        response = error.response
+        # download_pdf only raises HTTPError for 429 and 5xx, a missing
+        # response is treated like a server error as well
+        return (
+            response is None
+            or response.status_code == 429
+            or response.status_code >= 500
+        )
+    return isinstance(
+        error,
+        (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+            requests.exceptions.ChunkedEncodingError,
+        ),
+    )
+
+
 def download_pdf_with_backoff(
-    date: str, timeout: int = 30, max_retries: int = 4, base_delay: int = 30
+    date: str,
+    timeout: int = 30,
+    max_retries: int = 4,
+    base_delay: int = 30,
+    sleeper: Optional[Callable[[float], None]] = None,
+    jitter: bool = False,
 ) -> Optional[str]:
     """
     Download PDF with exponential backoff retry mechanism.
 
+    A missing PDF (404) and transient network or server errors are retried,
+    other errors such as 403 fail immediately.
+
     Args:
         date: Date string in YYYY-MM-DD format
         timeout: Request timeout in seconds
         max_retries: Maximum number of retry attempts (default: 4)
         base_delay: Base delay in seconds for first retry (default: 30 seconds)
+        sleeper: Function called with the wait time in seconds between
+            retries (default: time.sleep)
+        jitter: Wait a random time up to the backoff delay, so scheduled
+            runs on several hosts do not retry in lockstep
 
     Returns:
         Path to downloaded PDF file or None if all attempts failed
     """
     logger = logging.getLogger(__name__)
+    sleep = time.sleep if sleeper is None else sleeper
 
     # Retry attempts with exponential backoff (including first attempt)
     for attempt in range(max_retries + 1):
@@ -159,26 +260,35 @@ def download_pdf_with_backoff(
                 logger.info(f"PDF not available on first attempt: {e}")
             else:
                 logger.info(f"PDF still not available on attempt #{attempt+1}: {e}")
-            
-            if attempt == max_retries:
-                logger.error("Maximum retries reached, PDF not available")
+        except (requests.RequestException, OSError) as e:
+            if not _is_transient_error(e):
+                logger.error(f"Error downloading PDF on attempt #{attempt+1}: {e}")
                 return None
-            
-            # Wait before next retry
-            wait_time = base_delay * (2 ** attempt)
-            logger.info(
-                f"Waiting {wait_time/60:.1f} minutes before retry #{attempt+2}..."
+            logger.warning(
+                f"Transient error downloading PDF on attempt #{attempt+1}: {e}"
             )
-            time.sleep(wait_time)
-            
-        except (requests.RequestException, OSError) as e:
-            logger.error(f"Error downloading PDF on attempt #{attempt+1}: {e}")
+
+        if attempt == max_retries:
+            logger.error("Maximum retries reached, PDF not available")
             return None
 
+        # Wait before next retry
+        wait_time = exponential_backoff(
+            attempt, base_delay, max_delay=float("inf"), jitter=jitter
+        )
+        logger.info(
+            f"Waiting {wait_time/60:.1f} minutes before retry #{attempt+2}..."
+        )
+        sleep(wait_time)
+
     return None
 
 
-def download_pdf_with_short_retries(date: str, timeout: int = 30) -> Optional[str]:
+def download_pdf_with_short_retries(
+    date: str,
+    timeout: int = 30,
+    sleeper: Optional[Callable[[float], None]] = None,
+) -> Optional[str]:
     """
     Download PDF with shorter retry intervals suitable for automated/scheduled runs.
     
@@ -188,6 +298,8 @@ def download_pdf_with_short_retries(date: str, timeout: int = 30) -> Optional[st
     Args:
         date: Date string in YYYY-MM-DD format
         timeout: Request timeout in seconds
+        sleeper: Function called with the wait time in seconds between
+            retries (default: time.sleep)
 
     Returns:
         Path to downloaded PDF file or None if all attempts failed
@@ -196,5 +308,6 @@ def download_pdf_with_short_retries(date: str, timeout: int = 30) -> Optional[st
         date=date, 
         timeout=timeout, 
         max_retries=4, 
-        base_delay=30  # 30 seconds base delay: 30s, 1min, 2min, 4min
+        base_delay=30,  # 30 seconds base delay: 30s, 1min, 2min, 4min
+        sleeper=sleeper,
     )
@@ -0,0 +1,282 @@
+"""
+Concurrent PDF downloads for date ranges using httpx.AsyncClient
+"""
+
+import asyncio
+import logging
+import os
+import tempfile
+from typing import List, Optional, Sequence
+
+import requests
+
+from .downloader import (
+    _DOWNLOAD_CHUNK_SIZE,
+    _check_response_headers,
+    _download_dir,
+    _is_transient_error,
+    generate_pdf_url,
+    validate_date_format,
+)
+from .llm_async import _to_requests_response
+from .retry import exponential_backoff
+
+try:
+    import httpx
+
+    _HTTPX_AVAILABLE = True
+except ImportError:
+    _HTTPX_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# ru.muenchen.de is a single municipal host, keep the load on it modest
+DEFAULT_MAX_DOWNLOADS = 5
+
+
+def _require_httpx() -> None:
+    """Raise a helpful error if httpx is not installed"""
+    if not _HTTPX_AVAILABLE:
+        raise ImportError(
+            "httpx is required for concurrent PDF downloads. "
+            "Install it with: pip install 'rubot[async]'"
+        )
+
+
+def create_download_client(max_concurrency: int) -> "httpx.AsyncClient":
+    """
+    Create an httpx.AsyncClient sized for the given concurrency.
+
+    Args:
+        max_concurrency: Maximum number of simultaneous connections
+
+    Returns:
+        Configured httpx.AsyncClient
+
+    Raises:
+        ImportError: If httpx is not installed
+    """
+    _require_httpx()
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=max_concurrency,
+            max_keepalive_connections=max_concurrency,
+            keepalive_expiry=30,
+        ),
+    )
+
+
+async def adownload_pdf(
+    client: "httpx.AsyncClient", date: str, timeout: int = 30
+) -> str:
+    """
+    Download PDF from Rathaus-Umschau website asynchronously.
+
+    Errors are raised as the same exception types as download_pdf so
+    callers can share retry handling.
+
+    Args:
+        client: httpx.AsyncClient to send the request with
+        date: Date string in YYYY-MM-DD format
+        timeout: Request timeout in seconds
+
+    Returns:
+        Path to downloaded PDF file
+
+    Raises:
+        requests.RequestException: If download fails
+        FileNotFoundError: If PDF not found for given date
+        ImportError: If httpx is not installed
+    """
+    _require_httpx()
+    url = generate_pdf_url(date)
+
+    try:
+        async with client.stream("GET", url, timeout=timeout) as response:
+            response.raise_for_status()
+
+            _check_response_headers(response.headers)
+
+            with tempfile.NamedTemporaryFile(
+                suffix=".pdf", delete=False, dir=_download_dir(), mode="wb"
+            ) as tmp_file:
+                try:
+                    async for chunk in response.aiter_bytes(_DOWNLOAD_CHUNK_SIZE):
+                        tmp_file.write(chunk)
+                except BaseException:
+                    # Don't leave the partial PDF behind, retries would
+                    # otherwise add one per failed attempt
+                    tmp_file.close()
+                    os.unlink(tmp_file.name)
+                    raise
+                return str(tmp_file.name)
+
+    except httpx.TimeoutException as e:
+        raise requests.exceptions.Timeout(
+            f"Download timed out after {timeout}s for {url}"
+        ) from e
+    except httpx.TransportError as e:
+        raise requests.exceptions.ConnectionError(f"Connection failed to {url}") from e
+    except httpx.HTTPStatusError as e:
+        status_code = e.response.status_code
+        if status_code == 404:
+            raise FileNotFoundError(f"PDF not found for date {date}. URL: {url}")
+        elif status_code == 403:
+            raise requests.RequestException(f"Access forbidden to {url}")
+        elif status_code >= 500 or status_code == 429:
+            # Keep the status so _is_transient_error can read it
+            raise requests.exceptions.HTTPError(
+                f"HTTP {status_code} at {url}",
+                response=_to_requests_response(e.response),
+            ) from e
+        else:
+            raise requests.RequestException(f"HTTP {status_code} at {url}")
+    except httpx.HTTPError as e:
+        raise requests.RequestException(f"Failed to download PDF from {url}: {e}")
+    except OSError as e:
+        raise OSError(f"Failed to write PDF file: {e}")
+
+
+async def adownload_pdf_with_backoff(
+    client: "httpx.AsyncClient",
+    semaphore: asyncio.Semaphore,
+    date: str,
+    timeout: int = 30,
+    max_retries: int = 4,
+    base_delay: int = 30,
+    jitter: bool = False,
+) -> Optional[str]:
+    """
+    Download PDF asynchronously with exponential backoff retry mechanism.
+
+    Async counterpart of download_pdf_with_backoff with the same retry
+    policy. The semaphore is only held during a download attempt, so other
+    dates keep downloading while this one waits for its next retry.
+
+    Args:
+        client: httpx.AsyncClient to send the requests with
+        semaphore: Limits the number of downloads in flight
+        date: Date string in YYYY-MM-DD format
+        timeout: Request timeout in seconds
+        max_retries: Maximum number of retry attempts (default: 4)
+        base_delay: Base delay in seconds for first retry (default: 30 seconds)
+        jitter: Wait a random time up to the backoff delay
+
+    Returns:
+        Path to downloaded PDF file or None if all attempts failed
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            async with semaphore:
+                return await adownload_pdf(client, date, timeout)
+        except FileNotFoundError as e:
+            logger.info(f"PDF not available on attempt #{attempt+1}: {e}")
+        except (requests.RequestException, OSError) as e:
+            if not _is_transient_error(e):
+                logger.error(f"Error downloading PDF on attempt #{attempt+1}: {e}")
+                return None
+            logger.warning(
+                f"Transient error downloading PDF on attempt #{attempt+1}: {e}"
+            )
+
+        if attempt == max_retries:
+            logger.error(f"Maximum retries reached, PDF for {date} not available")
+            return None
+
+        wait_time = exponential_backoff(
+            attempt, base_delay, max_delay=float("inf"), jitter=jitter
+        )
+        logger.info(f"Waiting {wait_time/60:.1f} minutes before retrying {date}...")
+        await asyncio.sleep(wait_time)
+
+    return None
+
+
+async def download_many(
+    dates: Sequence[str],
+    timeout: int = 30,
+    max_retries: int = 4,
+    base_delay: int = 30,
+    max_concurrency: int = DEFAULT_MAX_DOWNLOADS,
+    jitter: bool = False,
+) -> List[Optional[str]]:
+    """
+    Download the PDFs for several dates concurrently.
+
+    Args:
+        dates: Date strings in YYYY-MM-DD format
+        timeout: Request timeout in seconds per download
+        max_retries: Maximum number of retry attempts per date
+        base_delay: Base delay in seconds for first retry
+        max_concurrency: Maximum downloads in flight (default: 5)
+        jitter: Wait a random time up to the backoff delay
+
+    Returns:
+        One entry per date in input order, the path to the downloaded PDF
+        or None if it could not be downloaded
+
+    Raises:
+        ImportError: If httpx is not installed
+        ValueError: If a date is malformed or max_concurrency is below 1
+    """
+    _require_httpx()
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    # Reject typos before any download starts
+    for date in dates:
+        validate_date_format(date)
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async with create_download_client(max_concurrency) as client:
+        results: List[Optional[str]] = await asyncio.gather(
+            *(
+                adownload_pdf_with_backoff(
+                    client,
+                    semaphore,
+                    date,
+                    timeout,
+                    max_retries,
+                    base_delay,
+                    jitter,
+                )
+                for date in dates
+            )
+        )
+
+    return results
+
+
+def download_pdfs(
+    dates: Sequence[str],
+    timeout: int = 30,
+    max_retries: int = 4,
+    base_delay: int = 30,
+    max_concurrency: int = DEFAULT_MAX_DOWNLOADS,
+    jitter: bool = False,
+) -> List[Optional[str]]:
+    """
+    Download the PDFs for several dates concurrently.
+
+    Synchronous entry point around download_many for scripts that fetch a
+    date range.
+
+    Args:
+        dates: Date strings in YYYY-MM-DD format
+        timeout: Request timeout in seconds per download
+        max_retries: Maximum number of retry attempts per date
+        base_delay: Base delay in seconds for first retry
+        max_concurrency: Maximum downloads in flight (default: 5)
+        jitter: Wait a random time up to the backoff delay
+
+    Returns:
+        One entry per date in input order, the path to the downloaded PDF
+        or None if it could not be downloaded
+
+    Raises:
+        ImportError: If httpx is not installed
+        ValueError: If a date is malformed or max_concurrency is below 1
+    """
+    return asyncio.run(
+        download_many(dates, timeout, max_retries, base_delay, max_concurrency, jitter)
+    )
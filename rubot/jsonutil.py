@@ -0,0 +1,78 @@
+"""
+JSON helpers that use orjson when it is installed
+"""
+
+import dataclasses
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+
+def _default(obj: Any) -> Any:
+    """Serialize dataclasses for the stdlib encoder, orjson does it natively"""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        # Shallow mapping, the encoder recurses into the field values itself
+        # instead of asdict() deep-copying every nested list first
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON text.
+
+    Args:
+        data: JSON document as str or UTF-8 bytes
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON
+    """
+    if _ORJSON_AVAILABLE:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize obj to JSON text, keeping non-ASCII characters as-is.
+
+    Args:
+        obj: JSON-serializable value or dataclass instance
+        indent: Indent with two spaces for human-readable output
+
+    Returns:
+        JSON document as str
+    """
+    if _ORJSON_AVAILABLE:
+        # orjson always emits UTF-8 and never escapes non-ASCII characters,
+        # so there is no ensure_ascii equivalent to pass
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return str(orjson.dumps(obj, option=option).decode("utf-8"))
+    return json.dumps(
+        obj, indent=2 if indent else None, ensure_ascii=False, default=_default
+    )
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    Serialize obj to compact UTF-8 encoded JSON, e.g. for request bodies.
+
+    Args:
+        obj: JSON-serializable value or dataclass instance
+
+    Returns:
+        JSON document as UTF-8 bytes
+    """
+    if _ORJSON_AVAILABLE:
+        return bytes(orjson.dumps(obj))
+    return json.dumps(obj, ensure_ascii=False, default=_default).encode("utf-8")
@@ -2,13 +2,95 @@
 OpenRouter API integration for LLM processing
 """
 
+import contextlib
 import requests
 import json
 import os
 import logging
+import ssl
+import threading
 import time
 from pathlib import Path
-from typing import Optional, Dict, Any, cast
+from typing import Callable, Optional, Dict, Any, Tuple, Union
+from requests.adapters import HTTPAdapter
+
+try:
+    import certifi
+
+    _CA_BUNDLE: Optional[str] = certifi.where()
+except ImportError:
+    _CA_BUNDLE = None
+
+from . import jsonutil
+from .response_cache import ResponseCache
+
+__all__ = [
+    "OPENROUTER_API_URL",
+    "close_session",
+    "configure_response_cache",
+    "load_prompt",
+    "process_with_openrouter",
+    "process_with_openrouter_legacy",
+    "process_with_openrouter_backoff",
+    "is_valid_openrouter_response",
+]
+
+logger = logging.getLogger(__name__)
+
+
+def _create_ssl_context() -> ssl.SSLContext:
+    """Create the TLS context shared by all OpenRouter connections"""
+    # Load the CA bundle once here instead of on every new connection
+    context = ssl.create_default_context(cafile=_CA_BUNDLE)
+    # Session tickets are on by default, keep it explicit so reconnects
+    # after long retry waits can offer session resumption
+    context.options &= ~ssl.OP_NO_TICKET
+    return context
+
+
+_SSL_CONTEXT = _create_ssl_context()
+
+
+class _TLSAdapter(HTTPAdapter):
+    """HTTPAdapter that reuses the module-level SSL context"""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs["ssl_context"] = _SSL_CONTEXT
+        super().init_poolmanager(*args, **kwargs)
+
+    def cert_verify(self, conn: Any, url: str, verify: Any, cert: Any) -> None:
+        # requests would point every connection at its CA bundle again,
+        # _SSL_CONTEXT already holds it and verifies hostnames
+        if verify is True:
+            return
+        super().cert_verify(conn, url, verify, cert)
+
+
+OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
+
+# Headers sent with every OpenRouter request, the API key is added per call
+_STATIC_HEADERS = {
+    "Content-Type": "application/json",
+    "HTTP-Referer": "https://github.com/rmoriz/rubot",
+    "X-Title": "rubot CLI Tool",
+}
+
+# Shared session so keep-alive connections survive between calls
+_SESSION = requests.Session()
+# Retries are handled by process_with_openrouter_backoff, not urllib3
+_SESSION.mount(
+    "https://", _TLSAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+)
+_SESSION.headers.update(_STATIC_HEADERS)
+
+
+def close_session() -> None:
+    """Close pooled OpenRouter connections"""
+    _SESSION.close()
+
+
+# Prompt file contents keyed on (path, mtime)
+_PROMPT_CACHE: Dict[Tuple[str, float], str] = {}
 
 
 def load_prompt(prompt_path: Optional[str]) -> str:
@@ -21,9 +103,22 @@ def load_prompt(prompt_path: Optional[str]) -> str:
     Returns:
         System prompt string
     """
-    if prompt_path and Path(prompt_path).exists():
-        with open(prompt_path, "r", encoding="utf-8") as f:
-            return f.read().strip()
+    if prompt_path:
+        path = Path(prompt_path)
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            mtime = None
+
+        if mtime is not None:
+            # Re-read only when the file changed since the last call
+            cache_key = (str(path), mtime)
+            prompt = _PROMPT_CACHE.get(cache_key)
+            if prompt is None:
+                with open(path, "r", encoding="utf-8") as f:
+                    prompt = f.read().strip()
+                _PROMPT_CACHE[cache_key] = prompt
+            return prompt
 
     # Fallback to environment variable
     env_prompt = os.getenv("DEFAULT_SYSTEM_PROMPT")
@@ -37,17 +132,99 @@ def load_prompt(prompt_path: Optional[str]) -> str:
     )
 
 
-def process_with_openrouter(
+# Model families that need an explicit cache_control marker for prompt caching
+_CACHE_CONTROL_MODEL_PREFIXES = ("anthropic/", "google/gemini")
+
+_RESPONSE_CACHE: Optional[ResponseCache] = None
+_RESPONSE_CACHE_ENABLED = True
+
+
+def configure_response_cache(
+    cache_dir: Optional[str], max_age_hours: int = 168
+) -> None:
+    """
+    Set where OpenRouter responses are cached, or disable the cache.
+
+    Args:
+        cache_dir: Directory for cached responses, None disables caching
+        max_age_hours: Maximum age of cached responses in hours
+    """
+    global _RESPONSE_CACHE, _RESPONSE_CACHE_ENABLED
+    _RESPONSE_CACHE_ENABLED = cache_dir is not None
+    _RESPONSE_CACHE = None
+    if cache_dir is not None:
+        try:
+            _RESPONSE_CACHE = ResponseCache(cache_dir, max_age_hours)
+        except OSError as e:
+            logger.warning(f"Response cache disabled, cannot use {cache_dir}: {e}")
+            _RESPONSE_CACHE_ENABLED = False
+
+
+def _get_response_cache() -> Optional[ResponseCache]:
+    """
+    Get the shared response cache.
+
+    Returns:
+        ResponseCache, or None if disabled with RUBOT_RESPONSE_CACHE=0 or
+        configure_response_cache(None)
+    """
+    global _RESPONSE_CACHE, _RESPONSE_CACHE_ENABLED
+    if (
+        not _RESPONSE_CACHE_ENABLED
+        or os.getenv("RUBOT_RESPONSE_CACHE", "1") == "0"
+    ):
+        return None
+    if _RESPONSE_CACHE is None:
+        try:
+            _RESPONSE_CACHE = ResponseCache()
+        except OSError as e:
+            # The cache is an optimization, an unwritable temp dir must not
+            # stop the API call. Disabled for the rest of the process.
+            logger.warning(f"Response cache disabled: {e}")
+            _RESPONSE_CACHE_ENABLED = False
+            return None
+    return _RESPONSE_CACHE
+
+
+def _system_message(system_prompt: str, model: str) -> Dict[str, Any]:
+    """
+    Build the system message, marking it cacheable where supported.
+
+    Anthropic and Gemini models only reuse a cached prompt prefix when it
+    carries an explicit cache_control breakpoint; other providers cache
+    automatically. Caching only pays off if system_prompt is identical
+    across calls, so keep dynamic data in the user message.
+
+    Args:
+        system_prompt: System prompt text
+        model: OpenRouter model ID
+
+    Returns:
+        System message for the chat completion payload
+    """
+    if model.startswith(_CACHE_CONTROL_MODEL_PREFIXES):
+        return {
+            "role": "system",
+            "content": [
+                {
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
+        }
+    return {"role": "system", "content": system_prompt}
+
+
+def _build_request(
     markdown_content: str,
     prompt_path: Optional[str],
     model: Optional[str],
-    temperature: float = 0.1,
-    max_tokens: int = 4000,
-    verbose: bool = False,
-    timeout: int = 120,
-) -> str:
+    temperature: float,
+    max_tokens: int,
+) -> Tuple[Dict[str, str], Dict[str, Any], str]:
     """
-    Process markdown content with OpenRouter API.
+    Build the per-request headers and JSON payload for OpenRouter.
 
     Args:
         markdown_content: Markdown content to process
@@ -55,14 +232,12 @@ def process_with_openrouter(
         model: OpenRouter model ID (optional)
         temperature: LLM temperature setting
         max_tokens: Maximum tokens for response
-        verbose: Enable debug output for API requests
 
     Returns:
-        JSON response from OpenRouter API
+        Tuple of (headers, payload, system_prompt)
 
     Raises:
-        requests.RequestException: If API request fails
-        ValueError: If API key is missing
+        ValueError: If API key, model or system prompt is missing
     """
     api_key = os.getenv("OPENROUTER_API_KEY")
     if not api_key:
@@ -80,71 +255,151 @@ def process_with_openrouter(
     # Load system prompt
     system_prompt = load_prompt(prompt_path)
 
-    # Prepare API request
-    url = "https://openrouter.ai/api/v1/chat/completions"
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-        "HTTP-Referer": "https://github.com/rmoriz/rubot",
-        "X-Title": "rubot CLI Tool",
-    }
+    # Static headers are sent by the client, only the key is per request
+    headers = {"Authorization": f"Bearer {api_key}"}
 
-    payload = {
+    payload: Dict[str, Any] = {
         "model": model,
         "messages": [
-            {"role": "system", "content": system_prompt},
+            # Static prompt first so providers can cache the prefix
+            _system_message(system_prompt, model),
             {"role": "user", "content": markdown_content},
         ],
         "temperature": temperature,
         "max_tokens": max_tokens,
     }
 
-    if verbose:
-        logger = logging.getLogger(__name__)
+    return headers, payload, system_prompt
+
+
+def _http_error_message(status_code: int) -> str:
+    """Map an OpenRouter HTTP status code to an error message"""
+    if status_code == 401:
+        return "Invalid OpenRouter API key"
+    elif status_code == 429:
+        return "OpenRouter API rate limit exceeded"
+    elif status_code >= 500:
+        return f"OpenRouter API server error ({status_code})"
+    return f"OpenRouter API HTTP error ({status_code})"
+
+
+def process_with_openrouter(
+    markdown_content: str,
+    prompt_path: Optional[str],
+    model: Optional[str],
+    temperature: float = 0.1,
+    max_tokens: int = 4000,
+    verbose: bool = False,
+    timeout: int = 120,
+) -> Dict[str, Any]:
+    """
+    Process markdown content with OpenRouter API.
+
+    Args:
+        markdown_content: Markdown content to process
+        prompt_path: Path to system prompt file (optional)
+        model: OpenRouter model ID (optional)
+        temperature: LLM temperature setting
+        max_tokens: Maximum tokens for response
+        verbose: Enable debug output for API requests
+
+    Returns:
+        Parsed JSON response from OpenRouter API
+
+    Raises:
+        requests.RequestException: If API request fails
+        ValueError: If API key is missing
+    """
+    headers, payload, system_prompt = _build_request(
+        markdown_content, prompt_path, model, temperature, max_tokens
+    )
+    url = OPENROUTER_API_URL
+    model = payload["model"]
+
+    # Checked once so nothing is formatted when DEBUG is filtered out
+    debug = verbose and logger.isEnabledFor(logging.DEBUG)
+
+    if debug:
         logger.debug("OpenRouter API Request")
-        logger.debug(f"URL: {url}")
-        logger.debug(f"Model: {model}")
-        logger.debug(f"Temperature: {temperature}")
-        logger.debug(f"Max Tokens: {max_tokens}")
-        logger.debug(f"Content Length: {len(markdown_content)} characters")
+        logger.debug("URL: %s", url)
         logger.debug(
-            f"System Prompt: {system_prompt[:100]}..."
-            if len(system_prompt) > 100
-            else f"System Prompt: {system_prompt}"
+            "Model: %s, Temperature: %s, Max Tokens: %s, "
+            "Content Length: %d characters",
+            model,
+            temperature,
+            max_tokens,
+            len(markdown_content),
         )
-        logger.debug(f"Headers: {dict(headers)}")
         logger.debug(
-            f"Full JSON Payload: {json.dumps(payload, indent=2, ensure_ascii=False)}"
+            "System Prompt: %s%s",
+            system_prompt[:100],
+            "..." if len(system_prompt) > 100 else "",
+        )
+        # Only the session headers are logged, never the Authorization one
+        logger.debug("Headers: %s", _SESSION.headers)
+        logger.debug("Full JSON Payload: %s", jsonutil.dumps(payload))
+
+    response_cache = _get_response_cache()
+    cache_key = None
+    if response_cache is not None:
+        cache_key = ResponseCache.make_key(
+            model, temperature, max_tokens, system_prompt, markdown_content
         )
+        try:
+            cached = response_cache.get(cache_key)
+        except OSError as e:
+            logger.warning(f"Failed to read cached OpenRouter response: {e}")
+            cached = None
+        if cached is not None:
+            try:
+                cached_json: Dict[str, Any] = jsonutil.loads(cached)
+            except json.JSONDecodeError:
+                # Drop the damaged entry so retries go to the API instead
+                logger.warning("Ignoring corrupt cached OpenRouter response")
+                with contextlib.suppress(OSError):
+                    response_cache.remove(cache_key)
+            else:
+                logger.info("Using cached OpenRouter response")
+                return cached_json
 
     try:
-        response = requests.post(
-            url, headers=headers, json=payload, timeout=timeout, verify=True
+        # Serialize once ourselves; Content-Type is set on the session
+        response = _SESSION.post(
+            url,
+            headers=headers,
+            data=jsonutil.dumps_bytes(payload),
+            timeout=timeout,
         )
 
-        if verbose:
-            logger = logging.getLogger(__name__)
-            logger.debug(f"Response Status: {response.status_code}")
-            logger.debug(f"Response Headers: {dict(response.headers)}")
+        if debug:
+            logger.debug("Response Status: %s", response.status_code)
+            logger.debug("Response Headers: %s", response.headers)
             if response.status_code != 200:
-                logger.debug(f"Response Text: {response.text}")
+                logger.debug("Response Text: %s", response.text)
             logger.debug("-" * 50)
 
         response.raise_for_status()
 
-        response_json = response.json()
+        response_json: Dict[str, Any] = jsonutil.loads(response.content)
 
-        if verbose:
-            logger = logging.getLogger(__name__)
+        if debug:
             logger.debug("API Response received")
-            logger.debug("\nFull JSON Response:")
-            logger.debug(
-                json.dumps(response_json, indent=2, ensure_ascii=False)
-            )
+            logger.debug("Full JSON Response: %s", jsonutil.dumps(response_json))
             logger.debug("-" * 50)
 
-        # Return formatted JSON response
-        return json.dumps(response_json, indent=2, ensure_ascii=False)
+        if (
+            response_cache is not None
+            and cache_key is not None
+            and is_valid_openrouter_response(response_json)
+        ):
+            try:
+                response_cache.put(
+                    cache_key, jsonutil.dumps(response_json), model
+                )
+            except OSError as e:
+                logger.warning(f"Failed to cache OpenRouter response: {e}")
+
+        return response_json
 
     except requests.exceptions.Timeout:
         raise requests.RequestException(
@@ -153,20 +408,9 @@ def process_with_openrouter(
     except requests.exceptions.ConnectionError:
         raise requests.RequestException("Failed to connect to OpenRouter API")
     except requests.exceptions.HTTPError as e:
-        if e.response.status_code == 401:
-            raise requests.RequestException("Invalid OpenRouter API key")
-        elif e.response.status_code == 429:
-            raise requests.RequestException(
-                "OpenRouter API rate limit exceeded"
-            )
-        elif e.response.status_code >= 500:
-            raise requests.RequestException(
-                f"OpenRouter API server error ({e.response.status_code})"
-            )
-        else:
-            raise requests.RequestException(
-                f"OpenRouter API HTTP error ({e.response.status_code})"
-            )
+        raise requests.RequestException(
+            _http_error_message(e.response.status_code)
+        )
     except requests.exceptions.RequestException as e:
         raise requests.RequestException(f"OpenRouter API request failed: {e}")
     except json.JSONDecodeError as e:
@@ -177,26 +421,93 @@ def process_with_openrouter(
         )
 
 
-def is_valid_openrouter_response(response_json: Dict[str, Any]) -> bool:
+def process_with_openrouter_legacy(
+    markdown_content: str,
+    prompt_path: Optional[str],
+    model: Optional[str],
+    temperature: float = 0.1,
+    max_tokens: int = 4000,
+    verbose: bool = False,
+    timeout: int = 120,
+) -> str:
+    """
+    Process markdown content with OpenRouter API, returning a JSON string.
+
+    Kept for callers that expect a formatted JSON string instead of the
+    parsed response. See process_with_openrouter for arguments and
+    exceptions.
+
+    Returns:
+        JSON response from OpenRouter API
+    """
+    return jsonutil.dumps(
+        process_with_openrouter(
+            markdown_content,
+            prompt_path,
+            model,
+            temperature,
+            max_tokens,
+            verbose,
+            timeout,
+        ),
+        indent=True,
+    )
+
+
+def is_valid_openrouter_response(
+    response_json: Union[Dict[str, Any], bytes, str],
+) -> bool:
     """
     Check if OpenRouter response is valid and contains content.
 
     Args:
-        response_json: The OpenRouter response JSON
+        response_json: The parsed OpenRouter response, or its raw JSON body
 
     Returns:
         True if response is valid, False otherwise
     """
-    # Check if the response has the expected structure
-    if "choices" not in response_json or not response_json["choices"]:
+    if isinstance(response_json, (bytes, str)):
+        try:
+            response_json = jsonutil.loads(response_json)
+        except json.JSONDecodeError:
+            return False
+
+    # A 200 response can still carry a JSON list, string or null body
+    if not isinstance(response_json, dict):
         return False
 
-    # Check if content exists and is not empty
-    content = response_json["choices"][0].get("message", {}).get("content")
-    if content is None or content.strip() == "":
+    # Check if the response has the expected structure
+    choices = response_json.get("choices")
+    if not choices:
         return False
 
-    return True
+    # Check if content exists and is not whitespace-only. isspace() stops
+    # at the first non-whitespace character and, unlike strip(), does not
+    # copy the (potentially large) content string.
+    content = choices[0].get("message", {}).get("content")
+    return bool(content and not content.isspace())
+
+
+def _wait_before_retry(
+    delay: float,
+    cancel_event: Optional[threading.Event],
+    sleeper: Optional[Callable[[float], None]] = None,
+) -> None:
+    """
+    Wait before the next retry attempt.
+
+    Args:
+        delay: Wait time in seconds
+        cancel_event: Event that aborts the wait when set (optional)
+        sleeper: Sleep function used without cancel_event (default: time.sleep)
+
+    Raises:
+        KeyboardInterrupt: If cancel_event is set while waiting
+    """
+    if cancel_event is None:
+        (time.sleep if sleeper is None else sleeper)(delay)
+    elif cancel_event.wait(delay):
+        raise KeyboardInterrupt("OpenRouter retry cancelled")
 
 
 def process_with_openrouter_backoff(
@@ -208,7 +519,9 @@ def process_with_openrouter_backoff(
     verbose: bool = False,
     timeout: int = 120,
     fallback_model: Optional[str] = None,
-) -> str:
+    cancel_event: Optional[threading.Event] = None,
+    sleeper: Optional[Callable[[float], None]] = None,
+) -> Dict[str, Any]:
     """
     Process markdown content with OpenRouter API using retry mechanism with fallback model.
 
@@ -231,15 +544,18 @@ def process_with_openrouter_backoff(
         verbose: Enable debug output for API requests
         timeout: API request timeout in seconds
         fallback_model: Fallback model to use if primary model fails
+        cancel_event: Event that aborts pending retry waits when set
+        sleeper: Function called with the delay in seconds between retries
+            (default: time.sleep)
 
     Returns:
-        JSON response from OpenRouter API
+        Parsed JSON response from OpenRouter API
 
     Raises:
         requests.RequestException: If all API requests fail
         ValueError: If API key is missing or responses are invalid
+        KeyboardInterrupt: If cancel_event is set during a retry wait
     """
-    logger = logging.getLogger(__name__)
     max_retries = 3
     # Progressive retry delays: 0s, 30s, 60s, 120s (better for rate limits)
     retry_delays = [0, 30, 60, 120]  # seconds
@@ -252,12 +568,26 @@ def process_with_openrouter_backoff(
             "DEFAULT_MODEL environment variable"
         )
 
+    # Resolve the fallback model up front so misconfiguration is reported
+    # before the retry loop rather than after minutes of waiting
+    effective_fallback: Optional[str] = fallback_model
+    if not fallback_model:
+        # Running without a fallback is a normal setup, not worth a warning
+        logger.debug("No fallback model configured")
+        effective_fallback = None
+    elif fallback_model == primary_model:
+        logger.warning(
+            "Fallback model is the same as primary model, "
+            "skipping fallback attempt"
+        )
+        effective_fallback = None
+
     # First attempt with primary model
     try:
         logger.info(
             f"OpenRouter request - first attempt with model: {primary_model}"
         )
-        response = process_with_openrouter(
+        result = process_with_openrouter(
             markdown_content,
             prompt_path,
             primary_model,
@@ -267,20 +597,15 @@ def process_with_openrouter_backoff(
             timeout,
         )
 
-        # Parse response to check if it's valid
-        response_json = json.loads(response)
-        if is_valid_openrouter_response(response_json):
+        # Validate the already-parsed response
+        if is_valid_openrouter_response(result):
             logger.info("OpenRouter request successful on first attempt")
-            return cast(str, response)
+            return result
         else:
             error_msg = "Empty or invalid content in OpenRouter response"
             logger.warning(f"{error_msg} on first attempt")
 
-    except (
-        requests.RequestException,
-        ValueError,
-        json.JSONDecodeError,
-    ) as e:
+    except (requests.RequestException, ValueError) as e:
         logger.warning(f"OpenRouter request failed on first attempt: {e}")
 
     # Retry attempts with primary model and progressive delays
@@ -291,7 +616,7 @@ def process_with_openrouter_backoff(
             logger.info(
                 f"Waiting {delay} seconds before retry #{attempt+1}..."
             )
-            time.sleep(delay)
+            _wait_before_retry(delay, cancel_event, sleeper)
         else:
             logger.info(f"Immediate retry #{attempt+1} (no delay)")
 
@@ -299,7 +624,7 @@ def process_with_openrouter_backoff(
             logger.info(
                 f"OpenRouter retry attempt #{attempt+1} with model: {primary_model}"
             )
-            response = process_with_openrouter(
+            result = process_with_openrouter(
                 markdown_content,
                 prompt_path,
                 primary_model,
@@ -309,50 +634,44 @@ def process_with_openrouter_backoff(
                 timeout,
             )
 
-            # Parse response to check if it's valid
-            response_json = json.loads(response)
-            if is_valid_openrouter_response(response_json):
+            # Validate the already-parsed response
+            if is_valid_openrouter_response(result):
                 logger.info(f"OpenRouter request successful on retry #{attempt+1}")
-                return cast(str, response)
+                return result
             else:
                 error_msg = "Empty or invalid content in OpenRouter response"
                 logger.warning(f"{error_msg} on retry #{attempt+1}")
                 last_exception = ValueError(error_msg)
 
-        except (
-            requests.RequestException,
-            ValueError,
-            json.JSONDecodeError,
-        ) as e:
+        except (requests.RequestException, ValueError) as e:
             logger.warning(f"OpenRouter request failed on retry #{attempt+1}: {e}")
             last_exception = e
 
     # All retries with primary model failed, try fallback model if available
-    if fallback_model and fallback_model != primary_model:
+    if effective_fallback:
         logger.warning(
             f"All attempts with primary model '{primary_model}' failed"
         )
-        logger.info(f"Attempting fallback to model: {fallback_model}")
+        logger.info(f"Attempting fallback to model: {effective_fallback}")
 
-        
         try:
-            response = process_with_openrouter(
+            result = process_with_openrouter(
                 markdown_content,
                 prompt_path,
-                fallback_model,
+                effective_fallback,
                 temperature,
                 max_tokens,
                 verbose,
                 timeout,
             )
 
-            # Parse response to check if it's valid
-            response_json = json.loads(response)
-            if is_valid_openrouter_response(response_json):
+            # Validate the already-parsed response
+            if is_valid_openrouter_response(result):
                 logger.info(
-                    f"OpenRouter request successful with fallback model: {fallback_model}"
+                    "OpenRouter request successful with fallback model: "
+                    f"{effective_fallback}"
                 )
-                return cast(str, response)
+                return result
             else:
                 error_msg = (
                     "Empty or invalid content in OpenRouter response "
@@ -361,25 +680,15 @@ def process_with_openrouter_backoff(
                 logger.error(error_msg)
                 raise ValueError(error_msg)
 
-        except (
-            requests.RequestException,
-            ValueError,
-            json.JSONDecodeError,
-        ) as e:
-            logger.error(f"Fallback model '{fallback_model}' also failed: {e}")
+        except (requests.RequestException, ValueError) as e:
+            logger.error(
+                f"Fallback model '{effective_fallback}' also failed: {e}"
+            )
             # Raise the last exception from the primary model attempts
             if last_exception:
                 raise last_exception
             raise e
     else:
-        if fallback_model == primary_model:
-            logger.warning(
-                "Fallback model is the same as primary model, "
-                "skipping fallback attempt"
-            )
-        elif not fallback_model:
-            logger.warning("No fallback model configured")
-
         logger.error(
             f"All {max_retries + 1} OpenRouter attempts failed "
             f"with model '{primary_model}'"
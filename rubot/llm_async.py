@@ -0,0 +1,487 @@
+"""
+Concurrent OpenRouter processing using httpx.AsyncClient
+"""
+
+import asyncio
+import contextlib
+import importlib.util
+import json
+import logging
+import os
+import random
+import time
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .llm import (
+    OPENROUTER_API_URL,
+    _STATIC_HEADERS,
+    _build_request,
+    _http_error_message,
+    is_valid_openrouter_response,
+)
+
+try:
+    import httpx
+
+    _HTTPX_AVAILABLE = True
+except ImportError:
+    _HTTPX_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 multiplexing needs the optional h2 package
+_H2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+DEFAULT_MAX_CONCURRENCY = 10
+
+
+def _require_httpx() -> None:
+    """Raise a helpful error if httpx is not installed"""
+    if not _HTTPX_AVAILABLE:
+        raise ImportError(
+            "httpx is required for concurrent OpenRouter processing. "
+            "Install it with: pip install 'rubot[async]'"
+        )
+
+
+def get_max_concurrency() -> int:
+    """
+    Get the concurrency limit for batch processing.
+
+    Returns:
+        Value of RUBOT_MAX_CONCURRENCY, or DEFAULT_MAX_CONCURRENCY if unset
+
+    Raises:
+        ValueError: If RUBOT_MAX_CONCURRENCY is not a positive integer
+    """
+    value = os.getenv("RUBOT_MAX_CONCURRENCY")
+    if not value:
+        return DEFAULT_MAX_CONCURRENCY
+    try:
+        max_concurrency = int(value)
+    except ValueError:
+        raise ValueError(f"RUBOT_MAX_CONCURRENCY must be an integer, got: {value}")
+    if max_concurrency < 1:
+        raise ValueError("RUBOT_MAX_CONCURRENCY must be at least 1")
+    return max_concurrency
+
+
+class _RateLimiter:
+    """Spaces request starts evenly to stay below a requests-per-minute cap"""
+
+    def __init__(self, rpm: int) -> None:
+        self.interval = 60.0 / rpm
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+def _to_requests_response(response: "httpx.Response") -> requests.Response:
+    """
+    Copy status and headers of an httpx response into a requests.Response.
+
+    Lets errors from the httpx clients carry a response that code written
+    for requests exceptions can inspect. The body is not copied.
+
+    Args:
+        response: httpx response of a failed request
+
+    Returns:
+        requests.Response with status_code, headers and url set
+    """
+    converted = requests.Response()
+    converted.status_code = response.status_code
+    converted.headers = CaseInsensitiveDict(response.headers)
+    converted.url = str(response.request.url)
+    return converted
+
+
+async def aprocess_with_openrouter(
+    client: "httpx.AsyncClient",
+    markdown_content: str,
+    prompt_path: Optional[str],
+    model: Optional[str],
+    temperature: float = 0.1,
+    max_tokens: int = 4000,
+    timeout: int = 120,
+) -> Dict[str, Any]:
+    """
+    Process markdown content with OpenRouter API asynchronously.
+
+    Errors are raised as the same exception types as
+    process_with_openrouter so callers can share retry handling.
+
+    Args:
+        client: httpx.AsyncClient to send the request with
+        markdown_content: Markdown content to process
+        prompt_path: Path to system prompt file (optional)
+        model: OpenRouter model ID (optional)
+        temperature: LLM temperature setting
+        max_tokens: Maximum tokens for response
+        timeout: Request timeout in seconds
+
+    Returns:
+        Parsed JSON response from OpenRouter API
+
+    Raises:
+        requests.RequestException: If API request fails
+        ValueError: If API key is missing or the response is not JSON
+        ImportError: If httpx is not installed
+    """
+    _require_httpx()
+    headers, payload, _ = _build_request(
+        markdown_content, prompt_path, model, temperature, max_tokens
+    )
+
+    try:
+        response = await client.post(
+            OPENROUTER_API_URL, headers=headers, json=payload, timeout=timeout
+        )
+        response.raise_for_status()
+        response_json: Dict[str, Any] = response.json()
+    except httpx.TimeoutException:
+        raise requests.RequestException(
+            f"OpenRouter API request timed out after {timeout}s"
+        )
+    except httpx.ConnectError:
+        raise requests.RequestException("Failed to connect to OpenRouter API")
+    except httpx.HTTPStatusError as e:
+        # Keep status and headers so callers can honour Retry-After
+        raise requests.RequestException(
+            _http_error_message(e.response.status_code),
+            response=_to_requests_response(e.response),
+        )
+    except httpx.HTTPError as e:
+        raise requests.RequestException(f"OpenRouter API request failed: {e}")
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON response from OpenRouter API: {e}")
+
+    return response_json
+
+
+def create_async_client(max_concurrency: int) -> "httpx.AsyncClient":
+    """
+    Create an httpx.AsyncClient sized for the given concurrency.
+
+    Args:
+        max_concurrency: Maximum number of simultaneous connections
+
+    Returns:
+        Configured httpx.AsyncClient
+
+    Raises:
+        ImportError: If httpx is not installed
+    """
+    _require_httpx()
+    return httpx.AsyncClient(
+        http2=_H2_AVAILABLE,
+        headers=_STATIC_HEADERS,
+        limits=httpx.Limits(
+            max_connections=max_concurrency,
+            max_keepalive_connections=max_concurrency,
+        ),
+    )
+
+
+async def process_many_with_openrouter(
+    contents: Sequence[str],
+    prompt_path: Optional[str],
+    model: Optional[str],
+    temperature: float = 0.1,
+    max_tokens: int = 4000,
+    timeout: int = 120,
+    max_concurrency: Optional[int] = None,
+    rpm: Optional[int] = None,
+    max_retries: int = 0,
+    fallback_model: Optional[str] = None,
+) -> List[Union[Dict[str, Any], BaseException]]:
+    """
+    Process several markdown documents with OpenRouter API concurrently.
+
+    With max_retries or fallback_model set, each document goes through
+    aprocess_with_openrouter_backoff. Its waits happen outside the
+    concurrency and rate limits, so other documents keep going meanwhile.
+
+    Args:
+        contents: Markdown documents to process
+        prompt_path: Path to system prompt file (optional)
+        model: OpenRouter model ID (optional)
+        temperature: LLM temperature setting
+        max_tokens: Maximum tokens for response
+        timeout: Request timeout in seconds per document
+        max_concurrency: Maximum requests in flight (optional,
+            defaults to RUBOT_MAX_CONCURRENCY)
+        rpm: Maximum requests started per minute (optional)
+        max_retries: Retries per document after the first attempt (default: 0)
+        fallback_model: Model to try once per document after the primary
+            model failed (optional)
+
+    Returns:
+        One entry per document in input order, either the parsed response
+        or the exception raised for that document
+
+    Raises:
+        ImportError: If httpx is not installed
+        ValueError: If the concurrency or rate limit is invalid
+    """
+    _require_httpx()
+    if max_concurrency is None:
+        max_concurrency = get_max_concurrency()
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    if rpm is not None and rpm < 1:
+        raise ValueError("rpm must be at least 1")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    limiter = _RateLimiter(rpm) if rpm else None
+
+    async with create_async_client(max_concurrency) as client:
+
+        async def _run(content: str) -> Dict[str, Any]:
+            if max_retries > 0 or fallback_model:
+                return await aprocess_with_openrouter_backoff(
+                    client,
+                    content,
+                    prompt_path,
+                    model,
+                    temperature,
+                    max_tokens,
+                    timeout,
+                    fallback_model,
+                    max_retries,
+                    semaphore=semaphore,
+                    limiter=limiter,
+                )
+            async with semaphore:
+                if limiter:
+                    await limiter.acquire()
+                return await aprocess_with_openrouter(
+                    client,
+                    content,
+                    prompt_path,
+                    model,
+                    temperature,
+                    max_tokens,
+                    timeout,
+                )
+
+        results: List[Any] = await asyncio.gather(
+            *(_run(content) for content in contents), return_exceptions=True
+        )
+
+    return results
+
+
+def process_with_openrouter_batch(
+    contents: Sequence[str],
+    prompt_path: Optional[str],
+    model: Optional[str],
+    temperature: float = 0.1,
+    max_tokens: int = 4000,
+    timeout: int = 120,
+    max_concurrency: Optional[int] = None,
+    rpm: Optional[int] = None,
+    max_retries: int = 0,
+    fallback_model: Optional[str] = None,
+) -> List[Union[Dict[str, Any], BaseException]]:
+    """
+    Process a batch of markdown documents and validate every response.
+
+    Synchronous entry point around process_many_with_openrouter. OpenRouter
+    has no asynchronous batch endpoint, so the batch is sent as concurrent
+    chat completion requests over one connection pool.
+
+    Args:
+        contents: Markdown documents to process
+        prompt_path: Path to system prompt file (optional)
+        model: OpenRouter model ID (optional)
+        temperature: LLM temperature setting
+        max_tokens: Maximum tokens for response
+        timeout: Request timeout in seconds per document
+        max_concurrency: Maximum requests in flight (optional)
+        rpm: Maximum requests started per minute (optional)
+        max_retries: Retries per document after the first attempt (default: 0)
+        fallback_model: Model to try once per document after the primary
+            model failed (optional)
+
+    Returns:
+        One entry per document in input order, either a valid parsed
+        response or the exception for that document. Responses
+        without content are reported as ValueError.
+
+    Raises:
+        ImportError: If httpx is not installed
+        ValueError: If the concurrency or rate limit is invalid
+    """
+    results = asyncio.run(
+        process_many_with_openrouter(
+            contents,
+            prompt_path,
+            model,
+            temperature,
+            max_tokens,
+            timeout,
+            max_concurrency,
+            rpm,
+            max_retries,
+            fallback_model,
+        )
+    )
+
+    validated: List[Union[Dict[str, Any], BaseException]] = []
+    for index, result in enumerate(results):
+        if isinstance(result, dict) and not is_valid_openrouter_response(result):
+            validated.append(
+                ValueError(f"Invalid or empty response for document {index}")
+            )
+        else:
+            validated.append(result)
+    return validated
+
+
+# Decorrelated jitter bounds for aprocess_with_openrouter_backoff (seconds)
+BACKOFF_BASE = 60.0
+BACKOFF_CAP = 960.0
+
+
+def _decorrelated_jitter(previous: float, rng: Optional[random.Random] = None) -> float:
+    """
+    Next retry delay using decorrelated jitter.
+
+    Args:
+        previous: Previous delay in seconds
+        rng: Random number generator (optional, for tests)
+
+    Returns:
+        Delay in seconds between BACKOFF_BASE and BACKOFF_CAP
+    """
+    uniform = (rng or random).uniform
+    return min(BACKOFF_CAP, uniform(BACKOFF_BASE, previous * 3))
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """
+    Read a numeric Retry-After header from a failed request.
+
+    Args:
+        error: Exception raised by aprocess_with_openrouter
+
+    Returns:
+        Seconds to wait, or None if the server did not say
+    """
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    value = response.headers.get("Retry-After")
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        # HTTP-date form is not used by OpenRouter
+        return None
+
+
+async def aprocess_with_openrouter_backoff(
+    client: "httpx.AsyncClient",
+    markdown_content: str,
+    prompt_path: Optional[str],
+    model: Optional[str],
+    temperature: float = 0.1,
+    max_tokens: int = 4000,
+    timeout: int = 120,
+    fallback_model: Optional[str] = None,
+    max_retries: int = 3,
+    rng: Optional[random.Random] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    limiter: Optional[_RateLimiter] = None,
+) -> Dict[str, Any]:
+    """
+    Process markdown content asynchronously with retries and fallback model.
+
+    Async counterpart of process_with_openrouter_backoff. Waits use
+    asyncio.sleep so other requests progress meanwhile, and delays follow
+    decorrelated jitter (capped at BACKOFF_CAP) so concurrent tasks do not
+    retry in lockstep. A Retry-After header on the error takes precedence.
+
+    Args:
+        client: httpx.AsyncClient to send the requests with
+        markdown_content: Markdown content to process
+        prompt_path: Path to system prompt file (optional)
+        model: OpenRouter model ID (optional)
+        temperature: LLM temperature setting
+        max_tokens: Maximum tokens for response
+        timeout: Request timeout in seconds
+        fallback_model: Model to try once after the primary model failed
+        max_retries: Retries with the primary model after the first attempt
+        rng: Random number generator for the jitter (optional, for tests)
+        semaphore: Held during each attempt but not while waiting (optional)
+        limiter: Rate limiter acquired before each attempt (optional)
+
+    Returns:
+        Parsed JSON response from OpenRouter API
+
+    Raises:
+        requests.RequestException: If all API requests fail
+        ValueError: If API key is missing or responses are invalid
+    """
+
+    primary_model = model or os.getenv("DEFAULT_MODEL")
+    if not primary_model:
+        raise ValueError(
+            "Model must be specified either as parameter or "
+            "DEFAULT_MODEL environment variable"
+        )
+    models = [primary_model] * (max_retries + 1)
+    if fallback_model and fallback_model != primary_model:
+        models.append(fallback_model)
+
+    delay = BACKOFF_BASE
+    last_exception: Exception = ValueError(
+        "Empty or invalid content in OpenRouter response"
+    )
+    for attempt, attempt_model in enumerate(models):
+        if attempt > 0:
+            retry_after = _retry_after_seconds(last_exception)
+            delay = _decorrelated_jitter(delay, rng)
+            # A server-supplied Retry-After must not stall the task for hours
+            wait = min(retry_after, BACKOFF_CAP) if retry_after is not None else delay
+            logger.info(f"Waiting {wait:.1f} seconds before attempt #{attempt + 1}")
+            await asyncio.sleep(wait)
+
+        try:
+            async with semaphore or contextlib.nullcontext():
+                if limiter:
+                    await limiter.acquire()
+                result = await aprocess_with_openrouter(
+                    client,
+                    markdown_content,
+                    prompt_path,
+                    attempt_model,
+                    temperature,
+                    max_tokens,
+                    timeout,
+                )
+        except (requests.RequestException, ValueError) as e:
+            logger.warning(f"OpenRouter request failed on attempt #{attempt + 1}: {e}")
+            last_exception = e
+            continue
+
+        if is_valid_openrouter_response(result):
+            return result
+
+        logger.warning(
+            "Empty or invalid content in OpenRouter response "
+            f"on attempt #{attempt + 1}"
+        )
+        last_exception = ValueError("Empty or invalid content in OpenRouter response")
+
+    raise last_exception
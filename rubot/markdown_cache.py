@@ -2,13 +2,61 @@
 Markdown cache for PDF conversion results
 """
 
+import hashlib
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, Type
 from datetime import datetime, timedelta
 import json
 
+from . import jsonutil
+from .utils import atomic_write_bytes
+
+try:
+    # Python 3.14+ ships zstd in the standard library
+    from compression import zstd as _zstd  # type: ignore[import-not-found]
+
+    def _zstd_compress(data: bytes) -> bytes:
+        return bytes(_zstd.compress(data, level=3))
+
+    def _zstd_decompress(data: bytes) -> bytes:
+        return bytes(_zstd.decompress(data))
+
+    _ZSTD_ERRORS: Tuple[Type[Exception], ...] = (_zstd.ZstdError,)
+    _ZSTD_AVAILABLE = True
+except ImportError:
+    try:
+        import zstandard
+
+        _ZSTD_CCTX = zstandard.ZstdCompressor(level=3)
+        _ZSTD_DCTX = zstandard.ZstdDecompressor()
+
+        def _zstd_compress(data: bytes) -> bytes:
+            return bytes(_ZSTD_CCTX.compress(data))
+
+        def _zstd_decompress(data: bytes) -> bytes:
+            return bytes(_ZSTD_DCTX.decompress(data))
+
+        _ZSTD_ERRORS = (zstandard.ZstdError,)
+        _ZSTD_AVAILABLE = True
+    except ImportError:
+        # Without zstd, markdown is stored as plain .md files
+        _ZSTD_ERRORS = ()
+        _ZSTD_AVAILABLE = False
+
+# Errors from reading a truncated or corrupt content file
+_CORRUPT_CONTENT_ERRORS = (UnicodeDecodeError,) + _ZSTD_ERRORS
+
+# Threads used by cleanup_expired to overlap filesystem calls
+_CLEANUP_WORKERS = 8
+
+
+def _blake2b_128() -> "hashlib.blake2b":
+    """BLAKE2b with a 128-bit digest, same key length as the former MD5"""
+    return hashlib.blake2b(digest_size=16)
+
 
 class MarkdownCache:
     """Cache for PDF to Markdown conversion results"""
@@ -46,13 +94,8 @@ class MarkdownCache:
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
 
         # Use file content hash for stable cache key
-        import hashlib
-
-        hasher = hashlib.md5()
         with open(pdf_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hasher.update(chunk)
-        return hasher.hexdigest()
+            return hashlib.file_digest(f, _blake2b_128).hexdigest()
 
     def _get_cache_paths(self, cache_key: str) -> Tuple[Path, Path]:
         """Get paths for markdown content and metadata files"""
@@ -60,6 +103,29 @@ class MarkdownCache:
         meta_path = self.cache_dir / f"{cache_key}_meta.json"
         return content_path, meta_path
 
+    def _get_compressed_path(self, cache_key: str) -> Path:
+        """Get path for zstd-compressed markdown content"""
+        return self.cache_dir / f"{cache_key}.md.zst"
+
+    def _read_content(self, cache_key: str) -> str:
+        """Read cached markdown, preferring the compressed file"""
+        if _ZSTD_AVAILABLE:
+            try:
+                data = self._get_compressed_path(cache_key).read_bytes()
+                return _zstd_decompress(data).decode("utf-8")
+            except FileNotFoundError:
+                # Entry written without zstd, fall back to plain markdown
+                pass
+
+        content_path, _ = self._get_cache_paths(cache_key)
+        return content_path.read_bytes().decode("utf-8")
+
+    def _remove_content(self, cache_key: str) -> None:
+        """Remove cached markdown in both storage formats"""
+        content_path, _ = self._get_cache_paths(cache_key)
+        content_path.unlink(missing_ok=True)
+        self._get_compressed_path(cache_key).unlink(missing_ok=True)
+
     def get(self, pdf_path: str) -> Optional[str]:
         """
         Get cached markdown content if exists and not expired.
@@ -74,23 +140,28 @@ class MarkdownCache:
             cache_key = self._get_cache_key(pdf_path)
             content_path, meta_path = self._get_cache_paths(cache_key)
 
-            if not content_path.exists() or not meta_path.exists():
+            if not meta_path.exists():
                 return None
 
             # Check metadata for expiration
-            with open(meta_path, "r") as f:
-                metadata = json.load(f)
+            metadata = jsonutil.loads(meta_path.read_bytes())
 
             cached_time = datetime.fromisoformat(metadata["cached_at"])
             if datetime.now() - cached_time > self.max_age:
                 # Remove expired files
-                content_path.unlink(missing_ok=True)
+                self._remove_content(cache_key)
                 meta_path.unlink(missing_ok=True)
                 return None
 
             # Return cached content
-            with open(content_path, "r", encoding="utf-8") as f:
-                return f.read()
+            try:
+                return self._read_content(cache_key)
+            except _CORRUPT_CONTENT_ERRORS:
+                # Treat a damaged entry as a miss and drop it, so the next
+                # put() writes a fresh one
+                self._remove_content(cache_key)
+                meta_path.unlink(missing_ok=True)
+                return None
 
         except (FileNotFoundError, json.JSONDecodeError, KeyError):
             return None
@@ -109,9 +180,17 @@ class MarkdownCache:
         cache_key = self._get_cache_key(pdf_path)
         content_path, meta_path = self._get_cache_paths(cache_key)
 
-        # Store content
-        with open(content_path, "w", encoding="utf-8") as f:
-            f.write(markdown_content)
+        # Store content, compressed when zstd is available. Files are
+        # replaced atomically and metadata goes last, so an interrupted
+        # put never leaves an entry that get() would accept.
+        content = markdown_content.encode("utf-8")
+        if _ZSTD_AVAILABLE:
+            atomic_write_bytes(
+                self._get_compressed_path(cache_key), _zstd_compress(content)
+            )
+            content_path.unlink(missing_ok=True)
+        else:
+            atomic_write_bytes(content_path, content)
 
         # Store metadata
         metadata = {
@@ -121,17 +200,35 @@ class MarkdownCache:
             "cache_key": cache_key,
         }
 
-        with open(meta_path, "w") as f:
-            json.dump(metadata, f, indent=2)
+        atomic_write_bytes(meta_path, jsonutil.dumps_bytes(metadata))
 
         return cache_key
 
     def clear(self) -> None:
         """Clear all cached markdown files"""
-        for cache_file in self.cache_dir.glob("*.md"):
-            cache_file.unlink()
-        for meta_file in self.cache_dir.glob("*_meta.json"):
-            meta_file.unlink()
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith((".md", ".md.zst", "_meta.json", ".tmp")):
+                    os.unlink(entry.path)
+
+    def _expire_entry(self, meta_path: str, now: datetime) -> int:
+        """Remove one cache entry if it is expired or corrupted"""
+        try:
+            metadata = jsonutil.loads(Path(meta_path).read_bytes())
+
+            cached_time = datetime.fromisoformat(metadata["cached_at"])
+            if now - cached_time <= self.max_age:
+                return 0
+
+            # Remove both content and metadata files
+            self._remove_content(metadata["cache_key"])
+            Path(meta_path).unlink(missing_ok=True)
+            return 2
+
+        except (json.JSONDecodeError, KeyError, FileNotFoundError):
+            # Remove corrupted metadata files
+            Path(meta_path).unlink(missing_ok=True)
+            return 1
 
     def cleanup_expired(self) -> int:
         """
@@ -140,42 +237,40 @@ class MarkdownCache:
         Returns:
             Number of files removed
         """
-        removed = 0
         now = datetime.now()
-
-        for meta_file in self.cache_dir.glob("*_meta.json"):
-            try:
-                with open(meta_file, "r") as f:
-                    metadata = json.load(f)
-
-                cached_time = datetime.fromisoformat(metadata["cached_at"])
-                if now - cached_time > self.max_age:
-                    # Remove both content and metadata files
-                    cache_key = metadata["cache_key"]
-                    content_path, _ = self._get_cache_paths(cache_key)
-
-                    content_path.unlink(missing_ok=True)
-                    meta_file.unlink(missing_ok=True)
-                    removed += 2
-
-            except (json.JSONDecodeError, KeyError, FileNotFoundError):
-                # Remove corrupted metadata files
-                meta_file.unlink(missing_ok=True)
-                removed += 1
-
-        return removed
+        # Metadata is written last by put(), so a file modified within
+        # max_age belongs to a fresh entry and does not need to be parsed
+        cutoff = now.timestamp() - self.max_age.total_seconds()
+
+        with os.scandir(self.cache_dir) as entries, ThreadPoolExecutor(
+            max_workers=_CLEANUP_WORKERS
+        ) as executor:
+            futures = [
+                executor.submit(self._expire_entry, entry.path, now)
+                for entry in entries
+                if entry.name.endswith("_meta.json")
+                and entry.stat().st_mtime <= cutoff
+            ]
+
+        return sum(future.result() for future in futures)
 
     def get_cache_info(self) -> Dict[str, Any]:
         """Get information about cache contents"""
-        content_files = list(self.cache_dir.glob("*.md"))
-        meta_files = list(self.cache_dir.glob("*_meta.json"))
+        content_files = meta_files = total_size = 0
 
-        total_size = sum(f.stat().st_size for f in content_files)
+        # DirEntry.stat() reuses data from the directory listing
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith((".md", ".md.zst")):
+                    content_files += 1
+                    total_size += entry.stat().st_size
+                elif entry.name.endswith("_meta.json"):
+                    meta_files += 1
 
         return {
             "cache_dir": str(self.cache_dir),
-            "content_files": len(content_files),
-            "meta_files": len(meta_files),
+            "content_files": content_files,
+            "meta_files": meta_files,
             "total_size_bytes": total_size,
             "total_size_mb": round(total_size / (1024 * 1024), 2),
         }
@@ -3,12 +3,22 @@ Data models for rubot
 """
 
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 from datetime import datetime
 import json
 
+from . import jsonutil
 
-@dataclass
+# Longest non-JSON response kept as summary, in characters
+_SUMMARY_LIMIT = 500
+
+
+def _truncate(text: str, limit: int = _SUMMARY_LIMIT) -> str:
+    """Cut text to limit characters, marking the cut with an ellipsis"""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+@dataclass(slots=True)
 class Announcement:
     """Municipal announcement data model"""
 
@@ -28,7 +38,7 @@ class Announcement:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """Municipal event data model"""
 
@@ -48,7 +58,7 @@ class Event:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportantDate:
     """Important deadline data model"""
 
@@ -64,7 +74,7 @@ class ImportantDate:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class RathausUmschauAnalysis:
     """Complete analysis result data model"""
 
@@ -93,26 +103,39 @@ class RathausUmschauAnalysis:
 
     def to_json(self, indent: int = 2) -> str:
         """Convert to JSON string"""
+        if indent == 2:
+            # Fields are declared in to_dict() order, so the dataclass tree
+            # serializes to the same document without building the dicts
+            return jsonutil.dumps(self, indent=True)
         return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
 
     @classmethod
     def from_llm_response(
-        cls, response_text: str, source_date: str, model: str
+        cls,
+        response_text: Union[str, Dict[str, Any]],
+        source_date: str,
+        model: str,
     ) -> "RathausUmschauAnalysis":
         """
         Create analysis from LLM response.
 
         Args:
-            response_text: JSON response from LLM (OpenRouter format)
+            response_text: JSON response from LLM (OpenRouter format), either
+                as text or already parsed
             source_date: Date of source document
             model: Model used for analysis
 
         Returns:
             RathausUmschauAnalysis instance
         """
+        now_iso = datetime.now().isoformat()
+
         try:
-            # Parse OpenRouter response format
-            openrouter_response = json.loads(response_text)
+            # Parse OpenRouter response format unless the caller already did
+            if isinstance(response_text, dict):
+                openrouter_response = response_text
+            else:
+                openrouter_response = jsonutil.loads(response_text)
 
             # Extract the actual content from OpenRouter response
             if (
@@ -123,105 +146,92 @@ class RathausUmschauAnalysis:
                     "content"
                 ]
 
-                # Try to parse the content as JSON
-                try:
-                    data = json.loads(actual_content)
-                    # Ensure data is a dictionary
-                    if not isinstance(data, dict):
-                        raise json.JSONDecodeError(
-                            "Content is not a JSON object", actual_content, 0
-                        )
-
-                    # Parse announcements
-                    announcements = []
-                    for ann_data in data.get("announcements", []):
-                        announcements.append(
-                            Announcement(
-                                title=ann_data.get("title", ""),
-                                description=ann_data.get("description", ""),
-                                category=ann_data.get("category", ""),
-                                date=ann_data.get("date"),
-                                location=ann_data.get("location"),
-                            )
-                        )
-
-                    # Parse events
-                    events = []
-                    for event_data in data.get("events", []):
-                        events.append(
-                            Event(
-                                title=event_data.get("title", ""),
-                                date=event_data.get("date"),
-                                time=event_data.get("time"),
-                                location=event_data.get("location"),
-                                description=event_data.get("description"),
-                            )
-                        )
-
-                    # Parse important dates
-                    important_dates = []
-                    for date_data in data.get("important_dates", []):
-                        important_dates.append(
-                            ImportantDate(
-                                description=date_data.get("description", ""),
-                                date=date_data.get("date", ""),
-                                details=date_data.get("details"),
-                            )
-                        )
-
+                # Only content that looks like a JSON object is parsed,
+                # plain prose goes straight to the summary fallback
+                data = None
+                if actual_content.lstrip().startswith("{"):
+                    try:
+                        data = jsonutil.loads(actual_content)
+                    except json.JSONDecodeError:
+                        pass
+
+                if not isinstance(data, dict):
+                    # Content is not a JSON object, treat as summary
                     return cls(
-                        summary=data.get("summary", ""),
-                        announcements=announcements,
-                        events=events,
-                        important_dates=important_dates,
-                        processing_date=datetime.now().isoformat(),
-                        source_date=source_date,
-                        model_used=model,
-                    )
-
-                except json.JSONDecodeError:
-                    # Content is not JSON, treat as summary
-                    return cls(
-                        summary=(
-                            actual_content[:500] + "..."
-                            if len(actual_content) > 500
-                            else actual_content
-                        ),
+                        summary=_truncate(actual_content),
                         announcements=[],
                         events=[],
                         important_dates=[],
-                        processing_date=datetime.now().isoformat(),
+                        processing_date=now_iso,
                         source_date=source_date,
                         model_used=model,
                     )
+
+                # Positional construction, fields are in declaration order
+                announcements = [
+                    Announcement(
+                        a.get("title", ""),
+                        a.get("description", ""),
+                        a.get("category", ""),
+                        a.get("date"),
+                        a.get("location"),
+                    )
+                    for a in data.get("announcements", ())
+                ]
+
+                events = [
+                    Event(
+                        e.get("title", ""),
+                        e.get("date"),
+                        e.get("time"),
+                        e.get("location"),
+                        e.get("description"),
+                    )
+                    for e in data.get("events", ())
+                ]
+
+                important_dates = [
+                    ImportantDate(
+                        d.get("description", ""),
+                        d.get("date", ""),
+                        d.get("details"),
+                    )
+                    for d in data.get("important_dates", ())
+                ]
+
+                return cls(
+                    summary=data.get("summary", ""),
+                    announcements=announcements,
+                    events=events,
+                    important_dates=important_dates,
+                    processing_date=now_iso,
+                    source_date=source_date,
+                    model_used=model,
+                )
             else:
                 # No choices in response, use raw response as summary
+                if isinstance(response_text, dict):
+                    response_text = jsonutil.dumps(response_text)
                 return cls(
-                    summary=(
-                        response_text[:500] + "..."
-                        if len(response_text) > 500
-                        else response_text
-                    ),
+                    summary=_truncate(response_text),
                     announcements=[],
                     events=[],
                     important_dates=[],
-                    processing_date=datetime.now().isoformat(),
+                    processing_date=now_iso,
                     source_date=source_date,
                     model_used=model,
                 )
 
         except json.JSONDecodeError:
             # Fallback for non-JSON responses
+            if isinstance(response_text, dict):
+                response_text = jsonutil.dumps(response_text)
             return cls(
-                summary=(
-                    response_text[:500] + "..."
-                    if len(response_text) > 500
-                    else response_text
-                ),
+                summary=_truncate(response_text),
                 announcements=[],
                 events=[],
                 important_dates=[],
-                processing_date=datetime.now().isoformat(),
+                processing_date=now_iso,
                 source_date=source_date,
                 model_used=model,
             )
@@ -0,0 +1,201 @@
+"""
+Response cache for OpenRouter API results
+"""
+
+import functools
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional, Tuple, Dict, Any
+from datetime import datetime, timedelta
+import json
+
+from . import jsonutil
+from .utils import atomic_write_bytes
+
+
+@functools.lru_cache(maxsize=8)
+def _encode_prompt(system_prompt: str) -> bytes:
+    """Encode the system prompt once, it is identical across calls"""
+    return system_prompt.encode()
+
+
+class ResponseCache:
+    """Cache for OpenRouter responses keyed on the exact request"""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_age_hours: int = 168,
+    ):  # 1 week default
+        """
+        Initialize response cache.
+
+        Args:
+            cache_dir: Directory for cache files (default: system temp)
+            max_age_hours: Maximum age of cached responses in hours (default: 1 week)
+        """
+        if cache_dir is None:
+            cache_dir = os.path.join(tempfile.gettempdir(), "rubot_response_cache")
+
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_age = timedelta(hours=max_age_hours)
+
+    @staticmethod
+    def make_key(
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        system_prompt: str,
+        markdown_content: str,
+    ) -> str:
+        """Generate cache key from everything that affects the response"""
+        return hashlib.sha256(
+            b"\x1f".join(
+                [
+                    model.encode(),
+                    f"{temperature}|{max_tokens}".encode(),
+                    _encode_prompt(system_prompt),
+                    markdown_content.encode(),
+                ]
+            )
+        ).hexdigest()
+
+    def _get_cache_paths(self, cache_key: str) -> Tuple[Path, Path]:
+        """Get paths for response content and metadata files"""
+        content_path = self.cache_dir / f"{cache_key}.json"
+        meta_path = self.cache_dir / f"{cache_key}_meta.json"
+        return content_path, meta_path
+
+    def get(self, cache_key: str) -> Optional[str]:
+        """
+        Get cached response if exists and not expired.
+
+        Args:
+            cache_key: Key from make_key
+
+        Returns:
+            Cached response JSON string or None if not found/expired
+        """
+        content_path, meta_path = self._get_cache_paths(cache_key)
+
+        try:
+            metadata = jsonutil.loads(meta_path.read_bytes())
+
+            cached_time = datetime.fromisoformat(metadata["cached_at"])
+            if datetime.now() - cached_time > self.max_age:
+                # Remove expired files
+                content_path.unlink(missing_ok=True)
+                meta_path.unlink(missing_ok=True)
+                return None
+
+            return content_path.read_bytes().decode("utf-8")
+
+        except FileNotFoundError:
+            return None
+        except (OSError, KeyError, json.JSONDecodeError, UnicodeDecodeError):
+            # Damaged entry, e.g. a half-written file from an older version.
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+            self.remove(cache_key)
+            return None
+
+    def remove(self, cache_key: str) -> None:
+        """
+        Remove a cached response.
+
+        Args:
+            cache_key: Key from make_key
+        """
+        content_path, meta_path = self._get_cache_paths(cache_key)
+        content_path.unlink(missing_ok=True)
+        meta_path.unlink(missing_ok=True)
+
+    def put(self, cache_key: str, response_json: str, model: str) -> None:
+        """
+        Store response in cache.
+
+        Args:
+            cache_key: Key from make_key
+            response_json: Response JSON string to cache
+            model: Model that produced the response
+        """
+        content_path, meta_path = self._get_cache_paths(cache_key)
+
+        # Metadata is written last, get() only trusts complete entries
+        atomic_write_bytes(content_path, response_json.encode("utf-8"))
+
+        metadata = {
+            "cached_at": datetime.now().isoformat(),
+            "model": model,
+            "content_length": len(response_json),
+            "cache_key": cache_key,
+        }
+
+        atomic_write_bytes(meta_path, jsonutil.dumps_bytes(metadata))
+
+    def clear(self) -> None:
+        """Clear all cached responses"""
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith((".json", ".tmp")):
+                    os.unlink(entry.path)
+
+    def cleanup_expired(self) -> int:
+        """
+        Remove expired cache files.
+
+        Returns:
+            Number of files removed
+        """
+        removed = 0
+        now = datetime.now()
+
+        with os.scandir(self.cache_dir) as entries:
+            meta_files = [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith("_meta.json")
+            ]
+
+        for meta_file in meta_files:
+            try:
+                with open(meta_file, "r") as f:
+                    metadata = json.load(f)
+
+                cached_time = datetime.fromisoformat(metadata["cached_at"])
+                if now - cached_time > self.max_age:
+                    content_path, _ = self._get_cache_paths(metadata["cache_key"])
+
+                    content_path.unlink(missing_ok=True)
+                    meta_file.unlink(missing_ok=True)
+                    removed += 2
+
+            except (json.JSONDecodeError, KeyError, FileNotFoundError):
+                # Remove corrupted metadata files
+                meta_file.unlink(missing_ok=True)
+                removed += 1
+
+        return removed
+
+    def get_cache_info(self) -> Dict[str, Any]:
+        """Get information about cache contents"""
+        content_files = meta_files = total_size = 0
+
+        # DirEntry.stat() reuses data from the directory listing
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith("_meta.json"):
+                    meta_files += 1
+                elif entry.name.endswith(".json"):
+                    content_files += 1
+                    total_size += entry.stat().st_size
+
+        return {
+            "cache_dir": str(self.cache_dir),
+            "content_files": content_files,
+            "meta_files": meta_files,
+            "total_size_bytes": total_size,
+            "total_size_mb": round(total_size / (1024 * 1024), 2),
+        }
@@ -2,9 +2,12 @@
 Retry mechanisms for network operations
 """
 
+import inspect
+import random
+import sys
 import time
 import functools
-from typing import Callable, Any, Type, Tuple
+from typing import Callable, Any, Optional, Type, Tuple
 import requests
 
 
@@ -13,26 +16,43 @@ def retry_on_failure(
     delay: float = 1.0,
     backoff: float = 2.0,
     exceptions: Tuple[Type[Exception], ...] = (requests.RequestException,),
+    session_factory: Optional[Callable[[], requests.Session]] = None,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """
     Decorator to retry function calls on specific exceptions.
 
+    Arguments are passed through unchanged on every attempt, so a
+    requests.Session given by the caller keeps its pooled connections
+    across retries.
+
     Args:
         max_retries: Maximum number of retry attempts
         delay: Initial delay between retries in seconds
         backoff: Multiplier for delay after each retry
         exceptions: Tuple of exception types to catch and retry on
+        session_factory: Called once per decorated call to provide the
+            ``session`` keyword argument when the function accepts one and
+            the caller did not pass it
 
     Returns:
         Decorated function with retry logic
     """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        # Only inject into functions that take a session argument
+        factory = (
+            session_factory if "session" in inspect.signature(func).parameters else None
+        )
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             current_delay = delay
             last_exception = None
 
+            if factory is not None and kwargs.get("session") is None:
+                # One session for all attempts so retries reuse connections
+                kwargs["session"] = factory()
+
             for attempt in range(max_retries + 1):
                 try:
                     return func(*args, **kwargs)
@@ -41,11 +61,9 @@ def retry_on_failure(
                     if attempt == max_retries:
                         raise e
 
-                    import sys
-
-                    print(
-                        f"Attempt {attempt + 1} failed: {e}. Retrying in {current_delay}s...",
-                        file=sys.stderr,
+                    sys.stderr.write(
+                        f"Attempt {attempt + 1} failed: {e}. "
+                        f"Retrying in {current_delay}s...\n"
                     )
                     time.sleep(current_delay)
                     current_delay *= backoff
@@ -60,7 +78,10 @@ def retry_on_failure(
 
 
 def exponential_backoff(
-    attempt: int, base_delay: float = 1.0, max_delay: float = 60.0
+    attempt: int,
+    base_delay: float = 1.0,
+    max_delay: float = 60.0,
+    jitter: bool = False,
 ) -> float:
     """
     Calculate exponential backoff delay.
@@ -69,9 +90,14 @@ def exponential_backoff(
         attempt: Current attempt number (0-based)
         base_delay: Base delay in seconds
         max_delay: Maximum delay in seconds
+        jitter: Return a random delay between 0 and the computed one
+            ("full jitter") so concurrent clients do not retry in lockstep
 
     Returns:
         Delay in seconds
     """
-    delay = base_delay * (2**attempt)
-    return float(min(delay, max_delay))
+    # Shift exponent is capped, larger values are clipped by max_delay anyway
+    delay = min(base_delay * float(1 << min(max(attempt, 0), 30)), max_delay)
+    if jitter:
+        return delay * random.random()
+    return float(delay)
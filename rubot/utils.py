@@ -2,6 +2,7 @@
 Utility functions for rubot
 """
 
+import functools
 import os
 import re
 from datetime import datetime
@@ -9,6 +10,8 @@ from pathlib import Path
 from typing import Dict
 from dotenv import load_dotenv
 
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
 
 def validate_date(date_str: str) -> bool:
     """
@@ -23,14 +26,15 @@ def validate_date(date_str: str) -> bool:
     Raises:
         ValueError: If date format is invalid
     """
-    pattern = r"^\d{4}-\d{2}-\d{2}$"
-    if not re.match(pattern, date_str):
+    # The length check rejects most malformed input without the regex
+    if len(date_str) != 10 or not _DATE_RE.match(date_str):
         raise ValueError(
             f"Invalid date format: {date_str}. Expected YYYY-MM-DD"
         )
 
     try:
-        datetime.strptime(date_str, "%Y-%m-%d")
+        # The format is already checked, the constructor validates the calendar
+        datetime(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:10]))
         return True
     except ValueError:
         raise ValueError(f"Invalid date: {date_str}")
@@ -40,13 +44,21 @@ def load_env_config() -> Dict[str, str]:
     """
     Load configuration from .env file.
 
+    The .env file and environment are read once per process, call
+    _read_env_config.cache_clear() to pick up changes.
+
     Returns:
         Dictionary with configuration values
     """
-    # Load .env file if it exists
-    env_path = Path(".env")
-    if env_path.exists():
-        load_dotenv(env_path)
+    # Copy so callers cannot modify the cached values
+    return dict(_read_env_config())
+
+
+@functools.lru_cache(maxsize=1)
+def _read_env_config() -> Dict[str, str]:
+    """Read the .env file and configuration variables"""
+    # load_dotenv is a no-op when there is no .env file
+    load_dotenv(".env", override=False)
 
     return {
         "OPENROUTER_API_KEY": os.getenv("OPENROUTER_API_KEY") or "",
@@ -64,3 +76,20 @@ def ensure_directory(path: str) -> None:
         path: Directory path
     """
     Path(path).mkdir(parents=True, exist_ok=True)
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    Write data to path so readers never see a partially written file.
+
+    Args:
+        path: Destination file path
+        data: Content to write
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
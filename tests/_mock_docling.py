@@ -0,0 +1,78 @@
+"""
+Lightweight stand-ins for the docling packages used by the tests
+"""
+
+import sys
+import types
+from unittest.mock import MagicMock
+
+
+class DocumentConverter:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def convert(self, *args, **kwargs):
+        result = MagicMock()
+        result.status = ConversionStatus.SUCCESS
+        result.document.export_to_markdown.return_value = "# Mock Markdown"
+        return result
+
+
+class ConversionStatus:
+    SUCCESS = "SUCCESS"
+
+
+class DoclingConfig:
+    def __init__(self, **kwargs):
+        for k, v in kwargs.items():
+            setattr(self, k, v)
+
+
+class ImageRefMode:
+    PLACEHOLDER = "placeholder"
+    EMBEDDED = "embedded"
+    REFERENCED = "referenced"
+
+
+def _module(name, **attrs):
+    """Create a plain module with the given attributes"""
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    return module
+
+
+def install():
+    """
+    Register the docling stand-ins in sys.modules.
+
+    Existing entries are kept, so calling this more than once is a no-op.
+    """
+    modules = {
+        "docling": _module(
+            "docling",
+            DocumentConverter=DocumentConverter,
+            ConversionStatus=ConversionStatus,
+            DoclingConfig=DoclingConfig,
+            ImageRefMode=ImageRefMode,
+        ),
+        "docling.document_converter": _module(
+            "docling.document_converter", DocumentConverter=DocumentConverter
+        ),
+        "docling.datamodel": _module("docling.datamodel"),
+        "docling.datamodel.base_models": _module(
+            "docling.datamodel.base_models", ConversionStatus=ConversionStatus
+        ),
+        "docling_core": _module("docling_core"),
+        "docling_core.types": _module("docling_core.types"),
+        "docling_core.types.doc": _module("docling_core.types.doc"),
+        "docling_core.types.doc.base": _module(
+            "docling_core.types.doc.base", ImageRefMode=ImageRefMode
+        ),
+    }
+
+    for name, module in modules.items():
+        module = sys.modules.setdefault(name, module)
+        # Link submodules to their parents like the import system does
+        parent, _, child = name.rpartition(".")
+        if parent:
+            setattr(sys.modules[parent], child, module)
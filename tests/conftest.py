@@ -2,78 +2,22 @@
 Pytest configuration and fixtures
 """
 
+import dataclasses
 import os
-import sys
 import pytest
 from pathlib import Path
-import tempfile
 from unittest.mock import patch, MagicMock
+from click.testing import CliRunner
 
 
-# Create a clean mock for docling functionality
-class MockDocling:
-    """Simple mock for docling with minimum functionality needed for tests"""
-
-    class DocumentConverter:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        def convert(self, *args, **kwargs):
-            result = MagicMock()
-            result.status = "SUCCESS"
-            result.document = MagicMock()
-            result.document.export_to_markdown.return_value = "# Mock Markdown"
-            return result
-
-    class ConversionStatus:
-        SUCCESS = "SUCCESS"
-
-    class DoclingConfig:
-        def __init__(self, **kwargs):
-            for k, v in kwargs.items():
-                setattr(self, k, v)
-
-    class ImageRefMode:
-        PLACEHOLDER = "placeholder"
-        EMBEDDED = "embedded"
-        REFERENCED = "referenced"
-
-
-# Create a mock for docling_core
-class MockDoclingCore:
-    class types:
-        class doc:
-            class base:
-                class ImageRefMode:
-                    PLACEHOLDER = "placeholder"
-                    EMBEDDED = "embedded"
-                    REFERENCED = "referenced"
-
-
-# Set up mock modules - using MagicMock for flexibility
-mock_docling_module = MagicMock()
-mock_docling_module.DocumentConverter = MockDocling.DocumentConverter
-mock_docling_module.ConversionStatus = MockDocling.ConversionStatus
-mock_docling_module.DoclingConfig = MockDocling.DoclingConfig
-mock_docling_module.ImageRefMode = MockDocling.ImageRefMode
-
-mock_docling_core_module = MagicMock()
-mock_docling_core_module.types = MockDoclingCore.types
-
-sys.modules["docling"] = mock_docling_module  # type: ignore
-sys.modules["docling.document_converter"] = MagicMock()
-sys.modules["docling.document_converter"].DocumentConverter = MockDocling.DocumentConverter
-sys.modules["docling.datamodel"] = MagicMock()
-sys.modules["docling.datamodel.base_models"] = MagicMock()
-sys.modules["docling.datamodel.base_models"].ConversionStatus = MockDocling.ConversionStatus
-sys.modules["docling_core"] = mock_docling_core_module  # type: ignore
-sys.modules["docling_core.types"] = MockDoclingCore.types  # type: ignore
-sys.modules["docling_core.types.doc"] = MockDoclingCore.types.doc  # type: ignore
-sys.modules["docling_core.types.doc.base"] = MockDoclingCore.types.doc.base  # type: ignore
+# Replace docling with lightweight stand-ins before rubot imports it
+from tests._mock_docling import install as _install_docling_mocks
+
+_install_docling_mocks()
 
 from rubot.config import RubotConfig
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 
 class OpenRouterMockResponses:
@@ -182,6 +126,11 @@ class OpenRouterMockClient:
         self.call_count = 0
         self.last_request: Dict[str, Any] = {}
         
+    def reset(self):
+        """Forget recorded requests and go back to the default response"""
+        self.set_single_response(OpenRouterMockResponses.successful_response())
+        self.last_request = {}
+
     def set_responses(self, responses: List[Dict[str, Any]]):
         """Set a sequence of responses to return"""
         self.responses = responses
@@ -192,17 +141,23 @@ class OpenRouterMockClient:
         self.responses = [response]
         self.call_count = 0
         
-    def mock_post(self, url: str, headers: Dict, json: Dict, timeout: int, verify: bool):
-        """Mock the requests.post method"""
-        import requests
-        
-        # Store the request for inspection
+    def mock_post(
+        self,
+        url: str,
+        headers: Dict,
+        timeout: int,
+        data: Optional[bytes] = None,
+        json: Optional[Dict] = None,
+    ):
+        """Mock the session post method used by rubot.llm"""
+        import json as json_module
+
+        # Store the request for inspection, decoding pre-serialized bodies
         self.last_request = {
             'url': url,
             'headers': headers,
-            'json': json,
+            'json': json if data is None else json_module.loads(data),
             'timeout': timeout,
-            'verify': verify
         }
         
         # Get the response to return
@@ -223,6 +178,7 @@ class OpenRouterMockClient:
         mock_response.status_code = 200
         mock_response.raise_for_status.return_value = None
         mock_response.json.return_value = response_data
+        mock_response.content = json_module.dumps(response_data).encode("utf-8")
         mock_response.headers = {'content-type': 'application/json'}
         
         return mock_response
@@ -236,8 +192,21 @@ class OpenRouterMockClient:
         return self.last_request
 
 
+def mock_async_client(handler):
+    """Create an httpx.AsyncClient that answers requests with handler"""
+    import httpx
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.fixture(scope="session")
+def _openrouter_client():
+    """OpenRouter mock client shared by the tests, see mock_openrouter"""
+    return OpenRouterMockClient()
+
+
 @pytest.fixture
-def mock_openrouter():
+def mock_openrouter(_openrouter_client):
     """
     Fixture that provides a configured OpenRouter mock client.
     
@@ -249,32 +218,61 @@ def mock_openrouter():
             )
             
             # Your test code that calls OpenRouter
-            with patch("rubot.llm.requests.post", mock_openrouter.mock_post):
+            with patch("rubot.llm._SESSION.post", mock_openrouter.mock_post):
                 result = process_with_openrouter(...)
     """
-    client = OpenRouterMockClient()
-    # Set default successful response
-    client.set_single_response(OpenRouterMockResponses.successful_response())
-    return client
+    # One client per session, reset to the default successful response
+    _openrouter_client.reset()
+    return _openrouter_client
 
 
 @pytest.fixture
 def mock_openrouter_requests(mock_openrouter):
     """
-    Fixture that automatically patches requests.post with OpenRouter mock.
+    Fixture that automatically patches the OpenRouter session post with the mock.
     
     Usage:
         def test_something(mock_openrouter_requests):
-            # requests.post is already patched
+            # the OpenRouter session post is already patched
             result = process_with_openrouter(...)
             
             # Access the mock if needed
             assert mock_openrouter_requests.get_call_count() == 1
     """
-    with patch("rubot.llm.requests.post", mock_openrouter.mock_post):
+    with patch("rubot.llm._SESSION.post", mock_openrouter.mock_post):
         yield mock_openrouter
 
 
+@pytest.fixture(autouse=True, scope="session")
+def _no_dotenv():
+    """Keep a developer's .env file out of RubotConfig.from_env in all tests"""
+    with patch("rubot.config.load_dotenv", lambda *args, **kwargs: None):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _clear_env_config_cache():
+    """Make every test read its own environment in load_env_config and from_env"""
+    from rubot.utils import _read_env_config
+
+    _read_env_config.cache_clear()
+    RubotConfig.cache_clear()
+    yield
+    _read_env_config.cache_clear()
+    RubotConfig.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def _restore_response_cache(monkeypatch):
+    """Undo configure_response_cache calls made by CLI tests"""
+    import rubot.llm
+
+    monkeypatch.setattr(rubot.llm, "_RESPONSE_CACHE", rubot.llm._RESPONSE_CACHE)
+    monkeypatch.setattr(
+        rubot.llm, "_RESPONSE_CACHE_ENABLED", rubot.llm._RESPONSE_CACHE_ENABLED
+    )
+
+
 @pytest.fixture
 def temp_env():
     """
@@ -297,6 +295,8 @@ def temp_env():
         "OPENROUTER_API_KEY": "test_api_key",
         "DEFAULT_MODEL": "test/model",
         "DEFAULT_SYSTEM_PROMPT": "Test system prompt",
+        # Keep mocked API responses out of the on-disk response cache
+        "RUBOT_RESPONSE_CACHE": "0",
     }
 
     with patch.dict(os.environ, test_env, clear=True):
@@ -308,15 +308,20 @@ def temp_env():
 
 
 @pytest.fixture
-def temp_config(temp_env):
+def env_prompt(monkeypatch):
     """
-    Fixture that provides a RubotConfig instance with test settings.
+    Fixture that sets the system prompt and API key in the environment.
 
-    Usage:
-        def test_something(temp_config):
-            # temp_config is a RubotConfig instance with test settings
-            assert temp_config.default_model == "test/model"
+    Unlike patch.dict, monkeypatch only records and restores the keys it
+    touches instead of copying the whole environment.
     """
+    monkeypatch.setenv("DEFAULT_SYSTEM_PROMPT", "Test system prompt")
+    monkeypatch.setenv("OPENROUTER_API_KEY", "test_api_key")
+
+
+@pytest.fixture(scope="session")
+def _base_config():
+    """RubotConfig with test settings, built once per test session"""
     return RubotConfig(
         openrouter_api_key="test_api_key",
         default_model="test/model",
@@ -345,7 +350,57 @@ def temp_config(temp_env):
 
 
 @pytest.fixture
-def temp_cache_dir():
+def temp_config(temp_env, _base_config):
+    """
+    Fixture that provides a RubotConfig instance with test settings.
+
+    Each test gets a shallow copy of the session-wide config, so changes
+    made by the CLI (e.g. --long-pdf-retries) do not leak between tests.
+
+    Usage:
+        def test_something(temp_config):
+            # temp_config is a RubotConfig instance with test settings
+            assert temp_config.default_model == "test/model"
+    """
+    return dataclasses.replace(_base_config)
+
+
+@pytest.fixture
+def mock_sleep():
+    """
+    Fixture that provides a stand-in for time.sleep.
+
+    Pass it as the sleeper argument of the backoff functions so retries
+    don't wait for real.
+    """
+    return MagicMock()
+
+
+class SleepRecorder:
+    """Stand-in for time.sleep that only records the requested durations"""
+
+    __slots__ = ("calls",)
+
+    def __init__(self) -> None:
+        self.calls: List[float] = []
+
+    def __call__(self, seconds: float) -> None:
+        self.calls.append(seconds)
+
+
+@pytest.fixture
+def sleep_recorder():
+    """
+    Fixture that provides a SleepRecorder.
+
+    Like mock_sleep, but tests compare sleep_recorder.calls with a plain
+    list of durations instead of asserting on mock calls.
+    """
+    return SleepRecorder()
+
+
+@pytest.fixture
+def temp_cache_dir(tmp_path):
     """
     Fixture that provides a temporary directory for cache testing.
 
@@ -355,5 +410,15 @@ def temp_cache_dir():
             cache = PDFCache(temp_cache_dir)
             # Test code here
     """
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield temp_dir
+    return str(tmp_path)
+
+
+@pytest.fixture(scope="session")
+def cli_runner():
+    """
+    Fixture to provide a Click CLI test runner.
+
+    CliRunner keeps no state between invoke() calls, each one sets up its own
+    isolated streams and environment, so a single runner is shared.
+    """
+    return CliRunner()
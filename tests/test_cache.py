@@ -4,6 +4,7 @@ Tests for cache module
 
 import pytest
 import os
+import tempfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 from datetime import datetime, timedelta
@@ -21,15 +22,16 @@ class TestPDFCache:
         assert cache.max_age == timedelta(hours=24)
         assert cache.cache_dir.exists()
 
-    def test_cache_initialization_default_dir(self):
+    def test_cache_initialization_default_dir(self, tmp_path, monkeypatch):
         """Test cache initialization with default directory"""
-        # Use a patch to avoid creating a real cache directory in the default location
-        with patch("pathlib.Path.mkdir"):
-            cache = PDFCache()
+        # Point the system temp dir at tmp_path instead of patching Path.mkdir
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
 
-            assert cache.max_age == timedelta(hours=24)
-            # Just verify the path is set, don't check if it exists
-            assert cache.cache_dir is not None
+        cache = PDFCache()
+
+        assert cache.max_age == timedelta(hours=24)
+        assert cache.cache_dir == tmp_path / "rubot_cache"
+        assert cache.cache_dir.is_dir()
 
     def test_get_cache_key(self, temp_cache_dir):
         """Test cache key generation"""
@@ -41,7 +43,7 @@ class TestPDFCache:
 
         assert key1 == key2  # Same URL should generate same key
         assert key1 != key3  # Different URLs should generate different keys
-        assert len(key1) == 32  # MD5 hash length
+        assert len(key1) == 16  # 8-byte BLAKE2b digest
 
     def test_get_nonexistent_file(self, temp_cache_dir):
         """Test getting non-existent cached file"""
@@ -82,16 +84,17 @@ class TestPDFCache:
         url = "http://example.com/test.pdf"
         cached_path = cache.put(url, str(test_file))
 
-        # Mock file modification time to be 2 hours ago
+        # Set the file modification time to 2 hours ago
         old_time = datetime.now() - timedelta(hours=2)
         old_timestamp = old_time.timestamp()
+        os.utime(cached_path, (old_timestamp, old_timestamp))
 
-        with patch("pathlib.Path.stat") as mock_stat:
-            mock_stat.return_value.st_mtime = old_timestamp
-
+        with patch("rubot.cache.os.stat", wraps=os.stat) as mock_stat:
             result = cache.get(url)
 
-            assert result is None  # Should be None because file is expired
+        assert result is None  # Should be None because file is expired
+        mock_stat.assert_called_once()  # No separate exists() check
+        assert not Path(cached_path).exists()
 
     def test_clear_cache(self, temp_cache_dir):
         """Test clearing all cached files"""
@@ -118,43 +121,25 @@ class TestPDFCache:
 
     def test_cleanup_expired(self, temp_cache_dir):
         """Test cleanup of expired files"""
-        # Let's use a simpler approach - we'll create real files with real timestamps
         cache = PDFCache(temp_cache_dir, max_age_hours=1)
 
         # Create test files
         old_file = cache.cache_dir / "old.pdf"
         new_file = cache.cache_dir / "new.pdf"
+        other_file = cache.cache_dir / "old.txt"
 
         old_file.write_text("old content")
         new_file.write_text("new content")
+        other_file.write_text("not a cached pdf")
+
+        # Age the old files past max_age
+        old_timestamp = (datetime.now() - timedelta(hours=2)).timestamp()
+        os.utime(old_file, (old_timestamp, old_timestamp))
+        os.utime(other_file, (old_timestamp, old_timestamp))
+
+        removed_count = cache.cleanup_expired()
 
-        # Instead of mocking timestamps, let's directly check the implementation
-        # by overriding the max_age to a very small value for the old file
-        # and a very large value for the new file
-
-        # Override the max_age check in the cleanup_expired method
-        original_method = cache.cleanup_expired
-
-        def patched_cleanup():
-            # Force removal of old_file but not new_file
-            removed = 0
-            for cache_file in cache.cache_dir.glob("*.pdf"):
-                if cache_file.name == "old.pdf":
-                    cache_file.unlink()
-                    removed += 1
-            return removed
-
-        # Replace the method temporarily
-        cache.cleanup_expired = patched_cleanup
-
-        try:
-            # Run the cleanup
-            removed_count = cache.cleanup_expired()
-
-            # Verify results
-            assert removed_count == 1
-            assert not old_file.exists()
-            assert new_file.exists()
-        finally:
-            # Restore the original method
-            cache.cleanup_expired = original_method
+        assert removed_count == 1
+        assert not old_file.exists()
+        assert new_file.exists()
+        assert other_file.exists()
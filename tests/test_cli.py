@@ -2,125 +2,104 @@
 Tests for CLI module
 """
 
-import os
-import tempfile
+import click
+import dataclasses
 import pytest
-from click.testing import CliRunner
-from unittest.mock import patch, MagicMock
+from collections import namedtuple
+from unittest.mock import DEFAULT, patch
 
 from rubot.cli import main
-from rubot.config import RubotConfig
+
+
+Mocks = namedtuple("Mocks", "config download convert llm")
 
 
 @pytest.fixture
-def cli_runner():
-    """Fixture to provide a Click CLI test runner"""
-    return CliRunner()
+def mock_pipeline(temp_config, tmp_path):
+    """Patch config loading and every pipeline stage of the CLI"""
+    pdf = tmp_path / "mock.pdf"
+    pdf.write_bytes(b"mock pdf content")
+
+    with (
+        patch(
+            "rubot.cli.RubotConfig.from_env", return_value=temp_config
+        ) as config,
+        patch.multiple(
+            "rubot.cli",
+            download_pdf_with_backoff=DEFAULT,
+            _convert_to_markdown=DEFAULT,
+            process_with_openrouter_backoff=DEFAULT,
+        ) as stages,
+    ):
+        stages["download_pdf_with_backoff"].return_value = str(pdf)
+        stages["_convert_to_markdown"].return_value = (
+            "# Test Markdown\n\nDocling test content"
+        )
+        stages["process_with_openrouter_backoff"].return_value = {
+            "choices": [{"message": {"content": '{"result":"test"}'}}]
+        }
+        yield Mocks(
+            config,
+            stages["download_pdf_with_backoff"],
+            stages["_convert_to_markdown"],
+            stages["process_with_openrouter_backoff"],
+        )
 
 
 class TestCLI:
 
-    @patch("rubot.cli.process_with_openrouter_backoff")
-    @patch("rubot.cli._convert_to_markdown")
-    @patch("rubot.cli.download_pdf_with_backoff")
-    def test_cli_basic_usage(
-        self,
-        mock_download_backoff,
-        mock_convert_markdown,
-        mock_llm_backoff,
-        cli_runner,
-        temp_config,
+    @pytest.mark.parametrize("output_name", [None, "result.json"])
+    def test_cli_runs_pipeline(
+        self, cli_runner, mock_pipeline, tmp_path, output_name
     ):
-        """Test basic CLI usage with Docling"""
-        # Setup mocks
-        with tempfile.NamedTemporaryFile(
-            suffix=".pdf", delete=False
-        ) as tmp_file:
-            tmp_file.write(b"mock pdf content")
-            tmp_path = tmp_file.name
-
-        mock_download_backoff.return_value = tmp_path
-        mock_convert_markdown.return_value = (
-            "# Test Markdown\n\nDocling test content"
-        )
-        mock_llm_backoff.return_value = '{"result": "test"}'
-
-        try:
-            with (
-                patch(
-                    "rubot.cli.RubotConfig.from_env", return_value=temp_config
-                ),
-                patch.dict(
-                    "os.environ", {"DEFAULT_SYSTEM_PROMPT": "test prompt"}
-                ),
-            ):
-                result = cli_runner.invoke(main, ["--date", "2024-01-15"])
-
-                assert result.exit_code == 0
-                mock_download_backoff.assert_called_once()
-                mock_convert_markdown.assert_called_once()
-                mock_llm_backoff.assert_called_once()
-                # The important thing is that the CLI runs successfully
-        finally:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
-
-    @patch("rubot.cli.process_with_openrouter_backoff")
-    @patch("rubot.cli._convert_to_markdown")
-    @patch("rubot.cli.download_pdf_with_backoff")
-    def test_cli_with_output_file(
-        self,
-        mock_download_backoff,
-        mock_convert_markdown,
-        mock_llm_backoff,
-        cli_runner,
-        temp_env,
+        """Test the CLI runs download, conversion and LLM processing"""
+        args = ["--date", "2024-01-15"]
+        if output_name:
+            args += ["--output", str(tmp_path / output_name)]
+
+        result = cli_runner.invoke(main, args)
+
+        assert result.exit_code == 0
+        mock_pipeline.download.assert_called_once()
+        mock_pipeline.convert.assert_called_once()
+        mock_pipeline.llm.assert_called_once()
+        if output_name:
+            assert (tmp_path / output_name).exists()
+
+    def test_cli_model_override_keeps_fallback(
+        self, cli_runner, mock_pipeline, temp_config
     ):
-        """Test CLI with output file using Docling"""
-        with tempfile.NamedTemporaryFile(
-            suffix=".pdf", delete=False
-        ) as tmp_file:
-            tmp_file.write(b"mock pdf content")
-            tmp_path = tmp_file.name
-
-        mock_download_backoff.return_value = tmp_path
-        mock_convert_markdown.return_value = (
-            "# Test Output\n\nDocling output content"
-        )
-        mock_llm_backoff.return_value = (
-            '{"choices":[{"message":{"content":"{\\"result\\":\\"test\\"}"}}]}'
+        """Test --model keeps a fallback that equals the configured default"""
+        temp_config.fallback_model = temp_config.default_model
+
+        result = cli_runner.invoke(
+            main, ["--date", "2024-01-15", "--model", "other/model"]
         )
 
-        try:
-            with cli_runner.isolated_filesystem():
-                with patch.dict("os.environ", temp_env):
-                    result = cli_runner.invoke(
-                        main,
-                        ["--date", "2024-01-15", "--output", "result.json"],
-                    )
-                    assert result.exit_code == 0
-                    # Check that output was created
-                    assert os.path.exists("result.json")
-        finally:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+        assert result.exit_code == 0
+        args = mock_pipeline.llm.call_args.args
+        assert args[2] == "other/model"
+        assert args[7] == temp_config.default_model
 
     def test_cli_invalid_date(self, cli_runner, temp_env):
         """Test CLI with invalid date"""
-        result = cli_runner.invoke(main, ["--date", "invalid-date"])
-        assert result.exit_code == 1
+        # Without standalone mode the Abort is returned instead of sys.exit
+        result = cli_runner.invoke(
+            main, ["--date", "invalid-date"], standalone_mode=False
+        )
+        assert isinstance(result.exception, click.Abort)
 
-    @patch("rubot.cli.download_pdf_with_backoff")
-    def test_cli_download_error(
-        self, mock_download_backoff, cli_runner, temp_config
-    ):
+    def test_cli_download_error(self, cli_runner, mock_pipeline):
         """Test CLI with download error"""
-        mock_download_backoff.side_effect = FileNotFoundError("PDF not found")
+        mock_pipeline.download.side_effect = FileNotFoundError("PDF not found")
 
-        with patch("rubot.cli.RubotConfig.from_env", return_value=temp_config):
-            result = cli_runner.invoke(main, ["--date", "2024-01-15"])
+        result = cli_runner.invoke(
+            main, ["--date", "2024-01-15"], standalone_mode=False
+        )
 
-        assert result.exit_code == 1
+        assert isinstance(result.exception, click.Abort)
+        mock_pipeline.download.assert_called_once()
+        mock_pipeline.convert.assert_not_called()
 
     def test_cli_nonexistent_prompt_file(self, cli_runner, temp_config):
         """Test CLI with nonexistent prompt file fails early before PDF download"""
@@ -138,13 +117,11 @@ class TestCLI:
         assert result.exit_code == 1
         assert "Prompt file not found" in result.output
 
-    def test_cli_nonexistent_default_prompt_file(self, cli_runner):
+    def test_cli_nonexistent_default_prompt_file(self, cli_runner, temp_config):
         """Test CLI with nonexistent default prompt file from config fails early"""
         # Create config with nonexistent default prompt file
-        config_with_bad_prompt = RubotConfig(
-            openrouter_api_key="test_key",
-            default_model="test/model",
-            default_prompt_file="/nonexistent/default_prompt.txt",
+        config_with_bad_prompt = dataclasses.replace(
+            temp_config, default_prompt_file="/nonexistent/default_prompt.txt"
         )
 
         with patch(
@@ -156,28 +133,11 @@ class TestCLI:
         assert result.exit_code == 1
         assert "Prompt file not found" in result.output
 
-    def test_cli_with_system_prompt_env_var(self, cli_runner, temp_config):
+    def test_cli_with_system_prompt_env_var(
+        self, cli_runner, mock_pipeline, env_prompt
+    ):
         """Test CLI works correctly when using DEFAULT_SYSTEM_PROMPT instead of prompt file"""
-        with (
-            patch("rubot.cli.RubotConfig.from_env", return_value=temp_config),
-            patch(
-                "rubot.cli.download_pdf_with_backoff"
-            ) as mock_download_backoff,
-            patch("rubot.cli._convert_to_markdown") as mock_convert,
-            patch(
-                "rubot.cli.process_with_openrouter_backoff"
-            ) as mock_llm_backoff,
-            patch.dict(
-                "os.environ", {"DEFAULT_SYSTEM_PROMPT": "Test system prompt"}
-            ),
-        ):
-
-            # Setup mocks to avoid actual processing
-            mock_download_backoff.return_value = "/tmp/test.pdf"
-            mock_convert.return_value = "# Test content"
-            mock_llm_backoff.return_value = '{"result": "success"}'
-
-            result = cli_runner.invoke(main, ["--date", "2024-01-15"])
+        result = cli_runner.invoke(main, ["--date", "2024-01-15"])
 
         # Should succeed because we're using DEFAULT_SYSTEM_PROMPT, not a file
         assert result.exit_code == 0
@@ -1,26 +1,76 @@
 import tempfile, os
 from rubot import cli
 import logging
-import io, sys
 from rubot.cache import PDFCache
 
+_LOGGER = logging.getLogger("t")
+_LOGGER_LOGCACHE = logging.getLogger("t-logcache")
+_LOGGER_OUTPUT = logging.getLogger("t-output")
+_LOGGER_RESPONSE_CACHE = logging.getLogger("t-response-cache")
+
 
 def test_cleanup_temp_files(tmp_path):
     f = tmp_path / "todelete.txt"
     f.write_text("x")
-    logger = logging.getLogger("t")
-    cli._cleanup_temp_files(None, str(f), logger)
+    cli._cleanup_temp_files(None, str(f), _LOGGER)
     assert not f.exists()
 
 
-def test_log_cache_cleanup_info():
-    logger = logging.getLogger("t-logcache")
-    log_stream = io.StringIO()
-    handler = logging.StreamHandler(log_stream)
-    logger.addHandler(handler)
-    logger.setLevel(logging.INFO)
-    cli._log_cache_cleanup_info(3, False, logger)
-    handler.flush()
-    log_contents = log_stream.getvalue()
-    assert ("3" in log_contents) or ("ENABLED" in log_contents)
-    logger.removeHandler(handler)
+def test_log_cache_cleanup_info(caplog):
+    caplog.set_level(logging.INFO, logger="t-logcache")
+    cli._log_cache_cleanup_info(3, False, _LOGGER_LOGCACHE)
+    assert ("3" in caplog.text) or ("ENABLED" in caplog.text)
+
+
+def test_handle_output_embeds_parsed_content(tmp_path):
+    _LOGGER_OUTPUT.setLevel(logging.INFO)
+    response = {
+        "model": "test/model",
+        "choices": [{"message": {"content": '```json\n{"summary": "Ü"}\n```'}}],
+    }
+    out = tmp_path / "out.json"
+
+    cli._handle_output(response, str(out), _LOGGER_OUTPUT, "2024-01-15", "test/model")
+
+    import json
+
+    written = json.loads(out.read_text(encoding="utf-8"))
+    assert written["choices"][0]["message"]["content"] == {"summary": "Ü"}
+    assert written["model"] == "test/model"
+    # The caller's response is left untouched
+    assert isinstance(response["choices"][0]["message"]["content"], str)
+
+
+def test_setup_response_cache_follows_cache_settings(tmp_path):
+    from rubot import llm
+    from rubot.config import RubotConfig
+
+    app_config = RubotConfig(
+        openrouter_api_key="k", default_model="m", cache_max_age_hours=5
+    )
+
+    cli._setup_response_cache(False, str(tmp_path), app_config, _LOGGER_RESPONSE_CACHE)
+    response_cache = llm._get_response_cache()
+    assert response_cache is not None
+    assert response_cache.cache_dir == tmp_path / "responses"
+    assert response_cache.max_age.total_seconds() == 5 * 3600
+
+    cli._setup_response_cache(True, str(tmp_path), app_config, _LOGGER_RESPONSE_CACHE)
+    assert llm._get_response_cache() is None
+
+
+def test_cleanup_old_cache_files_sweeps_responses(tmp_path, monkeypatch):
+    monkeypatch.delenv("SKIP_CLEANUP", raising=False)
+    responses = tmp_path / "responses"
+    responses.mkdir()
+    old = responses / "old.json"
+    fresh = responses / "fresh.json"
+    old.write_text("{}")
+    fresh.write_text("{}")
+    # Older than the 14 day cutoff
+    os.utime(old, (0, 0))
+
+    cli._cleanup_old_cache_files(str(tmp_path), 14, False, _LOGGER)
+
+    assert not old.exists()
+    assert fresh.exists()
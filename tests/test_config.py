@@ -3,26 +3,56 @@ Tests for config module
 """
 
 import pytest
-import os
-from unittest.mock import patch, mock_open
+import re
+from unittest.mock import MagicMock
 from pathlib import Path
 
 from rubot.config import RubotConfig
 
 
+_MISSING_API_KEY_RE = re.compile(
+    "OPENROUTER_API_KEY environment variable is required"
+)
+_MISSING_MODEL_RE = re.compile("DEFAULT_MODEL environment variable is required")
+
+
+@pytest.fixture
+def isolated_env(monkeypatch):
+    """
+    Fixture that hides the config variables from from_env.
+
+    .env files are already kept out by the session-wide load_dotenv stub in
+    conftest. Tests set the variables they need via the returned monkeypatch.
+    """
+    for name in (
+        "OPENROUTER_API_KEY",
+        "DEFAULT_MODEL",
+        "REQUEST_TIMEOUT",
+        "CACHE_ENABLED",
+        "MAX_PDF_PAGES",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    return monkeypatch
+
+
+@pytest.fixture(scope="module")
+def default_config():
+    """RubotConfig from a minimal environment, shared by read-only tests"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("OPENROUTER_API_KEY", "test_key")
+        mp.setenv("DEFAULT_MODEL", "test/model")
+        return RubotConfig.from_env()
+
+
 class TestRubotConfig:
 
-    @patch.dict(
-        os.environ,
-        {
-            "OPENROUTER_API_KEY": "test_key",
-            "DEFAULT_MODEL": "test_model",
-            "REQUEST_TIMEOUT": "60",
-            "CACHE_ENABLED": "false",
-        },
-    )
-    def test_from_env_with_values(self):
+    def test_from_env_with_values(self, monkeypatch):
         """Test loading config from environment variables"""
+        monkeypatch.setenv("OPENROUTER_API_KEY", "test_key")
+        monkeypatch.setenv("DEFAULT_MODEL", "test_model")
+        monkeypatch.setenv("REQUEST_TIMEOUT", "60")
+        monkeypatch.setenv("CACHE_ENABLED", "false")
+
         config = RubotConfig.from_env()
 
         assert config.openrouter_api_key == "test_key"
@@ -30,78 +60,53 @@ class TestRubotConfig:
         assert config.request_timeout == 60
         assert config.cache_enabled is False
 
-    def test_from_env_missing_api_key(self, temp_env):
-        """Test config loading fails without API key"""
-        # Clear all environment variables
-        temp_env.clear()
-
-        # Add only the model but not the API key
-        temp_env["DEFAULT_MODEL"] = "test/model"
-
-        with patch(
-            "pathlib.Path.exists", return_value=False
-        ):  # Ensure no .env file
-            with patch(
-                "rubot.config.load_dotenv"
-            ):  # Prevent any dotenv loading
-                with pytest.raises(
-                    ValueError,
-                    match="OPENROUTER_API_KEY environment variable is required",
-                ):
-                    RubotConfig.from_env()
-
-    @patch.dict(
-        os.environ,
-        {"OPENROUTER_API_KEY": "test_key", "DEFAULT_MODEL": "test/model"},
+    @pytest.mark.parametrize(
+        "present_var, error_re",
+        [
+            ("DEFAULT_MODEL", _MISSING_API_KEY_RE),
+            ("OPENROUTER_API_KEY", _MISSING_MODEL_RE),
+        ],
     )
-    def test_from_env_defaults(self):
+    def test_from_env_missing_required(self, isolated_env, present_var, error_re):
+        """Test config loading fails when a required variable is missing"""
+        isolated_env.setenv(present_var, "test_value")
+
+        with pytest.raises(ValueError, match=error_re):
+            RubotConfig.from_env()
+
+    def test_from_env_defaults(self, isolated_env):
         """Test config loading with required values and defaults"""
-        with patch(
-            "pathlib.Path.exists", return_value=False
-        ):  # Ensure no .env file
-            with patch(
-                "rubot.config.load_dotenv"
-            ):  # Prevent any dotenv loading
-                config = RubotConfig.from_env()
-
-                assert config.openrouter_api_key == "test_key"
-                assert config.default_model == "test/model"
-                # Note: This may vary based on local environment - CI uses 120, local may use 30
-                assert config.request_timeout in [
-                    30,
-                    120,
-                ]  # Accept both values
-                assert config.cache_enabled is True
-                assert config.max_pdf_pages == 100
-
-    def test_from_env_missing_model(self, temp_env):
-        """Test config loading fails without model"""
-        # Clear all environment variables
-        temp_env.clear()
-
-        # Add only the API key but not the model
-        temp_env["OPENROUTER_API_KEY"] = "test_key"
-
-        with patch(
-            "pathlib.Path.exists", return_value=False
-        ):  # Ensure no .env file
-            with patch(
-                "rubot.config.load_dotenv"
-            ):  # Prevent any dotenv loading
-                with pytest.raises(
-                    ValueError,
-                    match="DEFAULT_MODEL environment variable is required",
-                ):
-                    RubotConfig.from_env()
-
-    @patch.dict(
-        os.environ,
-        {"OPENROUTER_API_KEY": "test_key", "DEFAULT_MODEL": "test/model"},
-    )
-    def test_to_dict_masks_api_key(self):
-        """Test config to_dict masks sensitive information"""
+        isolated_env.setenv("OPENROUTER_API_KEY", "test_key")
+        isolated_env.setenv("DEFAULT_MODEL", "test/model")
+
         config = RubotConfig.from_env()
-        config_dict = config.to_dict()
+
+        assert config.openrouter_api_key == "test_key"
+        assert config.default_model == "test/model"
+        assert config.request_timeout == 120
+        assert config.cache_enabled is True
+        assert config.max_pdf_pages == 100
+
+    def test_from_env_is_cached(self, isolated_env):
+        """Test config is read once until the cache is cleared"""
+        isolated_env.setenv("OPENROUTER_API_KEY", "test_key")
+        isolated_env.setenv("DEFAULT_MODEL", "test/model")
+        config = RubotConfig.from_env()
+        config.max_pdf_pages = 1
+
+        isolated_env.setenv("DEFAULT_MODEL", "other/model")
+        cached = RubotConfig.from_env()
+
+        # Callers get their own copy of the cached config
+        assert cached.default_model == "test/model"
+        assert cached.max_pdf_pages == 100
+
+        RubotConfig.cache_clear()
+        assert RubotConfig.from_env().default_model == "other/model"
+
+    def test_to_dict_masks_api_key(self, default_config):
+        """Test config to_dict masks sensitive information"""
+        config_dict = default_config.to_dict()
 
         assert config_dict["openrouter_api_key"] == "***"
         assert config_dict["default_model"] == "test/model"
@@ -111,15 +116,13 @@ class TestRubotConfig:
         assert "docling_do_table_structure" in config_dict
         assert "docling_model_cache_dir" in config_dict
 
-    @patch("pathlib.Path.exists")
-    @patch("rubot.config.load_dotenv")
-    @patch.dict(
-        os.environ,
-        {"OPENROUTER_API_KEY": "test_key", "DEFAULT_MODEL": "file/model"},
-    )
-    def test_from_env_with_file(self, mock_load_dotenv, mock_exists):
+    def test_from_env_with_file(self, isolated_env):
         """Test config loading with .env file"""
-        mock_exists.return_value = True
+        mock_load_dotenv = MagicMock()
+        isolated_env.setattr(Path, "exists", lambda self: True)
+        isolated_env.setattr("rubot.config.load_dotenv", mock_load_dotenv)
+        isolated_env.setenv("OPENROUTER_API_KEY", "test_key")
+        isolated_env.setenv("DEFAULT_MODEL", "file/model")
 
         config = RubotConfig.from_env("custom.env")
 
@@ -127,19 +130,15 @@ class TestRubotConfig:
         assert config.openrouter_api_key == "test_key"
         assert config.default_model == "file/model"
 
-    @patch.dict(
-        os.environ,
-        {
-            "OPENROUTER_API_KEY": "test_key",
-            "DEFAULT_MODEL": "test/model",
-            "DOCLING_OCR_ENGINE": "tesseract",
-            "DOCLING_DO_OCR": "false",
-            "DOCLING_DO_TABLE_STRUCTURE": "false",
-            "DOCLING_MODEL_CACHE_DIR": "/custom/cache",
-        },
-    )
-    def test_docling_configuration(self):
+    def test_docling_configuration(self, monkeypatch):
         """Test Docling-specific configuration options"""
+        monkeypatch.setenv("OPENROUTER_API_KEY", "test_key")
+        monkeypatch.setenv("DEFAULT_MODEL", "test/model")
+        monkeypatch.setenv("DOCLING_OCR_ENGINE", "tesseract")
+        monkeypatch.setenv("DOCLING_DO_OCR", "false")
+        monkeypatch.setenv("DOCLING_DO_TABLE_STRUCTURE", "false")
+        monkeypatch.setenv("DOCLING_MODEL_CACHE_DIR", "/custom/cache")
+
         config = RubotConfig.from_env()
 
         assert config.docling_ocr_engine == "tesseract"
@@ -147,13 +146,9 @@ class TestRubotConfig:
         assert config.docling_do_table_structure is False
         assert config.docling_model_cache_dir == "/custom/cache"
 
-    @patch.dict(
-        os.environ,
-        {"OPENROUTER_API_KEY": "test_key", "DEFAULT_MODEL": "test/model"},
-    )
-    def test_docling_defaults(self):
+    def test_docling_defaults(self, default_config):
         """Test Docling configuration defaults"""
-        config = RubotConfig.from_env()
+        config = default_config
 
         assert config.docling_ocr_engine == "easyocr"
         assert config.docling_do_ocr is True
@@ -2,12 +2,52 @@
 Tests for Docling converter module
 """
 
+import dataclasses
 import pytest
-import tempfile
-import os
 from unittest.mock import patch, MagicMock
 
-from rubot.docling_converter import DoclingPDFConverter, DoclingConfig
+from docling.datamodel.base_models import ConversionStatus
+
+from rubot.docling_converter import DoclingPDFConverter, DoclingConfig, get_converter
+
+# DoclingConfig is frozen, so tests can share the default instance
+_DEFAULT_CONFIG = DoclingConfig()
+
+
+@pytest.fixture(scope="module")
+def docling_converter():
+    """DoclingPDFConverter around a mocked DocumentConverter, built once"""
+    with patch("rubot.docling_converter.DocumentConverter"):
+        return DoclingPDFConverter(_DEFAULT_CONFIG)
+
+
+@pytest.fixture
+def converter(docling_converter):
+    """Shared converter with the DocumentConverter mock reset for each test"""
+    docling_converter._converter.reset_mock(return_value=True, side_effect=True)
+    return docling_converter
+
+
+@pytest.fixture(scope="session")
+def mock_pdf_path(tmp_path_factory):
+    """Dummy PDF shared by the tests, the converter never reads it"""
+    path = tmp_path_factory.mktemp("pdf") / "mock.pdf"
+    path.write_bytes(b"mock pdf content")
+    return str(path)
+
+
+@pytest.fixture
+def conversion_result():
+    """Successful Docling conversion result with a two page document"""
+    result = MagicMock()
+    result.status = ConversionStatus.SUCCESS
+    result.document.export_to_markdown.return_value = "Test content"
+    # Only len() of the element lists is used, plain objects are enough
+    result.document.pages = [object(), object()]
+    result.document.texts = ["text1"]
+    result.document.tables = []
+    result.document.pictures = []
+    return result
 
 
 class TestDoclingConfig:
@@ -15,7 +55,7 @@ class TestDoclingConfig:
 
     def test_default_config(self):
         """Test default configuration values"""
-        config = DoclingConfig()
+        config = _DEFAULT_CONFIG
         assert config.ocr_engine == "easyocr"
         assert config.do_ocr is True
         assert (
@@ -37,161 +77,88 @@ class TestDoclingConfig:
 class TestDoclingPDFConverter:
     """Test DoclingPDFConverter class"""
 
+    def test_config_is_frozen(self):
+        """Test DoclingConfig instances cannot be modified"""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            _DEFAULT_CONFIG.do_ocr = False
+
     def test_converter_initialization(self):
         """Test DoclingPDFConverter initialization"""
-        config = DoclingConfig()
-        converter = DoclingPDFConverter(config)
-        assert converter.config == config
+        converter = DoclingPDFConverter(_DEFAULT_CONFIG)
+        assert converter.config is _DEFAULT_CONFIG
         assert converter._converter is not None
 
+    @pytest.mark.parametrize("engine", ["easyocr", "tesseract"])
     @patch("rubot.docling_converter.DocumentConverter")
-    def test_create_converter_easyocr(self, mock_converter_class):
-        """Test converter creation with EasyOCR"""
-        config = DoclingConfig(ocr_engine="easyocr")
-        converter = DoclingPDFConverter(config)
-
-        # Verify DocumentConverter was called (may have format_options or fallback to no args)
-        mock_converter_class.assert_called_once()
-
-    @patch("rubot.docling_converter.DocumentConverter")
-    def test_create_converter_tesseract(self, mock_converter_class):
-        """Test converter creation with Tesseract"""
-        config = DoclingConfig(ocr_engine="tesseract")
-        converter = DoclingPDFConverter(config)
+    def test_create_converter(self, mock_converter_class, engine):
+        """Test converter creation for each OCR engine"""
+        DoclingPDFConverter(DoclingConfig(ocr_engine=engine))
 
         # Verify DocumentConverter was called (may have format_options or fallback to no args)
         mock_converter_class.assert_called_once()
 
-    @patch("rubot.docling_converter.DocumentConverter")
-    def test_convert_to_markdown_success(self, mock_converter_class):
+    def test_convert_to_markdown_success(
+        self, converter, conversion_result, mock_pdf_path
+    ):
         """Test successful PDF to markdown conversion"""
-        # Setup mocks
-        from docling.datamodel.base_models import ConversionStatus
-
-        mock_result = MagicMock()
-        mock_result.status = ConversionStatus.SUCCESS
-        mock_result.document.export_to_markdown.return_value = (
+        conversion_result.document.export_to_markdown.return_value = (
             "# Test Markdown\n\nContent here"
         )
-        mock_result.document.pages = [MagicMock(), MagicMock()]  # 2 pages
-        mock_result.document.texts = ["text1", "text2"]
-        mock_result.document.tables = [MagicMock()]
-        mock_result.document.pictures = []
-
-        mock_converter = MagicMock()
-        mock_converter.convert.return_value = mock_result
-        mock_converter_class.return_value = mock_converter
-
-        # Test conversion
-        config = DoclingConfig()
-        converter = DoclingPDFConverter(config)
+        conversion_result.document.texts = ["text1", "text2"]
+        conversion_result.document.tables = [object()]
+        converter._converter.convert.return_value = conversion_result
 
-        with tempfile.NamedTemporaryFile(
-            suffix=".pdf", delete=False
-        ) as tmp_file:
-            tmp_file.write(b"mock pdf content")
-            tmp_path = tmp_file.name
+        result = converter.convert_to_markdown(mock_pdf_path)
 
-        try:
-            result = converter.convert_to_markdown(tmp_path)
+        assert result == "# Test Markdown\n\nContent here"
+        converter._converter.convert.assert_called_once_with(mock_pdf_path)
 
-            assert result == "# Test Markdown\n\nContent here"
-            mock_converter.convert.assert_called_once_with(tmp_path)
-        finally:
-            os.unlink(tmp_path)
-
-    @patch("rubot.docling_converter.DocumentConverter")
-    def test_convert_to_markdown_failure(self, mock_converter_class):
+    def test_convert_to_markdown_failure(self, converter, mock_pdf_path):
         """Test PDF conversion failure handling"""
         mock_result = MagicMock()
         mock_result.status = "FAILURE"
+        converter._converter.convert.return_value = mock_result
 
-        mock_converter = MagicMock()
-        mock_converter.convert.return_value = mock_result
-        mock_converter_class.return_value = mock_converter
+        with pytest.raises(RuntimeError, match="Docling conversion failed"):
+            converter.convert_to_markdown(mock_pdf_path)
+
+    def test_convert_to_markdown_exception(self, converter, mock_pdf_path):
+        """Test PDF conversion with exception"""
+        converter._converter.convert.side_effect = Exception("Test error")
 
-        config = DoclingConfig()
-        converter = DoclingPDFConverter(config)
+        with pytest.raises(RuntimeError, match="PDF conversion failed"):
+            converter.convert_to_markdown(mock_pdf_path)
 
-        with tempfile.NamedTemporaryFile(
-            suffix=".pdf", delete=False
-        ) as tmp_file:
-            tmp_file.write(b"mock pdf content")
-            tmp_path = tmp_file.name
+    def test_log_conversion_stats(
+        self, converter, conversion_result, mock_pdf_path
+    ):
+        """Test conversion statistics logging"""
+        conversion_result.document.pictures = [object()]
+        converter._converter.convert.return_value = conversion_result
 
-        try:
-            with pytest.raises(
-                RuntimeError, match="Docling conversion failed"
-            ):
-                converter.convert_to_markdown(tmp_path)
-        finally:
-            os.unlink(tmp_path)
+        # This should not raise an exception
+        result = converter.convert_to_markdown(mock_pdf_path)
+        assert result == "Test content"
 
-    @patch("rubot.docling_converter.DocumentConverter")
-    def test_convert_to_markdown_exception(self, mock_converter_class):
-        """Test PDF conversion with exception"""
-        mock_converter = MagicMock()
-        mock_converter.convert.side_effect = Exception("Test error")
-        mock_converter_class.return_value = mock_converter
+    def test_file_not_found(self, converter):
+        """Test handling of non-existent PDF file"""
+        converter._converter.convert.side_effect = FileNotFoundError(
+            "File not found"
+        )
 
-        config = DoclingConfig()
-        converter = DoclingPDFConverter(config)
+        with pytest.raises(RuntimeError, match="PDF conversion failed"):
+            converter.convert_to_markdown("/nonexistent/file.pdf")
 
-        with tempfile.NamedTemporaryFile(
-            suffix=".pdf", delete=False
-        ) as tmp_file:
-            tmp_file.write(b"mock pdf content")
-            tmp_path = tmp_file.name
 
-        try:
-            with pytest.raises(RuntimeError, match="PDF conversion failed"):
-                converter.convert_to_markdown(tmp_path)
-        finally:
-            os.unlink(tmp_path)
+class TestGetConverter:
+    """Test the shared converter instance"""
 
+    @patch("rubot.docling_converter._CONVERTER", None)
     @patch("rubot.docling_converter.DocumentConverter")
-    def test_log_conversion_stats(self, mock_converter_class):
-        """Test conversion statistics logging"""
-        from docling.datamodel.base_models import ConversionStatus
+    def test_reuses_converter_for_equal_config(self, mock_converter_class):
+        """Test the converter is only rebuilt when the config changes"""
+        first = get_converter(DoclingConfig())
 
-        mock_result = MagicMock()
-        mock_result.status = ConversionStatus.SUCCESS
-        mock_result.document.export_to_markdown.return_value = "Test content"
-        mock_result.document.pages = [MagicMock(), MagicMock()]
-        mock_result.document.texts = ["text1"]
-        mock_result.document.tables = []
-        mock_result.document.pictures = [MagicMock()]
-
-        mock_converter = MagicMock()
-        mock_converter.convert.return_value = mock_result
-        mock_converter_class.return_value = mock_converter
-
-        config = DoclingConfig()
-        converter = DoclingPDFConverter(config)
-
-        with tempfile.NamedTemporaryFile(
-            suffix=".pdf", delete=False
-        ) as tmp_file:
-            tmp_file.write(b"mock pdf content")
-            tmp_path = tmp_file.name
-
-        try:
-            # This should not raise an exception
-            result = converter.convert_to_markdown(tmp_path)
-            assert result == "Test content"
-        finally:
-            os.unlink(tmp_path)
-
-    def test_file_not_found(self):
-        """Test handling of non-existent PDF file"""
-        config = DoclingConfig()
-        converter = DoclingPDFConverter(config)
-
-        # Mock the DocumentConverter.convert method to raise an exception
-        with patch.object(
-            converter._converter,
-            "convert",
-            side_effect=FileNotFoundError("File not found"),
-        ):
-            with pytest.raises(RuntimeError, match="PDF conversion failed"):
-                converter.convert_to_markdown("/nonexistent/file.pdf")
+        assert get_converter(DoclingConfig()) is first
+        assert get_converter(DoclingConfig(do_ocr=False)) is not first
+        assert mock_converter_class.call_count == 2
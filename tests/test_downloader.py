@@ -7,7 +7,7 @@ import tempfile
 import os
 import requests
 import time
-from unittest.mock import patch, MagicMock, call
+from unittest.mock import patch, MagicMock
 from rubot.downloader import (
     download_pdf,
     download_pdf_with_backoff,
@@ -20,15 +20,16 @@ from rubot.downloader import (
 
 class TestDownloader:
 
-    def test_generate_pdf_url(self):
+    @pytest.mark.parametrize(
+        "date, expected",
+        [
+            ("2024-01-15", "https://ru.muenchen.de/pdf/2024/ru-2024-01-15.pdf"),
+            ("2023-12-25", "https://ru.muenchen.de/pdf/2023/ru-2023-12-25.pdf"),
+        ],
+    )
+    def test_generate_pdf_url(self, date, expected):
         """Test PDF URL generation"""
-        url = generate_pdf_url("2024-01-15")
-        assert url == "https://ru.muenchen.de/pdf/2024/ru-2024-01-15.pdf"
-
-    def test_generate_pdf_url_different_date(self):
-        """Test PDF URL generation with different date"""
-        url = generate_pdf_url("2023-12-25")
-        assert url == "https://ru.muenchen.de/pdf/2023/ru-2023-12-25.pdf"
+        assert generate_pdf_url(date) == expected
 
     def test_validate_date_format(self):
         """Test date format validation"""
@@ -39,6 +40,12 @@ class TestDownloader:
         with pytest.raises(ValueError):
             validate_date_format("invalid-date")
 
+    @pytest.mark.parametrize("date", ["2024-1-5", "2024-02-30", "2024-01-15\n"])
+    def test_validate_date_format_rejects_malformed(self, date):
+        """Test unpadded, impossible and newline-terminated dates are rejected"""
+        with pytest.raises(ValueError, match="Invalid date format"):
+            validate_date_format(date)
+
     def test_validate_pdf_url(self):
         """Test PDF URL validation"""
         validate_pdf_url(
@@ -50,37 +57,89 @@ class TestDownloader:
         with pytest.raises(ValueError):
             validate_pdf_url("https://invalid-domain.com/test.pdf")
 
-    @patch("requests.get")
-    def test_download_pdf_success(self, mock_get):
+    def test_validate_pdf_url_lookalike_host(self):
+        """Test PDF URL validation rejects hosts that only share the prefix"""
+        with pytest.raises(ValueError):
+            validate_pdf_url("https://ru.muenchen.de.example.com/test.pdf")
+
+    def test_session_leaves_retries_to_backoff(self):
+        """Test the shared session does not retry on the urllib3 level"""
+        from rubot.downloader import _SESSION
+
+        adapter = _SESSION.get_adapter("https://ru.muenchen.de/pdf/")
+        assert adapter.max_retries.total == 0
+
+    @patch("rubot.downloader._SESSION.get")
+    def test_download_pdf_success(self, mock_get, monkeypatch, tmp_path):
         """Test successful PDF download"""
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.headers = {"content-type": "application/pdf"}
-        mock_response.iter_content.return_value = [b"pdf content"]
+        mock_response.iter_content.return_value = [b"pdf ", b"content"]
         mock_get.return_value = mock_response
+        # Keep the download inside this test's directory
+        monkeypatch.setenv("CACHE_ROOT", str(tmp_path))
+
+        result = download_pdf("2024-01-15")
+
+        pdf = tmp_path / "downloads" / os.path.basename(result)
+        assert pdf.read_bytes() == b"pdf content"
+        # The body is streamed to disk and the connection released after
+        assert mock_get.call_args.kwargs["stream"] is True
+        mock_response.iter_content.assert_called_once_with(chunk_size=1 << 16)
+        mock_response.close.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "read_error",
+        [
+            requests.exceptions.ChunkedEncodingError("Connection broken"),
+            requests.exceptions.ReadTimeout("Read timed out"),
+        ],
+    )
+    @patch("rubot.downloader._SESSION.get")
+    def test_download_pdf_interrupted_leaves_no_file(
+        self, mock_get, monkeypatch, tmp_path, read_error
+    ):
+        """Test a download failing mid-stream removes its partial file"""
 
-        with patch("tempfile.NamedTemporaryFile") as mock_tmp:
-            mock_file = MagicMock()
-            mock_file.name = "/tmp/test.pdf"
-            mock_tmp.return_value.__enter__.return_value = mock_file
+        def chunks(chunk_size):
+            yield b"pdf "
+            raise read_error
 
-            result = download_pdf("2024-01-15")
-            assert result == "/tmp/test.pdf"
+        mock_response = MagicMock()
+        mock_response.headers = {"content-type": "application/pdf"}
+        mock_response.iter_content.side_effect = chunks
+        mock_get.return_value = mock_response
+        monkeypatch.setenv("CACHE_ROOT", str(tmp_path))
 
-    @patch("requests.get")
-    def test_download_pdf_not_found(self, mock_get):
-        """Test PDF download when file not found"""
+        with pytest.raises(requests.RequestException):
+            download_pdf("2024-01-15")
+
+        assert list((tmp_path / "downloads").iterdir()) == []
+
+    @pytest.mark.parametrize(
+        "status_code, error, message",
+        [
+            (404, FileNotFoundError, "PDF not found"),
+            (403, requests.RequestException, "Access forbidden"),
+            (503, requests.RequestException, r"Server error \(503\)"),
+            (418, requests.RequestException, "HTTP 418"),
+        ],
+    )
+    @patch("rubot.downloader._SESSION.get")
+    def test_download_pdf_http_errors(self, mock_get, status_code, error, message):
+        """Test HTTP error statuses are mapped to the documented exceptions"""
         mock_response = MagicMock()
-        mock_response.status_code = 404
-        http_error = requests.exceptions.HTTPError("404 Not Found")
+        mock_response.status_code = status_code
+        http_error = requests.exceptions.HTTPError(f"{status_code} Error")
         http_error.response = mock_response
         mock_response.raise_for_status.side_effect = http_error
         mock_get.return_value = mock_response
 
-        with pytest.raises(FileNotFoundError):
+        with pytest.raises(error, match=message):
             download_pdf("2024-01-15")
 
-    @patch("requests.get")
+    @patch("rubot.downloader._SESSION.get")
     def test_download_pdf_network_error(self, mock_get):
         """Test PDF download with network error"""
         mock_get.side_effect = Exception("Network error")
@@ -89,23 +148,21 @@ class TestDownloader:
             download_pdf("2024-01-15")
 
     @patch("rubot.downloader.download_pdf")
-    @patch("time.sleep")
     def test_download_pdf_with_backoff_success_first_try(
-        self, mock_sleep, mock_download
+        self, mock_download, sleep_recorder
     ):
         """Test backoff when file is found on first try"""
         mock_download.return_value = "/tmp/test.pdf"
 
-        result = download_pdf_with_backoff("2024-01-15")
+        result = download_pdf_with_backoff("2024-01-15", sleeper=sleep_recorder)
 
         assert result == "/tmp/test.pdf"
         mock_download.assert_called_once_with("2024-01-15", 30)
-        mock_sleep.assert_not_called()
+        assert sleep_recorder.calls == []
 
     @patch("rubot.downloader.download_pdf")
-    @patch("time.sleep")
     def test_download_pdf_with_backoff_success_second_try(
-        self, mock_sleep, mock_download
+        self, mock_download, sleep_recorder
     ):
         """Test backoff when file is found on second try"""
         mock_download.side_effect = [
@@ -113,39 +170,49 @@ class TestDownloader:
             "/tmp/test.pdf",
         ]
 
-        result = download_pdf_with_backoff("2024-01-15")
+        result = download_pdf_with_backoff("2024-01-15", sleeper=sleep_recorder)
 
         assert result == "/tmp/test.pdf"
         assert mock_download.call_count == 2
-        mock_sleep.assert_called_once_with(30)  # 30 seconds (default base_delay)
+        assert sleep_recorder.calls == [30]  # 30 seconds (default base_delay)
 
     @patch("rubot.downloader.download_pdf")
-    @patch("time.sleep")
     def test_download_pdf_with_backoff_all_attempts_fail(
-        self, mock_sleep, mock_download
+        self, mock_download, sleep_recorder
     ):
         """Test backoff when all attempts fail"""
         mock_download.side_effect = FileNotFoundError("PDF not found")
 
-        result = download_pdf_with_backoff("2024-01-15")
+        result = download_pdf_with_backoff("2024-01-15", sleeper=sleep_recorder)
 
         assert result is None
         assert mock_download.call_count == 5  # Initial + 4 retries
-        assert mock_sleep.call_count == 4
         # Verify exponential backoff sleep times (30s base)
-        mock_sleep.assert_has_calls(
-            [
-                call(30),  # 30 seconds
-                call(60),  # 1 minute
-                call(120),  # 2 minutes
-                call(240),  # 4 minutes
-            ]
+        assert sleep_recorder.calls == [
+            30,  # 30 seconds
+            60,  # 1 minute
+            120,  # 2 minutes
+            240,  # 4 minutes
+        ]
+
+    @patch("rubot.retry.random.random", return_value=0.5)
+    @patch("rubot.downloader.download_pdf")
+    def test_download_pdf_with_backoff_jitter(
+        self, mock_download, mock_random, sleep_recorder
+    ):
+        """Test jitter scales each backoff delay by a random factor"""
+        mock_download.side_effect = FileNotFoundError("PDF not found")
+
+        result = download_pdf_with_backoff(
+            "2024-01-15", max_retries=3, sleeper=sleep_recorder, jitter=True
         )
 
+        assert result is None
+        assert sleep_recorder.calls == [15, 30, 60]
+
     @patch("rubot.downloader.download_pdf")
-    @patch("time.sleep")
     def test_download_pdf_with_backoff_custom_params(
-        self, mock_sleep, mock_download
+        self, mock_download, sleep_recorder
     ):
         """Test backoff with custom parameters"""
         mock_download.side_effect = [
@@ -154,42 +221,83 @@ class TestDownloader:
         ]
 
         result = download_pdf_with_backoff(
-            "2024-01-15", timeout=60, max_retries=2, base_delay=120
+            "2024-01-15",
+            timeout=60,
+            max_retries=2,
+            base_delay=120,
+            sleeper=sleep_recorder,
         )
 
         assert result == "/tmp/test.pdf"
         assert mock_download.call_count == 2
-        mock_sleep.assert_called_once_with(120)  # Custom base delay
+        assert sleep_recorder.calls == [120]  # Custom base delay
 
     @patch("rubot.downloader.download_pdf")
-    @patch("time.sleep")
-    def test_download_pdf_with_short_retries(
-        self, mock_sleep, mock_download
-    ):
+    def test_download_pdf_with_short_retries(self, mock_download, sleep_recorder):
         """Test short retries function"""
         mock_download.side_effect = [
             FileNotFoundError("PDF not found"),
             "/tmp/test.pdf",
         ]
 
-        result = download_pdf_with_short_retries("2024-01-15")
+        result = download_pdf_with_short_retries(
+            "2024-01-15", sleeper=sleep_recorder
+        )
 
         assert result == "/tmp/test.pdf"
         assert mock_download.call_count == 2
-        mock_sleep.assert_called_once_with(30)  # 30 seconds base delay
+        assert sleep_recorder.calls == [30]  # 30 seconds base delay
 
     @patch("rubot.downloader.download_pdf")
-    @patch("time.sleep")
     def test_download_pdf_with_backoff_request_exception(
-        self, mock_sleep, mock_download
+        self, mock_download, sleep_recorder
     ):
-        """Test backoff when request exception occurs"""
-        mock_download.side_effect = requests.RequestException(
-            "Connection error"
-        )
+        """Test backoff retries transient connection errors"""
+        mock_download.side_effect = [
+            requests.ConnectionError("Connection error"),
+            "/tmp/test.pdf",
+        ]
 
-        result = download_pdf_with_backoff("2024-01-15")
+        result = download_pdf_with_backoff("2024-01-15", sleeper=sleep_recorder)
+
+        assert result == "/tmp/test.pdf"
+        assert mock_download.call_count == 2
+        assert sleep_recorder.calls == [30]
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            requests.exceptions.InvalidURL("Invalid URL"),
+            requests.RequestException("Access forbidden"),
+        ],
+    )
+    @patch("rubot.downloader.download_pdf")
+    def test_download_pdf_with_backoff_fails_fast(
+        self, mock_download, sleep_recorder, error
+    ):
+        """Test backoff gives up immediately on non-retryable errors"""
+        mock_download.side_effect = error
+
+        result = download_pdf_with_backoff("2024-01-15", sleeper=sleep_recorder)
 
         assert result is None
         mock_download.assert_called_once_with("2024-01-15", 30)
-        mock_sleep.assert_not_called()
+        assert sleep_recorder.calls == []
+
+    @patch("rubot.downloader.download_pdf")
+    def test_download_pdf_with_backoff_server_error(
+        self, mock_download, sleep_recorder
+    ):
+        """Test backoff retries 5xx responses until max retries"""
+        response = MagicMock(status_code=503)
+        mock_download.side_effect = requests.HTTPError(
+            "Server error (503)", response=response
+        )
+
+        result = download_pdf_with_backoff(
+            "2024-01-15", max_retries=2, sleeper=sleep_recorder
+        )
+
+        assert result is None
+        assert mock_download.call_count == 3
+        assert sleep_recorder.calls == [30, 60]
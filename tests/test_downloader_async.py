@@ -0,0 +1,143 @@
+"""
+Tests for concurrent PDF downloads
+"""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from rubot.downloader_async import (
+    _HTTPX_AVAILABLE,
+    download_many,
+    download_pdfs,
+)
+from tests.conftest import mock_async_client
+
+requires_httpx = pytest.mark.skipif(not _HTTPX_AVAILABLE, reason="httpx not installed")
+
+
+def _pdf_response(request):
+    """Answer with the requested file name as PDF body"""
+    import httpx
+
+    return httpx.Response(
+        200,
+        content=request.url.path.encode(),
+        headers={"content-type": "application/pdf"},
+    )
+
+
+@pytest.fixture
+def cache_root(monkeypatch, tmp_path):
+    """Write downloaded PDFs below tmp_path"""
+    monkeypatch.setenv("CACHE_ROOT", str(tmp_path))
+    return tmp_path
+
+
+@requires_httpx
+class TestDownloadMany:
+
+    def test_results_in_input_order(self, cache_root):
+        """Test every date is downloaded and returned in input order"""
+        dates = ["2024-01-15", "2024-01-16", "2024-01-17"]
+
+        with patch(
+            "rubot.downloader_async.create_download_client",
+            return_value=mock_async_client(_pdf_response),
+        ):
+            paths = download_pdfs(dates)
+
+        assert [Path(p).read_bytes() for p in paths] == [
+            f"/pdf/2024/ru-{date}.pdf".encode() for date in dates
+        ]
+        assert all(Path(p).parent == cache_root / "downloads" for p in paths)
+
+    def test_concurrency_cap(self, cache_root):
+        """Test no more than max_concurrency downloads run at once"""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _pdf_response(request)
+
+        dates = [f"2024-01-{day:02d}" for day in range(1, 9)]
+        with patch(
+            "rubot.downloader_async.create_download_client",
+            return_value=mock_async_client(handler),
+        ):
+            paths = asyncio.run(download_many(dates, max_concurrency=2))
+
+        assert None not in paths
+        assert peak == 2
+
+    def test_missing_pdf_is_retried(self, cache_root):
+        """Test a 404 is retried until the PDF appears"""
+        import httpx
+
+        responses = iter([httpx.Response(404), None])
+
+        def handler(request):
+            return next(responses) or _pdf_response(request)
+
+        with patch(
+            "rubot.downloader_async.create_download_client",
+            return_value=mock_async_client(handler),
+        ):
+            paths = download_pdfs(["2024-01-15"], base_delay=0)
+
+        assert paths[0] is not None
+
+    def test_interrupted_download_leaves_no_file(self, cache_root):
+        """Test partial files from failed attempts are removed"""
+        import httpx
+
+        class _BrokenStream(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                yield b"pdf "
+                raise httpx.ReadError("Connection reset")
+
+        def handler(request):
+            return httpx.Response(200, stream=_BrokenStream())
+
+        with patch(
+            "rubot.downloader_async.create_download_client",
+            return_value=mock_async_client(handler),
+        ):
+            paths = download_pdfs(["2024-01-15"], max_retries=2, base_delay=0)
+
+        assert paths == [None]
+        assert list((cache_root / "downloads").iterdir()) == []
+
+    def test_forbidden_fails_fast(self, cache_root):
+        """Test non-retryable errors give up after one request"""
+        import httpx
+
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request)
+            return httpx.Response(403)
+
+        with patch(
+            "rubot.downloader_async.create_download_client",
+            return_value=mock_async_client(handler),
+        ):
+            paths = download_pdfs(["2024-01-15"], base_delay=0)
+
+        assert paths == [None]
+        assert len(requests_seen) == 1
+
+    def test_invalid_date_rejected_upfront(self):
+        """Test a malformed date fails before any download starts"""
+        with patch("rubot.downloader_async.create_download_client") as client:
+            with pytest.raises(ValueError, match="Invalid date format"):
+                download_pdfs(["2024-01-15", "2024-13-45"])
+
+        client.assert_not_called()
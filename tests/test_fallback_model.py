@@ -3,19 +3,18 @@ Tests for fallback model functionality
 """
 
 import pytest
-import json
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 import requests
 
 from rubot.llm import process_with_openrouter_backoff
 from rubot.config import RubotConfig
+from tests.conftest import OpenRouterMockResponses
 
 
 class TestFallbackModel:
 
     @patch("rubot.llm.process_with_openrouter")
-    @patch("rubot.llm.time.sleep")
-    def test_fallback_model_success_after_primary_fails(self, mock_sleep, mock_process):
+    def test_fallback_model_success_after_primary_fails(self, mock_process, mock_sleep):
         """Test fallback model is used when primary model fails all retries"""
         # Mock primary model failures
         primary_failures = [
@@ -26,53 +25,51 @@ class TestFallbackModel:
         ]
         
         # Mock successful fallback response
-        fallback_response = {
-            "choices": [{"message": {"content": "Fallback model response"}}]
-        }
+        fallback_response = OpenRouterMockResponses.successful_response(
+            "Fallback model response"
+        )
         
-        mock_process.side_effect = primary_failures + [json.dumps(fallback_response)]
+        mock_process.side_effect = primary_failures + [fallback_response]
         
         result = process_with_openrouter_backoff(
             "test content",
             None,
             "primary-model",
-            fallback_model="fallback-model"
+            fallback_model="fallback-model",
+            sleeper=mock_sleep,
         )
         
         # Should have made 4 calls to primary model + 1 to fallback
         assert mock_process.call_count == 5
         
         # Verify the result is from fallback model
-        result_json = json.loads(result)
-        assert result_json["choices"][0]["message"]["content"] == "Fallback model response"
+        assert result["choices"][0]["message"]["content"] == "Fallback model response"
 
     @patch("rubot.llm.process_with_openrouter")
-    @patch("rubot.llm.time.sleep")
-    def test_no_fallback_when_primary_succeeds(self, mock_sleep, mock_process):
+    def test_no_fallback_when_primary_succeeds(self, mock_process, mock_sleep):
         """Test fallback model is not used when primary model succeeds"""
-        success_response = {
-            "choices": [{"message": {"content": "Primary model response"}}]
-        }
+        success_response = OpenRouterMockResponses.successful_response(
+            "Primary model response"
+        )
         
-        mock_process.return_value = json.dumps(success_response)
+        mock_process.return_value = success_response
         
         result = process_with_openrouter_backoff(
             "test content",
             None,
             "primary-model",
-            fallback_model="fallback-model"
+            fallback_model="fallback-model",
+            sleeper=mock_sleep,
         )
         
         # Should only make 1 call to primary model
         assert mock_process.call_count == 1
         
         # Verify the result is from primary model
-        result_json = json.loads(result)
-        assert result_json["choices"][0]["message"]["content"] == "Primary model response"
+        assert result["choices"][0]["message"]["content"] == "Primary model response"
 
     @patch("rubot.llm.process_with_openrouter")
-    @patch("rubot.llm.time.sleep")
-    def test_fallback_model_also_fails(self, mock_sleep, mock_process):
+    def test_fallback_model_also_fails(self, mock_process, mock_sleep):
         """Test behavior when both primary and fallback models fail"""
         # All calls fail
         mock_process.side_effect = requests.RequestException("All models unavailable")
@@ -82,15 +79,15 @@ class TestFallbackModel:
                 "test content",
                 None,
                 "primary-model",
-                fallback_model="fallback-model"
+                fallback_model="fallback-model",
+                sleeper=mock_sleep,
             )
         
         # Should have made 4 calls to primary model + 1 to fallback
         assert mock_process.call_count == 5
 
     @patch("rubot.llm.process_with_openrouter")
-    @patch("rubot.llm.time.sleep")
-    def test_no_fallback_model_configured(self, mock_sleep, mock_process):
+    def test_no_fallback_model_configured(self, mock_process, mock_sleep):
         """Test behavior when no fallback model is configured"""
         mock_process.side_effect = requests.RequestException("Primary model unavailable")
         
@@ -99,15 +96,29 @@ class TestFallbackModel:
                 "test content",
                 None,
                 "primary-model",
-                fallback_model=None
+                fallback_model=None,
+                sleeper=mock_sleep,
             )
         
         # Should only make 4 calls to primary model (initial + 3 retries)
         assert mock_process.call_count == 4
 
     @patch("rubot.llm.process_with_openrouter")
-    @patch("rubot.llm.time.sleep")
-    def test_fallback_same_as_primary_skipped(self, mock_sleep, mock_process):
+    def test_no_fallback_success_logs_no_warning(
+        self, mock_process, caplog, mock_sleep
+    ):
+        """Test a successful call without fallback model logs no warning"""
+        mock_process.return_value = OpenRouterMockResponses.successful_response()
+
+        with caplog.at_level("DEBUG", logger="rubot.llm"):
+            process_with_openrouter_backoff(
+                "test content", None, "primary-model", sleeper=mock_sleep
+            )
+
+        assert not [r for r in caplog.records if r.levelname == "WARNING"]
+
+    @patch("rubot.llm.process_with_openrouter")
+    def test_fallback_same_as_primary_skipped(self, mock_process, mock_sleep):
         """Test fallback is skipped when it's the same as primary model"""
         mock_process.side_effect = requests.RequestException("Model unavailable")
         
@@ -116,23 +127,50 @@ class TestFallbackModel:
                 "test content",
                 None,
                 "same-model",
-                fallback_model="same-model"
+                fallback_model="same-model",
+                sleeper=mock_sleep,
             )
         
         # Should only make 4 calls to primary model (no fallback attempt)
         assert mock_process.call_count == 4
 
     @patch("rubot.llm.process_with_openrouter")
-    @patch("rubot.llm.time.sleep")
-    def test_fallback_with_invalid_response(self, mock_sleep, mock_process):
+    def test_fallback_same_as_primary_reported_upfront(
+        self, mock_process, caplog, mock_sleep
+    ):
+        """Test duplicate fallback is reported before the first attempt"""
+        mock_process.side_effect = requests.RequestException("Model unavailable")
+
+        with caplog.at_level("INFO", logger="rubot.llm"):
+            with pytest.raises(requests.RequestException):
+                process_with_openrouter_backoff(
+                    "test content",
+                    None,
+                    "same-model",
+                    fallback_model="same-model",
+                    sleeper=mock_sleep,
+                )
+
+        messages = [record.getMessage() for record in caplog.records]
+        skip_index = next(
+            i for i, m in enumerate(messages) if "skipping fallback" in m
+        )
+        first_attempt_index = next(
+            i for i, m in enumerate(messages) if "first attempt with model" in m
+        )
+        assert skip_index < first_attempt_index
+        assert sum("skipping fallback" in m for m in messages) == 1
+
+    @patch("rubot.llm.process_with_openrouter")
+    def test_fallback_with_invalid_response(self, mock_process, mock_sleep):
         """Test fallback model with invalid response"""
         # Primary model fails
         primary_failures = [requests.RequestException("Primary unavailable")] * 4
         
         # Fallback model returns invalid response (empty content)
-        invalid_response = {"choices": [{"message": {"content": ""}}]}
+        invalid_response = OpenRouterMockResponses.empty_response()
         
-        mock_process.side_effect = primary_failures + [json.dumps(invalid_response)]
+        mock_process.side_effect = primary_failures + [invalid_response]
         
         # Should raise the last exception from primary model attempts (since fallback fails)
         with pytest.raises(requests.RequestException, match="Primary unavailable"):
@@ -140,7 +178,8 @@ class TestFallbackModel:
                 "test content",
                 None,
                 "primary-model",
-                fallback_model="fallback-model"
+                fallback_model="fallback-model",
+                sleeper=mock_sleep,
             )
         
         # Should have made 4 calls to primary model + 1 to fallback
@@ -165,6 +204,17 @@ class TestFallbackModel:
             config = RubotConfig.from_env()
             assert config.fallback_model is None
 
+    def test_config_keeps_fallback_equal_to_default_model(self):
+        """Test the config keeps a fallback that matches the default model"""
+        config = RubotConfig(
+            openrouter_api_key="test-key",
+            default_model="same-model",
+            fallback_model="same-model",
+        )
+        # --model may replace the default model, so only the LLM call
+        # knows whether the fallback duplicates the model it uses
+        assert config.fallback_model == "same-model"
+
     def test_config_to_dict_includes_fallback_model(self):
         """Test that config.to_dict() includes fallback_model"""
         with patch.dict("os.environ", {
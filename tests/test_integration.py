@@ -3,141 +3,111 @@ Integration tests for rubot
 """
 
 import os
-import tempfile
 import pytest
-from unittest.mock import patch, MagicMock
-from click.testing import CliRunner
+from unittest.mock import patch
 
 from rubot.cli import main
+from tests.conftest import OpenRouterMockResponses
 
-
-@pytest.fixture
-def cli_runner():
-    """Fixture to provide a Click CLI test runner"""
-    return CliRunner()
+pytestmark = pytest.mark.integration
 
 
 class TestIntegration:
 
-    def test_full_workflow_success(self, cli_runner, temp_config, mock_openrouter_requests):
+    def test_full_workflow_success(
+        self, cli_runner, temp_config, mock_openrouter_requests, tmp_path
+    ):
         """Test complete workflow from PDF download to LLM processing with Docling"""
-        from tests.conftest import OpenRouterMockResponses
-        
         # Set up structured JSON response
         mock_openrouter_requests.set_single_response(
             OpenRouterMockResponses.structured_json_response()
         )
-        
-        with tempfile.NamedTemporaryFile(
-            suffix=".pdf", delete=False
-        ) as tmp_file:
-            tmp_file.write(b"mock pdf content")
-            tmp_path = tmp_file.name
 
-        try:
+        pdf_path = tmp_path / "in.pdf"
+        pdf_path.write_bytes(b"mock pdf content")
+
+        with (
+            patch(
+                "rubot.cli.download_pdf_with_backoff",
+                return_value=str(pdf_path),
+            ),
+            patch(
+                "rubot.cli._convert_to_markdown",
+                return_value="# Test PDF Content\n\nDocling converted content",
+            ),
+        ):
+
             with (
                 patch(
-                    "rubot.cli.download_pdf_with_backoff",
-                    return_value=tmp_path,
+                    "rubot.cli.RubotConfig.from_env",
+                    return_value=temp_config,
                 ),
-                patch(
-                    "rubot.cli._convert_to_markdown",
-                    return_value="# Test PDF Content\n\nDocling converted content",
+                patch.dict(
+                    "os.environ", {"DEFAULT_SYSTEM_PROMPT": "test prompt"}
                 ),
             ):
+                result = cli_runner.invoke(
+                    main, ["--date", "2024-01-15", "--no-cache"]
+                )
 
-                with (
-                    patch(
-                        "rubot.cli.RubotConfig.from_env",
-                        return_value=temp_config,
-                    ),
-                    patch.dict(
-                        "os.environ", {"DEFAULT_SYSTEM_PROMPT": "test prompt"}
-                    ),
-                ):
-                    result = cli_runner.invoke(
-                        main, ["--date", "2024-01-15", "--no-cache"]
-                    )
-
-                if result.exit_code != 0:
-                    print(f"CLI output: {result.output}")
-                    print(f"Exception: {result.exception}")
-                assert result.exit_code == 0
-                # Verify the OpenRouter API was called
-                assert mock_openrouter_requests.get_call_count() == 1
-
-        finally:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+            if result.exit_code != 0:
+                print(f"CLI output: {result.output}")
+                print(f"Exception: {result.exception}")
+            assert result.exit_code == 0
+            # Verify the OpenRouter API was called
+            assert mock_openrouter_requests.get_call_count() == 1
 
     def test_workflow_with_custom_prompt_and_model(
-        self, cli_runner, temp_config, mock_openrouter_requests
+        self, cli_runner, temp_config, mock_openrouter_requests, tmp_path
     ):
         """Test workflow with custom prompt and model using Docling"""
-        from tests.conftest import OpenRouterMockResponses
-        
         # Set up structured JSON response
         mock_openrouter_requests.set_single_response(
             OpenRouterMockResponses.structured_json_response()
         )
-        
-        with tempfile.NamedTemporaryFile(
-            suffix=".pdf", delete=False
-        ) as tmp_file:
-            tmp_file.write(b"mock pdf content")
-            tmp_path = tmp_file.name
-
-        # Create temporary prompt file
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".txt", delete=False
-        ) as prompt_file:
-            prompt_file.write("Custom test prompt for integration test")
-            prompt_path = prompt_file.name
-
-        try:
+
+        pdf_path = tmp_path / "in.pdf"
+        pdf_path.write_bytes(b"mock pdf content")
+        prompt_path = tmp_path / "prompt.txt"
+        prompt_path.write_text("Custom test prompt for integration test")
+
+        with (
+            patch(
+                "rubot.cli.download_pdf_with_backoff",
+                return_value=str(pdf_path),
+            ),
+            patch(
+                "rubot.cli._convert_to_markdown",
+                return_value="# Custom PDF Content\n\nCustom docling output",
+            ),
+        ):
+
             with (
                 patch(
-                    "rubot.cli.download_pdf_with_backoff",
-                    return_value=tmp_path,
+                    "rubot.cli.RubotConfig.from_env",
+                    return_value=temp_config,
                 ),
-                patch(
-                    "rubot.cli._convert_to_markdown",
-                    return_value="# Custom PDF Content\n\nCustom docling output",
+                patch.dict(
+                    "os.environ", {"DEFAULT_SYSTEM_PROMPT": "test prompt"}
                 ),
             ):
-
-                with (
-                    patch(
-                        "rubot.cli.RubotConfig.from_env",
-                        return_value=temp_config,
-                    ),
-                    patch.dict(
-                        "os.environ", {"DEFAULT_SYSTEM_PROMPT": "test prompt"}
-                    ),
-                ):
-                    result = cli_runner.invoke(
-                        main,
-                        [
-                            "--date",
-                            "2024-01-15",
-                            "--prompt",
-                            prompt_path,
-                            "--model",
-                            "custom-model",
-                        ],
-                    )
-
-                assert result.exit_code == 0
-                # Verify the OpenRouter API was called with custom model
-                assert mock_openrouter_requests.get_call_count() == 1
-                last_request = mock_openrouter_requests.get_last_request()
-                assert last_request["json"]["model"] == "custom-model"
-
-        finally:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
-            if os.path.exists(prompt_path):
-                os.unlink(prompt_path)
+                result = cli_runner.invoke(
+                    main,
+                    [
+                        "--date",
+                        "2024-01-15",
+                        "--prompt",
+                        str(prompt_path),
+                        "--model",
+                        "custom-model",
+                    ],
+                )
+
+            assert result.exit_code == 0
+            # Verify the OpenRouter API was called with custom model
+            assert mock_openrouter_requests.get_call_count() == 1
+            last_request = mock_openrouter_requests.get_last_request()
+            assert last_request["json"]["model"] == "custom-model"
 
     def test_workflow_date_validation_error(self, cli_runner, temp_env):
         """Test workflow with invalid date"""
@@ -150,12 +120,17 @@ class TestIntegration:
             "rubot.cli.download_pdf_with_backoff",
             side_effect=FileNotFoundError("PDF not found for date 2024-01-15"),
         ):
-            with patch(
-                "rubot.cli.RubotConfig.from_env", return_value=temp_config
+            with (
+                patch(
+                    "rubot.cli.RubotConfig.from_env", return_value=temp_config
+                ),
+                patch("rubot.docling_converter.DoclingPDFConverter") as converter,
             ):
                 result = cli_runner.invoke(main, ["--date", "2024-01-15"])
 
         assert result.exit_code == 1
+        # A missing PDF exits before the Docling models are loaded
+        converter.assert_not_called()
 
 
 @pytest.mark.integration_real_api
@@ -183,8 +158,7 @@ class TestRealAPIIntegration:
         )
         
         # Verify we got a valid response
-        import json
-        parsed = json.loads(result)
+        parsed = result
         assert "choices" in parsed
         assert len(parsed["choices"]) > 0
         assert "content" in parsed["choices"][0]["message"]
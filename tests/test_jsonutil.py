@@ -0,0 +1,63 @@
+import json
+from dataclasses import dataclass, field
+from unittest.mock import patch
+
+import pytest
+
+from rubot import jsonutil
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def backend(request):
+    """Run each test with and without orjson"""
+    if request.param and not jsonutil._ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    with patch("rubot.jsonutil._ORJSON_AVAILABLE", request.param):
+        yield
+
+
+def test_roundtrip(backend):
+    data = {"text": "Müllabfuhr", "items": [1, 2.5, None, True]}
+    assert jsonutil.loads(jsonutil.dumps(data)) == data
+    assert jsonutil.loads(jsonutil.dumps(data).encode("utf-8")) == data
+
+
+def test_dumps_keeps_non_ascii(backend):
+    assert "Müllabfuhr" in jsonutil.dumps({"text": "Müllabfuhr"})
+
+
+def test_dumps_indent_matches_stdlib(backend):
+    data = {"a": [1, {"b": "c"}], "d": {}}
+    assert jsonutil.dumps(data, indent=True) == json.dumps(data, indent=2)
+
+
+def test_loads_invalid_raises_json_error(backend):
+    with pytest.raises(json.JSONDecodeError):
+        jsonutil.loads("{not json")
+
+
+def test_dumps_bytes_is_compact_utf8(backend):
+    data = {"text": "Müllabfuhr", "n": [1, 2]}
+    body = jsonutil.dumps_bytes(data)
+    assert isinstance(body, bytes)
+    assert "Müllabfuhr".encode("utf-8") in body
+    assert b"\n" not in body
+    assert json.loads(body) == data
+
+
+@dataclass
+class _Item:
+    name: str
+    tags: list = field(default_factory=list)
+
+
+def test_dumps_dataclass(backend):
+    data = {"items": [_Item("Müllabfuhr", ["a"])]}
+    expected = {"items": [{"name": "Müllabfuhr", "tags": ["a"]}]}
+    assert json.loads(jsonutil.dumps(data)) == expected
+    assert json.loads(jsonutil.dumps_bytes(data)) == expected
+
+
+def test_dumps_unsupported_type_raises(backend):
+    with pytest.raises(TypeError):
+        jsonutil.dumps({"value": object()})
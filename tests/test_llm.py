@@ -5,30 +5,48 @@ Tests for LLM module
 import pytest
 import requests
 import json
+import logging
 import os
+import threading
 import time
-from unittest.mock import patch, mock_open, MagicMock, call
+from unittest.mock import patch, MagicMock, call
 
 from rubot.llm import (
     load_prompt,
     process_with_openrouter,
     process_with_openrouter_backoff,
+    process_with_openrouter_legacy,
     is_valid_openrouter_response,
 )
+from tests.conftest import OpenRouterMockResponses
 
 
 class TestLLM:
 
-    def test_load_prompt_from_file(self):
+    def test_load_prompt_from_file(self, tmp_path):
         """Test loading prompt from file"""
-        mock_content = "This is a test prompt"
+        prompt_file = tmp_path / "test_prompt.txt"
+        prompt_file.write_text("This is a test prompt\n", encoding="utf-8")
 
-        with patch("pathlib.Path.exists", return_value=True):
-            with patch("builtins.open", mock_open(read_data=mock_content)):
-                result = load_prompt("test_prompt.txt")
+        result = load_prompt(str(prompt_file))
 
         assert result == "This is a test prompt"
 
+    def test_load_prompt_cached_until_modified(self, tmp_path):
+        """Test prompt file is only re-read after it changed"""
+        prompt_file = tmp_path / "test_prompt.txt"
+        prompt_file.write_text("First prompt", encoding="utf-8")
+
+        assert load_prompt(str(prompt_file)) == "First prompt"
+        with patch("builtins.open", side_effect=AssertionError("re-read")):
+            assert load_prompt(str(prompt_file)) == "First prompt"
+
+        prompt_file.write_text("Second prompt", encoding="utf-8")
+        mtime = prompt_file.stat().st_mtime + 10
+        os.utime(prompt_file, (mtime, mtime))
+
+        assert load_prompt(str(prompt_file)) == "Second prompt"
+
     def test_load_prompt_from_env(self, temp_env):
         """Test loading prompt from environment variable"""
         temp_env["DEFAULT_SYSTEM_PROMPT"] = "Environment prompt"
@@ -52,8 +70,6 @@ class TestLLM:
 
     def test_process_with_openrouter_success(self, mock_openrouter_requests, temp_env):
         """Test successful OpenRouter API call"""
-        from tests.conftest import OpenRouterMockResponses
-        
         # Set up successful response
         mock_openrouter_requests.set_single_response(
             OpenRouterMockResponses.successful_response("Test response")
@@ -63,10 +79,9 @@ class TestLLM:
             "Test markdown content", None, "test-model"
         )
 
-        # Verify the result is valid JSON
-        parsed_result = json.loads(result)
-        assert "choices" in parsed_result
-        assert parsed_result["choices"][0]["message"]["content"] == "Test response"
+        # Verify the parsed response is returned
+        assert "choices" in result
+        assert result["choices"][0]["message"]["content"] == "Test response"
 
         # Verify API call was made correctly
         assert mock_openrouter_requests.get_call_count() == 1
@@ -74,6 +89,20 @@ class TestLLM:
         assert last_request["json"]["model"] == "test-model"
         assert last_request["json"]["messages"][1]["content"] == "Test markdown content"
 
+    def test_process_with_openrouter_legacy(self, mock_openrouter_requests, temp_env):
+        """Test legacy wrapper returns the JSON string only"""
+        mock_openrouter_requests.set_single_response(
+            OpenRouterMockResponses.successful_response("Test response")
+        )
+
+        result = process_with_openrouter_legacy(
+            "Test markdown content", None, "test-model"
+        )
+
+        assert isinstance(result, str)
+        parsed_result = json.loads(result)
+        assert parsed_result["choices"][0]["message"]["content"] == "Test response"
+
     def test_process_with_openrouter_no_api_key(self, temp_env):
         """Test OpenRouter API call without API key"""
         # Remove the API key from the environment
@@ -87,7 +116,7 @@ class TestLLM:
 
     def test_process_with_openrouter_api_error(self, temp_env):
         """Test OpenRouter API call with error"""
-        with patch("rubot.llm.requests.post") as mock_post:
+        with patch("rubot.llm._SESSION.post") as mock_post:
             mock_post.side_effect = requests.exceptions.RequestException("API Error")
 
             with pytest.raises(
@@ -95,10 +124,18 @@ class TestLLM:
             ):
                 process_with_openrouter("Test content", None, "test-model")
 
+    def test_process_with_openrouter_invalid_json(self, temp_env):
+        """Test a non-JSON response body is reported as ValueError"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b"<html>Bad Gateway</html>"
+
+        with patch("rubot.llm._SESSION.post", return_value=mock_response):
+            with pytest.raises(ValueError, match="Invalid JSON response"):
+                process_with_openrouter("Test content", None, "test-model")
+
     def test_process_with_openrouter_default_model(self, mock_openrouter_requests, temp_env):
         """Test OpenRouter API call with default model from environment"""
-        from tests.conftest import OpenRouterMockResponses
-        
         # Set a custom model in the environment
         temp_env["DEFAULT_MODEL"] = "custom-model"
 
@@ -112,6 +149,192 @@ class TestLLM:
         last_request = mock_openrouter_requests.get_last_request()
         assert last_request["json"]["model"] == "custom-model"
 
+    def test_process_with_openrouter_verbose_hides_api_key(
+        self, mock_openrouter_requests, temp_env, caplog
+    ):
+        """Test verbose logging does not leak the Authorization header"""
+        mock_openrouter_requests.set_single_response(
+            OpenRouterMockResponses.successful_response()
+        )
+
+        with caplog.at_level(logging.DEBUG, logger="rubot.llm"):
+            process_with_openrouter("Test content", None, "test-model", verbose=True)
+
+        assert "X-Title" in caplog.text
+        assert temp_env["OPENROUTER_API_KEY"] not in caplog.text
+
+    def test_process_with_openrouter_verbose_skips_dumps_above_debug(
+        self, mock_openrouter_requests, temp_env, caplog
+    ):
+        """Test verbose output is not built when DEBUG is filtered"""
+        mock_openrouter_requests.set_single_response(
+            OpenRouterMockResponses.successful_response()
+        )
+
+        with caplog.at_level(logging.INFO, logger="rubot.llm"):
+            with patch("rubot.llm.jsonutil.dumps") as mock_dumps:
+                process_with_openrouter(
+                    "Test content", None, "test-model", verbose=True
+                )
+
+        mock_dumps.assert_not_called()
+        assert "OpenRouter API Request" not in caplog.text
+
+    def test_process_with_openrouter_uses_session_headers(
+        self, mock_openrouter_requests, temp_env
+    ):
+        """Test only the Authorization header is sent per request"""
+        from rubot.llm import _SESSION
+        mock_openrouter_requests.set_single_response(
+            OpenRouterMockResponses.successful_response()
+        )
+
+        process_with_openrouter("Test content", None, "test-model")
+
+        last_request = mock_openrouter_requests.get_last_request()
+        assert last_request["headers"] == {
+            "Authorization": f"Bearer {temp_env['OPENROUTER_API_KEY']}"
+        }
+        assert _SESSION.headers["X-Title"] == "rubot CLI Tool"
+        assert _SESSION.get_adapter("https://openrouter.ai").max_retries.total == 0
+
+    def test_session_uses_shared_ssl_context(self):
+        """Test pooled connections verify with the preloaded SSL context"""
+        import ssl
+        from rubot.llm import _SESSION, _SSL_CONTEXT, OPENROUTER_API_URL
+
+        adapter = _SESSION.get_adapter(OPENROUTER_API_URL)
+        pool = adapter.poolmanager.connection_from_url(OPENROUTER_API_URL)
+        conn = pool.ConnectionCls(host="openrouter.ai")
+
+        assert adapter.poolmanager.connection_pool_kw["ssl_context"] is _SSL_CONTEXT
+        assert _SSL_CONTEXT.check_hostname
+        assert _SSL_CONTEXT.verify_mode == ssl.CERT_REQUIRED
+
+        adapter.cert_verify(conn, OPENROUTER_API_URL, True, None)
+        assert conn.ca_certs is None
+
+    def test_process_with_openrouter_response_cache(
+        self, mock_openrouter_requests, temp_env, tmp_path
+    ):
+        """Test identical requests are answered from the response cache"""
+        from rubot.response_cache import ResponseCache
+        temp_env["RUBOT_RESPONSE_CACHE"] = "1"
+        mock_openrouter_requests.set_responses(
+            [
+                OpenRouterMockResponses.successful_response("Cached response"),
+                OpenRouterMockResponses.successful_response("Fresh response"),
+            ]
+        )
+
+        with patch(
+            "rubot.llm._RESPONSE_CACHE", ResponseCache(cache_dir=str(tmp_path))
+        ):
+            first = process_with_openrouter("Test content", None, "test-model")
+            second = process_with_openrouter("Test content", None, "test-model")
+            other = process_with_openrouter("Other content", None, "test-model")
+
+        assert mock_openrouter_requests.get_call_count() == 2
+        assert second == first
+        assert other["choices"][0]["message"]["content"] == "Fresh response"
+
+    def test_process_with_openrouter_corrupt_cache_entry(
+        self, mock_openrouter_requests, temp_env, tmp_path
+    ):
+        """Test a damaged cached response is dropped and the API asked again"""
+        from rubot.response_cache import ResponseCache
+
+        temp_env["RUBOT_RESPONSE_CACHE"] = "1"
+        mock_openrouter_requests.set_responses(
+            [
+                OpenRouterMockResponses.successful_response("First response"),
+                OpenRouterMockResponses.successful_response("Fresh response"),
+            ]
+        )
+
+        with patch(
+            "rubot.llm._RESPONSE_CACHE", ResponseCache(cache_dir=str(tmp_path))
+        ):
+            process_with_openrouter("Test content", None, "test-model")
+            for path in tmp_path.glob("*.json"):
+                if not path.name.endswith("_meta.json"):
+                    path.write_text('{"choices": [')
+            result = process_with_openrouter("Test content", None, "test-model")
+
+        assert mock_openrouter_requests.get_call_count() == 2
+        assert result["choices"][0]["message"]["content"] == "Fresh response"
+
+    def test_process_with_openrouter_unusable_cache_dir(
+        self, mock_openrouter_requests, temp_env
+    ):
+        """Test an uncreatable cache directory disables the cache, not the call"""
+        temp_env["RUBOT_RESPONSE_CACHE"] = "1"
+        mock_openrouter_requests.set_responses(
+            [OpenRouterMockResponses.successful_response("Fresh response")]
+        )
+
+        with patch("rubot.llm._RESPONSE_CACHE", None), patch(
+            "rubot.llm._RESPONSE_CACHE_ENABLED", True
+        ), patch(
+            "rubot.llm.ResponseCache", side_effect=PermissionError("read-only")
+        ):
+            result = process_with_openrouter("Test content", None, "test-model")
+
+        assert mock_openrouter_requests.get_call_count() == 1
+        assert result["choices"][0]["message"]["content"] == "Fresh response"
+
+    def test_process_with_openrouter_cache_read_error(
+        self, mock_openrouter_requests, temp_env, tmp_path
+    ):
+        """Test a failing cache read falls through to the API"""
+        from rubot.response_cache import ResponseCache
+
+        temp_env["RUBOT_RESPONSE_CACHE"] = "1"
+        mock_openrouter_requests.set_responses(
+            [OpenRouterMockResponses.successful_response("Fresh response")]
+        )
+        cache = ResponseCache(cache_dir=str(tmp_path))
+
+        with patch("rubot.llm._RESPONSE_CACHE", cache), patch.object(
+            cache, "get", side_effect=OSError("I/O error")
+        ):
+            result = process_with_openrouter("Test content", None, "test-model")
+
+        assert mock_openrouter_requests.get_call_count() == 1
+        assert result["choices"][0]["message"]["content"] == "Fresh response"
+
+    @pytest.mark.parametrize(
+        "model,cacheable",
+        [
+            ("anthropic/claude-sonnet-4", True),
+            ("google/gemini-2.5-pro", True),
+            ("openai/gpt-4o", False),
+            ("test-model", False),
+        ],
+    )
+    def test_process_with_openrouter_prompt_cache_control(
+        self, mock_openrouter_requests, temp_env, model, cacheable
+    ):
+        """Test cache_control is only added for models that need it"""
+        mock_openrouter_requests.set_single_response(
+            OpenRouterMockResponses.successful_response()
+        )
+
+        process_with_openrouter("Test content", None, model)
+
+        messages = mock_openrouter_requests.get_last_request()["json"]["messages"]
+        assert messages[1] == {"role": "user", "content": "Test content"}
+        if cacheable:
+            assert messages[0]["content"] == [
+                {
+                    "type": "text",
+                    "text": "Test system prompt",
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
+        else:
+            assert messages[0]["content"] == "Test system prompt"
+
     def test_is_valid_openrouter_response(self):
         """Test the is_valid_openrouter_response function"""
         # Valid response
@@ -120,6 +343,12 @@ class TestLLM:
         }
         assert is_valid_openrouter_response(valid_response) is True
 
+        # Leading whitespace is fine as long as there is real content
+        padded_response = {
+            "choices": [{"message": {"content": " " * 100 + "\ncontent"}}]
+        }
+        assert is_valid_openrouter_response(padded_response) is True
+
         # Invalid responses
         invalid_responses = [
             {},  # Empty response
@@ -129,25 +358,57 @@ class TestLLM:
             {
                 "choices": [{"message": {"content": "   "}}]
             },  # Whitespace content
+            {
+                "choices": [{"message": {"content": " \n\t" * 100}}]
+            },  # Long whitespace content
         ]
 
         for response in invalid_responses:
             assert is_valid_openrouter_response(response) is False
 
-    @patch("time.sleep")
+    @pytest.mark.parametrize("body", [[], "text", None])
+    def test_is_valid_openrouter_response_not_an_object(self, body):
+        """Test decoded bodies other than a JSON object are invalid"""
+        assert is_valid_openrouter_response(body) is False
+
+    def test_process_with_openrouter_backoff_list_body(self, temp_env, mock_sleep):
+        """Test a JSON list body is retried and reported as invalid content"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.raise_for_status.return_value = None
+        mock_response.content = b"[]"
+
+        with patch("rubot.llm._SESSION.post", return_value=mock_response) as post:
+            with pytest.raises(ValueError, match="Empty or invalid content"):
+                process_with_openrouter_backoff(
+                    "Test content", None, "test-model", sleeper=mock_sleep
+                )
+
+        assert post.call_count == 4
+
+    def test_is_valid_openrouter_response_raw_body(self):
+        """Test validation of undecoded response bodies"""
+        body = json.dumps(
+            {"choices": [{"message": {"content": "Valid"}}]}
+        ).encode("utf-8")
+        assert is_valid_openrouter_response(body) is True
+        assert is_valid_openrouter_response(body.decode("utf-8")) is True
+        assert is_valid_openrouter_response(b'{"choices": []}') is False
+        assert is_valid_openrouter_response(b"[1, 2]") is False
+        assert is_valid_openrouter_response(b"<html>") is False
+
     def test_process_with_openrouter_backoff_success_first_try(
-        self, mock_sleep, mock_openrouter_requests, temp_env
+        self, mock_openrouter_requests, temp_env, mock_sleep
     ):
         """Test backoff when first try succeeds"""
-        from tests.conftest import OpenRouterMockResponses
-        
         # Mock successful response
         mock_openrouter_requests.set_single_response(
             OpenRouterMockResponses.successful_response("Valid response")
         )
 
         result = process_with_openrouter_backoff(
-            "Test content", None, "test-model"
+            "Test content", None, "test-model",
+            sleeper=mock_sleep,
         )
 
         # Should succeed on first try
@@ -155,16 +416,12 @@ class TestLLM:
         mock_sleep.assert_not_called()
 
         # Result should be valid
-        parsed = json.loads(result)
-        assert parsed["choices"][0]["message"]["content"] == "Valid response"
+        assert result["choices"][0]["message"]["content"] == "Valid response"
 
-    @patch("time.sleep")
     def test_process_with_openrouter_backoff_empty_response_then_success(
-        self, mock_sleep, mock_openrouter_requests, temp_env
+        self, mock_openrouter_requests, temp_env, mock_sleep
     ):
         """Test backoff when first response is empty, second succeeds"""
-        from tests.conftest import OpenRouterMockResponses
-        
         # First response is empty, second is valid
         mock_openrouter_requests.set_responses([
             OpenRouterMockResponses.empty_response(),
@@ -172,7 +429,8 @@ class TestLLM:
         ])
 
         result = process_with_openrouter_backoff(
-            "Test content", None, "test-model"
+            "Test content", None, "test-model",
+            sleeper=mock_sleep,
         )
 
         # Should be called twice
@@ -180,16 +438,12 @@ class TestLLM:
         mock_sleep.assert_called_once_with(30)  # Should sleep for 30 seconds on first retry
 
         # Result should be valid
-        parsed = json.loads(result)
-        assert parsed["choices"][0]["message"]["content"] == "Valid response"
+        assert result["choices"][0]["message"]["content"] == "Valid response"
 
-    @patch("time.sleep")
     def test_process_with_openrouter_backoff_all_attempts_fail(
-        self, mock_sleep, mock_openrouter_requests, temp_env
+        self, mock_openrouter_requests, temp_env, mock_sleep
     ):
         """Test backoff when all attempts fail with empty responses"""
-        from tests.conftest import OpenRouterMockResponses
-        
         # All responses are empty
         mock_openrouter_requests.set_single_response(
             OpenRouterMockResponses.empty_response()
@@ -198,7 +452,9 @@ class TestLLM:
         with pytest.raises(
             ValueError, match="Empty or invalid content in OpenRouter response"
         ):
-            process_with_openrouter_backoff("Test content", None, "test-model")
+            process_with_openrouter_backoff(
+                "Test content", None, "test-model", sleeper=mock_sleep
+            )
 
         # Should be called 4 times (initial + 3 retries)
         assert mock_openrouter_requests.get_call_count() == 4
@@ -213,13 +469,10 @@ class TestLLM:
             ]
         )
 
-    @patch("time.sleep")
     def test_process_with_openrouter_backoff_exception_then_success(
-        self, mock_sleep, temp_env
+        self, temp_env, mock_sleep
     ):
         """Test backoff when first attempt throws exception, second succeeds"""
-        from tests.conftest import OpenRouterMockResponses
-        
         call_count = 0
         def mock_post_side_effect(*args, **kwargs):
             nonlocal call_count
@@ -231,12 +484,15 @@ class TestLLM:
                 mock_response = MagicMock()
                 mock_response.status_code = 200
                 mock_response.raise_for_status.return_value = None
-                mock_response.json.return_value = OpenRouterMockResponses.successful_response("Valid response")
+                mock_response.content = json.dumps(
+                    OpenRouterMockResponses.successful_response("Valid response")
+                ).encode("utf-8")
                 return mock_response
 
-        with patch("rubot.llm.requests.post", side_effect=mock_post_side_effect):
+        with patch("rubot.llm._SESSION.post", side_effect=mock_post_side_effect):
             result = process_with_openrouter_backoff(
-                "Test content", None, "test-model"
+                "Test content", None, "test-model",
+                sleeper=mock_sleep,
             )
 
         # Should be called twice - first call fails, second succeeds
@@ -245,22 +501,43 @@ class TestLLM:
         mock_sleep.assert_called_once_with(30)
 
         # Result should be valid
-        parsed = json.loads(result)
-        assert parsed["choices"][0]["message"]["content"] == "Valid response"
+        assert result["choices"][0]["message"]["content"] == "Valid response"
 
-    @patch("time.sleep")
     def test_process_with_openrouter_backoff_all_exceptions(
-        self, mock_sleep, temp_env
+        self, temp_env, mock_sleep
     ):
         """Test backoff when all attempts throw exceptions"""
-        with patch("rubot.llm.requests.post") as mock_post:
+        with patch("rubot.llm._SESSION.post") as mock_post:
             mock_post.side_effect = requests.RequestException("API Error")
 
             with pytest.raises(requests.RequestException):
-                process_with_openrouter_backoff("Test content", None, "test-model")
+                process_with_openrouter_backoff(
+                    "Test content", None, "test-model", sleeper=mock_sleep
+                )
 
             # Should be called 4 times total (initial + 3 retries)
             assert mock_post.call_count == 4
             # process_with_openrouter_backoff will sleep 3 times with progressive delays
             assert mock_sleep.call_count == 3
             mock_sleep.assert_has_calls([call(30), call(60), call(120)])
+
+    def test_process_with_openrouter_backoff_cancelled(self, temp_env):
+        """Test a set cancel event aborts the retry wait immediately"""
+        cancel_event = threading.Event()
+        cancel_event.set()
+
+        with patch("rubot.llm._SESSION.post") as mock_post:
+            mock_post.side_effect = requests.RequestException("API Error")
+
+            start = time.monotonic()
+            with pytest.raises(KeyboardInterrupt):
+                process_with_openrouter_backoff(
+                    "Test content",
+                    None,
+                    "test-model",
+                    cancel_event=cancel_event,
+                )
+
+            # Only the first attempt runs, the 30s wait is skipped
+            assert mock_post.call_count == 1
+            assert time.monotonic() - start < 5
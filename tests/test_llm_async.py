@@ -0,0 +1,320 @@
+"""
+Tests for concurrent OpenRouter processing
+"""
+
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+from rubot.llm_async import (
+    DEFAULT_MAX_CONCURRENCY,
+    _HTTPX_AVAILABLE,
+    _RateLimiter,
+    get_max_concurrency,
+    process_many_with_openrouter,
+    process_with_openrouter_batch,
+)
+from tests.conftest import OpenRouterMockResponses, mock_async_client
+
+requires_httpx = pytest.mark.skipif(not _HTTPX_AVAILABLE, reason="httpx not installed")
+
+
+class TestMaxConcurrency:
+
+    def test_default(self, temp_env):
+        """Test default concurrency when the env var is unset"""
+        assert get_max_concurrency() == DEFAULT_MAX_CONCURRENCY
+
+    def test_from_env(self, temp_env):
+        """Test concurrency read from RUBOT_MAX_CONCURRENCY"""
+        temp_env["RUBOT_MAX_CONCURRENCY"] = "3"
+        assert get_max_concurrency() == 3
+
+    @pytest.mark.parametrize("value", ["abc", "0", "-2"])
+    def test_invalid(self, temp_env, value):
+        """Test invalid RUBOT_MAX_CONCURRENCY values are rejected"""
+        temp_env["RUBOT_MAX_CONCURRENCY"] = value
+        with pytest.raises(ValueError, match="RUBOT_MAX_CONCURRENCY"):
+            get_max_concurrency()
+
+
+class TestRateLimiter:
+
+    def test_spaces_requests(self):
+        """Test request starts are spaced by the rpm interval"""
+        limiter = _RateLimiter(rpm=1200)  # 50ms interval
+
+        async def _acquire_three() -> float:
+            start = time.monotonic()
+            for _ in range(3):
+                await limiter.acquire()
+            return time.monotonic() - start
+
+        assert asyncio.run(_acquire_three()) >= 0.09
+
+
+@requires_httpx
+class TestProcessMany:
+
+    def test_results_in_input_order(self, temp_env):
+        """Test results are returned in the order of the inputs"""
+
+        def handler(request):
+            import httpx
+
+            content = json.loads(request.content)["messages"][1]["content"]
+            return httpx.Response(
+                200, json=OpenRouterMockResponses.successful_response(content)
+            )
+
+        contents = [f"doc {i}" for i in range(5)]
+        with patch(
+            "rubot.llm_async.create_async_client",
+            return_value=mock_async_client(handler),
+        ):
+            results = asyncio.run(
+                process_many_with_openrouter(
+                    contents, None, "test-model", max_concurrency=2
+                )
+            )
+
+        assert [r["choices"][0]["message"]["content"] for r in results] == contents
+
+    def test_failures_are_returned(self, temp_env):
+        """Test per-document errors do not abort the batch"""
+        import requests
+
+        def handler(request):
+            import httpx
+
+            content = json.loads(request.content)["messages"][1]["content"]
+            if content == "bad":
+                return httpx.Response(429)
+            return httpx.Response(
+                200, json=OpenRouterMockResponses.successful_response(content)
+            )
+
+        with patch(
+            "rubot.llm_async.create_async_client",
+            return_value=mock_async_client(handler),
+        ):
+            results = asyncio.run(
+                process_many_with_openrouter(["good", "bad"], None, "test-model")
+            )
+
+        assert isinstance(results[0], dict)
+        assert isinstance(results[1], requests.RequestException)
+        assert "rate limit" in str(results[1])
+        assert isinstance(results[1].response, requests.Response)
+        assert results[1].response.status_code == 429
+
+    def test_rate_limited_document_is_retried(self, temp_env):
+        """Test max_retries retries a 429 and keeps the other results"""
+        import httpx
+        from unittest.mock import AsyncMock
+
+        attempts = {"bad": 0}
+
+        def handler(request):
+            content = json.loads(request.content)["messages"][1]["content"]
+            if content == "bad":
+                attempts["bad"] += 1
+                if attempts["bad"] == 1:
+                    return httpx.Response(429, headers={"Retry-After": "3"})
+            return httpx.Response(
+                200, json=OpenRouterMockResponses.successful_response(content)
+            )
+
+        sleep = AsyncMock()
+        with (
+            patch(
+                "rubot.llm_async.create_async_client",
+                return_value=mock_async_client(handler),
+            ),
+            patch("rubot.llm_async.asyncio.sleep", sleep),
+        ):
+            results = asyncio.run(
+                process_many_with_openrouter(
+                    ["good", "bad"], None, "test-model", max_retries=1
+                )
+            )
+
+        assert [r["choices"][0]["message"]["content"] for r in results] == [
+            "good",
+            "bad",
+        ]
+        assert attempts["bad"] == 2
+        sleep.assert_awaited_once_with(3.0)
+
+    def test_invalid_concurrency(self, temp_env):
+        """Test max_concurrency must be positive"""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            asyncio.run(
+                process_many_with_openrouter(
+                    ["doc"], None, "test-model", max_concurrency=0
+                )
+            )
+
+
+@requires_httpx
+class TestProcessBatch:
+
+    def test_invalid_rows_reported(self, temp_env):
+        """Test rows with empty content are reported as ValueError"""
+
+        def handler(request):
+            import httpx
+
+            content = json.loads(request.content)["messages"][1]["content"]
+            if content == "empty":
+                return httpx.Response(
+                    200, json=OpenRouterMockResponses.empty_response()
+                )
+            return httpx.Response(
+                200, json=OpenRouterMockResponses.successful_response(content)
+            )
+
+        with patch(
+            "rubot.llm_async.create_async_client",
+            return_value=mock_async_client(handler),
+        ):
+            results = process_with_openrouter_batch(
+                ["first", "empty"], None, "test-model"
+            )
+
+        assert isinstance(results[0], dict)
+        assert isinstance(results[1], ValueError)
+        assert "document 1" in str(results[1])
+
+    def test_fallback_model(self, temp_env):
+        """Test fallback_model answers documents the primary model failed"""
+        import httpx
+
+        def handler(request):
+            model = json.loads(request.content)["model"]
+            if model == "test-model":
+                return httpx.Response(429)
+            return httpx.Response(
+                200, json=OpenRouterMockResponses.successful_response(model)
+            )
+
+        with (
+            patch(
+                "rubot.llm_async.create_async_client",
+                return_value=mock_async_client(handler),
+            ),
+            patch("rubot.llm_async.asyncio.sleep"),
+        ):
+            results = process_with_openrouter_batch(
+                ["first", "second"],
+                None,
+                "test-model",
+                fallback_model="fallback-model",
+            )
+
+        assert [r["choices"][0]["message"]["content"] for r in results] == [
+            "fallback-model",
+            "fallback-model",
+        ]
+
+
+@requires_httpx
+class TestAsyncBackoff:
+
+    def _run(self, handler, **kwargs):
+        from unittest.mock import AsyncMock
+        from rubot.llm_async import aprocess_with_openrouter_backoff
+
+        sleep = AsyncMock()
+
+        async def _call():
+            async with mock_async_client(handler) as client:
+                return await aprocess_with_openrouter_backoff(
+                    client, "Test content", None, "primary-model", **kwargs
+                )
+
+        with patch("rubot.llm_async.asyncio.sleep", sleep):
+            return asyncio.run(_call()), sleep
+
+    def test_retries_with_jitter(self, temp_env):
+        """Test retry delays use decorrelated jitter within bounds"""
+        import random
+        import httpx
+        from rubot.llm_async import BACKOFF_BASE, BACKOFF_CAP
+
+        responses = iter(
+            [httpx.Response(500)] * 3
+            + [
+                httpx.Response(
+                    200, json=OpenRouterMockResponses.successful_response("ok")
+                )
+            ]
+        )
+
+        result, sleep = self._run(
+            lambda request: next(responses), rng=random.Random(42)
+        )
+
+        assert result["choices"][0]["message"]["content"] == "ok"
+        delays = [c.args[0] for c in sleep.await_args_list]
+        assert len(delays) == 3
+        assert all(BACKOFF_BASE <= d <= BACKOFF_CAP for d in delays)
+
+    def test_honours_retry_after(self, temp_env):
+        """Test a Retry-After header sets the wait time"""
+        import httpx
+
+        responses = iter(
+            [
+                httpx.Response(429, headers={"Retry-After": "7"}),
+                httpx.Response(200, json=OpenRouterMockResponses.successful_response()),
+            ]
+        )
+
+        _, sleep = self._run(lambda request: next(responses))
+
+        sleep.assert_awaited_once_with(7.0)
+
+    def test_retry_after_is_capped(self, temp_env):
+        """Test an excessive Retry-After header is clamped to BACKOFF_CAP"""
+        import httpx
+        from rubot.llm_async import BACKOFF_CAP
+
+        responses = iter(
+            [
+                httpx.Response(429, headers={"Retry-After": "86400"}),
+                httpx.Response(200, json=OpenRouterMockResponses.successful_response()),
+            ]
+        )
+
+        _, sleep = self._run(lambda request: next(responses))
+
+        sleep.assert_awaited_once_with(BACKOFF_CAP)
+
+    def test_falls_back_after_retries(self, temp_env):
+        """Test the fallback model is tried once after the primary model"""
+        import httpx
+
+        def handler(request):
+            model = json.loads(request.content)["model"]
+            if model == "primary-model":
+                return httpx.Response(503)
+            return httpx.Response(
+                200, json=OpenRouterMockResponses.successful_response(model)
+            )
+
+        result, sleep = self._run(handler, fallback_model="fallback-model")
+
+        assert result["choices"][0]["message"]["content"] == "fallback-model"
+        assert sleep.await_count == 4
+
+    def test_raises_last_error(self, temp_env):
+        """Test the last error is raised when every attempt fails"""
+        import httpx
+        import requests
+
+        with pytest.raises(requests.RequestException, match="server error"):
+            self._run(lambda request: httpx.Response(502), max_retries=1)
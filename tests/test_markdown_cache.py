@@ -5,6 +5,8 @@ import json
 from datetime import datetime, timedelta
 from pathlib import Path
 import time
+import zlib
+from unittest.mock import patch
 
 
 def test_markdown_cache_put_get_clear(tmp_path):
@@ -41,6 +43,20 @@ def test_markdown_cache_cleanup_expired(tmp_path):
     assert cache.cleanup_expired() > 0
 
 
+def test_markdown_cache_cleanup_skips_fresh_meta_files(tmp_path):
+    """Test metadata modified within max_age is not parsed by cleanup"""
+    dummy_pdf = tmp_path / "fresh.pdf"
+    dummy_pdf.write_bytes(b"data")
+    cache = MarkdownCache(cache_dir=str(tmp_path))
+    cache.put(str(dummy_pdf), "foo")
+
+    with patch("rubot.markdown_cache.jsonutil.loads") as mock_loads:
+        assert cache.cleanup_expired() == 0
+
+    mock_loads.assert_not_called()
+    assert cache.get(str(dummy_pdf)) == "foo"
+
+
 def test_markdown_cache_init_with_cache_root(tmp_path):
     """Test initializing MarkdownCache with a cache_root parameter"""
     cache_root = str(tmp_path)
@@ -113,6 +129,8 @@ def test_markdown_cache_corrupt_metadata(tmp_path):
     _, meta_path = cache._get_cache_paths(key)
     with open(meta_path, "w") as f:
         f.write("{ invalid json }")
+    # Age the file so cleanup_expired does not skip it as fresh
+    os.utime(meta_path, (0, 0))
 
     # get() should return None for corrupt metadata
     assert cache.get(str(dummy_pdf)) is None
@@ -127,23 +145,39 @@ def test_markdown_cache_get_cache_info(tmp_path):
     """Test get_cache_info() with multiple entries"""
     cache = MarkdownCache(cache_dir=str(tmp_path))
 
-    # Create multiple dummy PDFs and larger content to ensure total_size_mb > 0
     for i in range(3):
         pdf_path = tmp_path / f"test{i}.pdf"
         pdf_path.write_bytes(f"content {i}".encode())
-        # Write a larger amount of markdown content to ensure size is > 0 MB
-        large_content = f"markdown content {i}\n" * 1000
-        cache.put(str(pdf_path), large_content)
+        cache.put(str(pdf_path), f"markdown content {i}\n" * 1000)
 
     info = cache.get_cache_info()
 
     assert info["content_files"] == 3
     assert info["meta_files"] == 3
+    # Content may be zstd-compressed, so only the total is checked
     assert info["total_size_bytes"] > 0
-    assert info["total_size_mb"] > 0
+    assert info["total_size_mb"] == round(info["total_size_bytes"] / (1024 * 1024), 2)
     assert info["cache_dir"] == str(tmp_path)
 
 
+def test_markdown_cache_corrupt_content(tmp_path):
+    """Test a truncated content file is treated as a miss and removed"""
+    dummy_pdf = tmp_path / "corrupt_content.pdf"
+    dummy_pdf.write_bytes(b"test data")
+
+    cache = MarkdownCache(cache_dir=str(tmp_path / "cache"))
+    key = cache.put(str(dummy_pdf), "markdown content\n" * 100)
+    content_path, meta_path = cache._get_cache_paths(key)
+    compressed_path = cache._get_compressed_path(key)
+    stored = compressed_path if compressed_path.exists() else content_path
+    # Cut the file mid-way, for plain markdown through a multi-byte character
+    stored.write_bytes(stored.read_bytes()[:10] + "\u00e4".encode()[:1])
+
+    assert cache.get(str(dummy_pdf)) is None
+    assert not stored.exists()
+    assert not meta_path.exists()
+
+
 def test_markdown_cache_missing_metadata(tmp_path):
     """Test behavior when metadata file is missing"""
     dummy_pdf = tmp_path / "missing_meta.pdf"
@@ -159,3 +193,92 @@ def test_markdown_cache_missing_metadata(tmp_path):
 
     # get() should return None when metadata is missing
     assert cache.get(str(dummy_pdf)) is None
+
+
+def test_markdown_cache_key_is_content_hash(tmp_path):
+    """Test cache key is a BLAKE2b digest of the PDF content"""
+    import hashlib
+
+    pdf_a = tmp_path / "a.pdf"
+    pdf_b = tmp_path / "b.pdf"
+    pdf_a.write_bytes(b"same content")
+    pdf_b.write_bytes(b"same content")
+    cache = MarkdownCache(cache_dir=str(tmp_path / "cache"))
+
+    key = cache._get_cache_key(str(pdf_a))
+    assert key == hashlib.blake2b(b"same content", digest_size=16).hexdigest()
+    assert cache._get_cache_key(str(pdf_b)) == key
+
+
+def test_markdown_cache_info_counts(tmp_path):
+    """Test get_cache_info counts only cache files"""
+    pdf = tmp_path / "a.pdf"
+    pdf.write_bytes(b"pdf")
+    cache = MarkdownCache(cache_dir=str(tmp_path / "cache"))
+    with patch("rubot.markdown_cache._ZSTD_AVAILABLE", False):
+        cache.put(str(pdf), "12345")
+    (cache.cache_dir / "unrelated.txt").write_text("ignored")
+
+    info = cache.get_cache_info()
+    assert info["content_files"] == 1
+    assert info["meta_files"] == 1
+    assert info["total_size_bytes"] == 5
+
+    cache.clear()
+    assert [p.name for p in cache.cache_dir.iterdir()] == ["unrelated.txt"]
+
+
+@pytest.fixture
+def fake_zstd():
+    """Route the zstd hooks through zlib so the compressed path is exercised"""
+    with patch("rubot.markdown_cache._ZSTD_AVAILABLE", True), patch(
+        "rubot.markdown_cache._zstd_compress", zlib.compress, create=True
+    ), patch("rubot.markdown_cache._zstd_decompress", zlib.decompress, create=True):
+        yield
+
+
+def test_markdown_cache_stores_compressed(tmp_path, fake_zstd):
+    """Test markdown is stored as .md.zst when zstd is available"""
+    pdf = tmp_path / "a.pdf"
+    pdf.write_bytes(b"pdf")
+    cache = MarkdownCache(cache_dir=str(tmp_path / "cache"))
+
+    key = cache.put(str(pdf), "# Title\n\nÄrger " * 100)
+
+    content_path, _ = cache._get_cache_paths(key)
+    assert not content_path.exists()
+    assert cache._get_compressed_path(key).exists()
+    assert cache.get(str(pdf)) == "# Title\n\nÄrger " * 100
+    assert cache.get_cache_info()["content_files"] == 1
+
+    cache.clear()
+    assert list(cache.cache_dir.iterdir()) == []
+
+
+def test_markdown_cache_reads_plain_entries(tmp_path, fake_zstd):
+    """Test entries written without zstd are still readable"""
+    pdf = tmp_path / "a.pdf"
+    pdf.write_bytes(b"pdf")
+    cache = MarkdownCache(cache_dir=str(tmp_path / "cache"))
+    with patch("rubot.markdown_cache._ZSTD_AVAILABLE", False):
+        key = cache.put(str(pdf), "plain markdown")
+
+    assert cache._get_cache_paths(key)[0].exists()
+    assert cache.get(str(pdf)) == "plain markdown"
+
+
+def test_markdown_cache_interrupted_put_is_a_miss(tmp_path):
+    """Test a put that fails before writing metadata is not served"""
+    pdf = tmp_path / "a.pdf"
+    pdf.write_bytes(b"pdf")
+    cache = MarkdownCache(cache_dir=str(tmp_path / "cache"))
+
+    with patch(
+        "rubot.markdown_cache.jsonutil.dumps_bytes",
+        side_effect=KeyboardInterrupt,
+    ):
+        with pytest.raises(KeyboardInterrupt):
+            cache.put(str(pdf), "partial")
+
+    assert cache.get(str(pdf)) is None
+    assert not any(p.name.endswith(".tmp") for p in cache.cache_dir.iterdir())
@@ -33,6 +33,18 @@ class TestModels:
         assert ann.date == "2024-01-15"
         assert ann.location == "Munich"
 
+    @pytest.mark.parametrize(
+        "instance",
+        [
+            Announcement("t", "d", "c"),
+            Event("t"),
+            ImportantDate("d", "2024-01-15"),
+        ],
+    )
+    def test_models_use_slots(self, instance):
+        """Test model instances carry no per-instance __dict__"""
+        assert not hasattr(instance, "__dict__")
+
     def test_announcement_to_dict(self):
         """Test Announcement to_dict method"""
         ann = Announcement(title="Test", description="Desc", category="cat")
@@ -230,6 +242,22 @@ class TestModels:
         assert parsed["source_date"] == "2024-01-15"
         assert parsed["model_used"] == "test-model"
 
+    def test_rathaus_umschau_analysis_to_json_keeps_umlauts(self):
+        """Test to_json output matches stdlib formatting with non-ASCII text"""
+        analysis = RathausUmschauAnalysis(
+            summary="Bürgerversammlung in Schwabing-Süd",
+            announcements=[Announcement("Straßensperrung", "Desc", "Verkehr")],
+            events=[],
+            important_dates=[],
+            processing_date="2024-01-15T10:00:00",
+            source_date="2024-01-15",
+            model_used="test-model",
+        )
+
+        assert analysis.to_json() == json.dumps(
+            analysis.to_dict(), indent=2, ensure_ascii=False
+        )
+
     def test_rathaus_umschau_analysis_to_json_with_indent(self):
         """Test RathausUmschauAnalysis to_json method with custom indent"""
         analysis = RathausUmschauAnalysis(
@@ -328,6 +356,33 @@ class TestModels:
         assert len(analysis.events) == 0
         assert len(analysis.important_dates) == 0
 
+    def test_from_llm_response_prose_content_not_parsed(self):
+        """Test content that cannot be a JSON object skips the parser"""
+        openrouter_response = {
+            "choices": [{"message": {"content": "  Keine Meldungen heute"}}]
+        }
+
+        with patch("rubot.models.jsonutil.loads") as mock_loads:
+            analysis = RathausUmschauAnalysis.from_llm_response(
+                openrouter_response, "2024-01-15", "test-model"
+            )
+
+        mock_loads.assert_not_called()
+        assert analysis.summary == "  Keine Meldungen heute"
+
+    def test_from_llm_response_malformed_object(self):
+        """Test content that starts like an object but is invalid JSON"""
+        openrouter_response = {
+            "choices": [{"message": {"content": '{"summary": "cut off'}}]
+        }
+
+        analysis = RathausUmschauAnalysis.from_llm_response(
+            openrouter_response, "2024-01-15", "test-model"
+        )
+
+        assert analysis.summary == '{"summary": "cut off'
+        assert analysis.announcements == []
+
     def test_from_llm_response_content_not_dict(self):
         """Test creating analysis from LLM response where JSON content is not a dict"""
         # Create OpenRouter format response where content is JSON array, not object
@@ -363,6 +418,23 @@ class TestModels:
         assert len(analysis.events) == 0
         assert len(analysis.important_dates) == 0
 
+    def test_from_llm_response_parsed_dict(self):
+        """Test an already parsed OpenRouter response is used as-is"""
+        content_data = {"summary": "Test summary", "events": [{"title": "E"}]}
+        openrouter_response = {
+            "choices": [{"message": {"content": json.dumps(content_data)}}]
+        }
+
+        with patch("rubot.models.jsonutil.loads", wraps=json.loads) as mock_loads:
+            analysis = RathausUmschauAnalysis.from_llm_response(
+                openrouter_response, "2024-01-15", "test-model"
+            )
+
+        # Only the inner content is parsed
+        mock_loads.assert_called_once_with(json.dumps(content_data))
+        assert analysis.summary == "Test summary"
+        assert analysis.events[0].title == "E"
+
     def test_from_llm_response_missing_fields(self):
         """Test creating analysis from LLM response with missing fields"""
         # Create content with missing fields
@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+from rubot.response_cache import ResponseCache
+
+
+def _key(content="markdown"):
+    return ResponseCache.make_key("test/model", 0.1, 4000, "prompt", content)
+
+
+def test_response_cache_put_get_clear(tmp_path):
+    cache = ResponseCache(cache_dir=str(tmp_path))
+
+    cache.put(_key(), '{"choices": []}', "test/model")
+    assert cache.get(_key()) == '{"choices": []}'
+    info = cache.get_cache_info()
+    assert info["content_files"] == 1
+    assert info["meta_files"] == 1
+
+    cache.clear()
+    assert cache.get(_key()) is None
+
+
+def test_response_cache_key_covers_request():
+    """Test every request parameter changes the cache key"""
+    base = _key()
+    assert _key("other markdown") != base
+    assert ResponseCache.make_key("x/model", 0.1, 4000, "prompt", "markdown") != base
+    assert ResponseCache.make_key("test/model", 0.2, 4000, "prompt", "markdown") != base
+    assert ResponseCache.make_key("test/model", 0.1, 100, "prompt", "markdown") != base
+    assert ResponseCache.make_key("test/model", 0.1, 4000, "other", "markdown") != base
+
+
+def test_response_cache_get_expired(tmp_path):
+    cache = ResponseCache(cache_dir=str(tmp_path), max_age_hours=0)
+    cache.put(_key(), "{}", "test/model")
+
+    content_path, meta_path = cache._get_cache_paths(_key())
+    meta = json.loads(meta_path.read_text())
+    meta["cached_at"] = "2000-01-01T00:00:00"
+    meta_path.write_text(json.dumps(meta))
+
+    assert cache.get(_key()) is None
+    assert not content_path.exists()
+    assert not meta_path.exists()
+
+
+def test_response_cache_cleanup_expired(tmp_path):
+    cache = ResponseCache(cache_dir=str(tmp_path), max_age_hours=0)
+    cache.put(_key(), "{}", "test/model")
+
+    _, meta_path = cache._get_cache_paths(_key())
+    meta = json.loads(meta_path.read_text())
+    meta["cached_at"] = "2000-01-01T00:00:00"
+    meta_path.write_text(json.dumps(meta))
+
+    assert cache.cleanup_expired() == 2
+    assert cache.get_cache_info()["content_files"] == 0
+
+
+@pytest.mark.parametrize(
+    "damage",
+    [
+        lambda content, meta: meta.write_text("{ invalid json }"),
+        lambda content, meta: content.write_bytes(b"\xff\xfe"),
+        lambda content, meta: meta.write_text('{"model": "test/model"}'),
+    ],
+    ids=["corrupt_meta", "invalid_utf8", "missing_timestamp"],
+)
+def test_response_cache_get_damaged_entry(tmp_path, damage):
+    """Test a damaged entry is treated as a miss and removed"""
+    cache = ResponseCache(cache_dir=str(tmp_path))
+    cache.put(_key(), "{}", "test/model")
+    content_path, meta_path = cache._get_cache_paths(_key())
+
+    damage(content_path, meta_path)
+
+    assert cache.get(_key()) is None
+    assert not content_path.exists()
+    assert not meta_path.exists()
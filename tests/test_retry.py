@@ -119,6 +119,43 @@ class TestRetry:
         result = exponential_backoff(2, 0.5)
         assert result == 2.0  # 0.5 * 2^2 = 2.0
 
+    @patch("time.sleep")
+    def test_retry_injects_one_session_for_all_attempts(self, mock_sleep):
+        """Test session_factory is called once and reused across retries"""
+        factory = MagicMock(side_effect=lambda: object())
+        seen = []
+
+        @retry_on_failure(max_retries=2, session_factory=factory)
+        def fetch(url, session=None):
+            seen.append(session)
+            if len(seen) < 3:
+                raise requests.RequestException("Temporary error")
+            return url
+
+        assert fetch("https://example.com") == "https://example.com"
+        factory.assert_called_once()
+        assert seen[0] is not None
+        assert seen[0] is seen[1] is seen[2]
+
+    def test_retry_keeps_caller_session(self):
+        """Test an explicit session is not replaced by the factory"""
+        factory = MagicMock()
+        session = object()
+
+        @retry_on_failure(session_factory=factory)
+        def fetch(session=None):
+            return session
+
+        assert fetch(session=session) is session
+        factory.assert_not_called()
+
+    @patch("rubot.retry.random.random", return_value=0.25)
+    def test_exponential_backoff_full_jitter(self, mock_random):
+        """Test jitter scales the capped delay by a random factor"""
+
+        assert exponential_backoff(2, 1.0, jitter=True) == 1.0
+        assert exponential_backoff(10, 1.0, max_delay=8.0, jitter=True) == 2.0
+
     @patch("time.sleep")  # Patch sleep to avoid actual waiting
     def test_retry_with_multiple_exception_types(self, mock_sleep):
         """Test retry with multiple exception types"""
@@ -62,13 +62,11 @@ def test_models_creation():
     assert date.description == "Deadline"
 
 
-def test_cli_help():
+def test_cli_help(cli_runner):
     """Test CLI help works"""
-    from click.testing import CliRunner
     from rubot.cli import main
 
-    runner = CliRunner()
-    result = runner.invoke(main, ["--help"])
+    result = cli_runner.invoke(main, ["--help"])
     assert result.exit_code == 0
     assert (
         "CLI tool for downloading and processing Rathaus-Umschau PDFs"
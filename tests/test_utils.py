@@ -4,11 +4,14 @@ Tests for utils module
 
 import pytest
 from unittest.mock import patch, mock_open, MagicMock
-import os
-import tempfile
 from pathlib import Path
 
-from rubot.utils import validate_date, load_env_config, ensure_directory
+from rubot.utils import (
+    validate_date,
+    load_env_config,
+    ensure_directory,
+    atomic_write_bytes,
+)
 
 
 class TestUtils:
@@ -30,6 +33,9 @@ class TestUtils:
         with pytest.raises(ValueError, match="Invalid date format"):
             validate_date("2024/01/15")
 
+        with pytest.raises(ValueError, match="Invalid date format"):
+            validate_date("2024-01-15\n")
+
     def test_validate_date_invalid_date(self):
         """Test invalid date values"""
         with pytest.raises(ValueError, match="Invalid date"):
@@ -41,7 +47,6 @@ class TestUtils:
         with pytest.raises(ValueError, match="Invalid date"):
             validate_date("2023-02-29")  # Not a leap year
 
-    @patch("pathlib.Path.exists")
     @patch("rubot.utils.load_dotenv")
     @patch.dict(
         "os.environ",
@@ -52,16 +57,12 @@ class TestUtils:
             "DEFAULT_SYSTEM_PROMPT": "Test prompt",
         },
     )
-    def test_load_env_config_with_env_file(
-        self, mock_load_dotenv, mock_exists
-    ):
+    def test_load_env_config_with_env_file(self, mock_load_dotenv):
         """Test loading config from .env file"""
-        mock_exists.return_value = True
-
         config = load_env_config()
 
-        # Check that load_dotenv was called
-        mock_load_dotenv.assert_called_once()
+        # load_dotenv is called directly, without a separate exists() probe
+        mock_load_dotenv.assert_called_once_with(".env", override=False)
 
         # Check config values from env vars
         assert config["OPENROUTER_API_KEY"] == "test-key"
@@ -69,25 +70,19 @@ class TestUtils:
         assert config["DEFAULT_PROMPT_FILE"] == "prompt.txt"
         assert config["DEFAULT_SYSTEM_PROMPT"] == "Test prompt"
 
-    @patch("pathlib.Path.exists")
-    @patch("rubot.utils.load_dotenv")
     @patch.dict("os.environ", {}, clear=True)
-    def test_load_env_config_empty_env(self, mock_load_dotenv, mock_exists):
-        """Test loading config with empty environment"""
-        mock_exists.return_value = False
+    def test_load_env_config_empty_env(self, tmp_path, monkeypatch):
+        """Test loading config with empty environment and no .env file"""
+        monkeypatch.chdir(tmp_path)
 
         config = load_env_config()
 
-        # load_dotenv should not be called if .env doesn't exist
-        mock_load_dotenv.assert_not_called()
-
         # Check empty values
         assert config["OPENROUTER_API_KEY"] == ""
         assert config["DEFAULT_MODEL"] == ""
         assert config["DEFAULT_PROMPT_FILE"] == ""
         assert config["DEFAULT_SYSTEM_PROMPT"] == ""
 
-    @patch("pathlib.Path.exists")
     @patch("rubot.utils.load_dotenv")
     @patch.dict(
         "os.environ",
@@ -99,10 +94,8 @@ class TestUtils:
         },
         clear=True,
     )  # Use clear=True to ensure no other environment variables interfere
-    def test_load_env_config_partial_env(self, mock_load_dotenv, mock_exists):
+    def test_load_env_config_partial_env(self, mock_load_dotenv):
         """Test loading config with partial environment variables"""
-        mock_exists.return_value = True
-
         config = load_env_config()
 
         # Check partial values
@@ -111,41 +104,70 @@ class TestUtils:
         assert config["DEFAULT_PROMPT_FILE"] == ""
         assert config["DEFAULT_SYSTEM_PROMPT"] == ""
 
-    def test_ensure_directory_new(self):
+    @patch("rubot.utils.load_dotenv")
+    @patch.dict("os.environ", {"DEFAULT_MODEL": "test/model"}, clear=True)
+    def test_load_env_config_cached(self, mock_load_dotenv):
+        """Test .env is read once and callers get independent copies"""
+        config = load_env_config()
+        config["DEFAULT_MODEL"] = "changed"
+
+        assert load_env_config()["DEFAULT_MODEL"] == "test/model"
+        mock_load_dotenv.assert_called_once()
+
+    def test_ensure_directory_new(self, tmp_path):
         """Test ensuring a new directory exists"""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            new_dir = os.path.join(tmp_dir, "new_directory")
+        new_dir = tmp_path / "new_directory"
 
-            # Directory should not exist yet
-            assert not os.path.exists(new_dir)
+        # Directory should not exist yet
+        assert not new_dir.exists()
 
-            # Create directory
-            ensure_directory(new_dir)
+        # Create directory
+        ensure_directory(str(new_dir))
 
-            # Directory should now exist
-            assert os.path.isdir(new_dir)
+        # Directory should now exist
+        assert new_dir.is_dir()
 
-    def test_ensure_directory_existing(self):
+    def test_ensure_directory_existing(self, tmp_path):
         """Test ensuring an existing directory"""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            # Directory already exists
-            ensure_directory(tmp_dir)
+        # Directory already exists
+        ensure_directory(str(tmp_path))
 
-            # Should not raise an exception
-            assert os.path.isdir(tmp_dir)
+        # Should not raise an exception
+        assert tmp_path.is_dir()
 
-    def test_ensure_directory_nested(self):
+    def test_ensure_directory_nested(self, tmp_path):
         """Test ensuring a nested directory structure"""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            nested_dir = os.path.join(tmp_dir, "level1", "level2", "level3")
+        nested_dir = tmp_path / "level1" / "level2" / "level3"
+
+        # Directory should not exist yet
+        assert not nested_dir.exists()
+
+        # Create nested directories
+        ensure_directory(str(nested_dir))
+
+        # All directories should now exist
+        assert nested_dir.is_dir()
+        assert (tmp_path / "level1").is_dir()
+        assert (tmp_path / "level1" / "level2").is_dir()
+
+    def test_atomic_write_bytes(self, tmp_path):
+        """Test atomic write replaces the file and leaves no temp file"""
+        target = tmp_path / "data.bin"
+        target.write_bytes(b"old")
+
+        atomic_write_bytes(target, b"new")
+
+        assert target.read_bytes() == b"new"
+        assert [p.name for p in tmp_path.iterdir()] == ["data.bin"]
 
-            # Directory should not exist yet
-            assert not os.path.exists(nested_dir)
+    def test_atomic_write_bytes_failure_keeps_original(self, tmp_path):
+        """Test a failed write keeps the old content and cleans up"""
+        target = tmp_path / "data.bin"
+        target.write_bytes(b"old")
 
-            # Create nested directories
-            ensure_directory(nested_dir)
+        with patch("rubot.utils.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError, match="disk full"):
+                atomic_write_bytes(target, b"new")
 
-            # All directories should now exist
-            assert os.path.isdir(nested_dir)
-            assert os.path.isdir(os.path.join(tmp_dir, "level1"))
-            assert os.path.isdir(os.path.join(tmp_dir, "level1", "level2"))
+        assert target.read_bytes() == b"old"
+        assert [p.name for p in tmp_path.iterdir()] == ["data.bin"]